@@ -0,0 +1,250 @@
+"""
+In-process cache of serialized API responses.
+
+Each cached payload keeps its JSON bytes together with lazily computed
+Brotli/gzip variants, so a payload is serialized and compressed at most
+once per encoding instead of on every request. MessagePack/CBOR bodies are
+payloads of their own, kept on the JSON payload they were converted from so
+they are dropped with it. Misses go through a single-flight layer so a burst
+of identical requests does the work once.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from app.formats import convert_json, negotiate_format
+from app.middleware.compression import MINIMUM_SIZE, compress, negotiate_encoding
+
+
+class CachedPayload:
+    """Serialized response body plus its compressed variants, other formats and extra headers."""
+
+    __slots__ = ("body", "media_type", "headers", "formats", "_encoded", "_lock")
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str = "application/json",
+        headers: Optional[dict[str, str]] = None,
+    ):
+        self.body = body
+        self.media_type = media_type
+        self.headers = headers or {}
+        # MessagePack/CBOR conversions of this body, by media type
+        self.formats: dict[str, CachedPayload] = {}
+        self._encoded: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        """
+        Return the body compressed with ``encoding``, compressing on first use.
+
+        Args:
+            encoding: ``"br"`` or ``"gzip"``
+
+        Returns:
+            Compressed body bytes
+        """
+        variant = self._encoded.get(encoding)
+        if variant is None:
+            with self._lock:
+                variant = self._encoded.get(encoding)
+                if variant is None:
+                    variant = compress(self.body, encoding)
+                    self._encoded[encoding] = variant
+        return variant
+
+    def has_encoding(self, encoding: str) -> bool:
+        """Whether the ``encoding`` variant has already been computed."""
+        return encoding in self._encoded
+
+
+class ResponseCache:
+    """Thread-safe mapping of cache keys to ``CachedPayload`` objects."""
+
+    def __init__(self):
+        self._payloads: dict[str, CachedPayload] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedPayload]:
+        """Return the cached payload for ``key``, if any."""
+        return self._payloads.get(key)
+
+    def get_or_create(
+        self,
+        key: str,
+        factory: Callable[[], bytes],
+        media_type: str = "application/json",
+        headers: Optional[dict[str, str]] = None,
+    ) -> CachedPayload:
+        """
+        Return the payload for ``key``, building it with ``factory`` on a miss.
+
+        Args:
+            key: Cache key, e.g. ``"projects:list"``
+            factory: Callable producing the serialized body
+            media_type: Media type of the body
+            headers: Extra response headers stored with the body (e.g. ``Link``)
+
+        Returns:
+            The cached payload
+        """
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = CachedPayload(factory(), media_type, headers)
+            with self._lock:
+                payload = self._payloads.setdefault(key, payload)
+        return payload
+
+    def clear(self) -> None:
+        """Drop every cached payload (e.g. after the catalog is reseeded)."""
+        with self._lock:
+            self._payloads.clear()
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical computations into one.
+
+    The first caller for a key runs the function in the threadpool; callers
+    arriving while it is in flight await the same task and share its result
+    (or exception). A caller that is cancelled, e.g. by a client disconnect,
+    does not cancel the shared computation.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` once for all concurrent callers using ``key``.
+
+        Args:
+            key: Identity of the computation, e.g. a response cache key
+            func: Blocking callable, run off the event loop
+            *args: Positional arguments for ``func``
+
+        Returns:
+            The value returned by ``func``
+        """
+        return await self._share(key, lambda: run_in_threadpool(func, *args))
+
+    async def do_async(self, key: str, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Like ``do``, for a coroutine function awaited on the event loop.
+
+        Use it when ``func`` waits on its own executor, so waiting takes no
+        threadpool thread.
+
+        Args:
+            key: Identity of the computation
+            func: Coroutine function
+            *args: Positional arguments for ``func``
+
+        Returns:
+            The value returned by ``func``
+        """
+        return await self._share(key, lambda: func(*args))
+
+    async def _share(self, key: str, start: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(start())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+# Process-wide cache shared by the project endpoints
+response_cache = ResponseCache()
+
+# Coalesces concurrent cache misses, keyed like ``response_cache``
+single_flight = SingleFlight()
+
+
+async def payload_response(payload: CachedPayload, request: Request) -> Response:
+    """
+    Build a response for ``payload`` using the client's preferred encoding.
+
+    The compressed variant is reused when already cached; otherwise it is
+    computed once off the event loop and stored on the payload.
+
+    Args:
+        payload: Cached serialized payload
+        request: Incoming request (for ``Accept-Encoding``)
+
+    Returns:
+        Response with ``Content-Encoding`` and ``Vary`` headers set as needed
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    encoding = None
+    if len(payload.body) >= MINIMUM_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    if encoding is None:
+        body = payload.body
+    elif payload.has_encoding(encoding):
+        body = payload.encoded(encoding)
+    else:
+        body = await run_in_threadpool(payload.encoded, encoding)
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=payload.media_type, headers=headers)
+
+
+def convert_payload(payload: CachedPayload, media_type: str) -> CachedPayload:
+    """
+    Convert a JSON payload to ``media_type`` once, storing the result on the payload.
+
+    Keeping conversions on their source means a cache clear or snapshot swap
+    that replaces the JSON payload replaces its other formats too.
+    """
+    converted = payload.formats.get(media_type)
+    if converted is None:
+        converted = CachedPayload(convert_json(payload.body, media_type), media_type)
+        converted = payload.formats.setdefault(media_type, converted)
+    return converted
+
+
+async def negotiated_response(key: str, payload: CachedPayload, request: Request) -> Response:
+    """
+    Build a response for ``payload`` in the format the client's ``Accept`` prefers.
+
+    Non-JSON formats are converted from the JSON body once and stored on the
+    JSON payload, with compressed variants like any other payload. Headers
+    stored with the JSON payload are sent whatever the format.
+
+    Args:
+        key: Cache key of the JSON payload
+        payload: JSON payload (cached or from the snapshot)
+        request: Incoming request (for ``Accept`` and ``Accept-Encoding``)
+
+    Returns:
+        Response with ``Vary: Accept, Accept-Encoding``
+    """
+    headers = payload.headers
+    media_type = negotiate_format(request.headers.get("accept"))
+    if media_type != payload.media_type:
+        converted = payload.formats.get(media_type)
+        if converted is None:
+            # Keyed by the source object too, so a swapped-in payload never
+            # joins a conversion of the one it replaced
+            converted = await single_flight.do(
+                f"{key}@{media_type}#{id(payload)}", convert_payload, payload, media_type
+            )
+        payload = converted
+    response = await payload_response(payload, request)
+    response.headers["Vary"] = "Accept, Accept-Encoding"
+    response.headers.update(headers)
+    return response
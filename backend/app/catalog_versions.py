@@ -0,0 +1,155 @@
+"""
+Catalog versioning for delta sync.
+
+The seeder hashes every project's response document and compares it with
+the ``project_versions`` rows of the database being replaced. New or
+changed slugs are stamped with the next catalog version, removed slugs
+become tombstones at that version, and unchanged slugs keep theirs. The
+catalog version is the highest version stamped, so a reseed with no content
+changes leaves it where it was.
+"""
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.models import Project, ProjectVersion
+from app.schemas import dump_project_json
+
+
+@dataclass(frozen=True, slots=True)
+class VersionEntry:
+    """Versioning state of one slug."""
+
+    content_hash: str
+    version: int
+    deleted: bool = False
+
+
+def project_content_hash(project: Project) -> str:
+    """
+    Hash a project's response document independently of collection order.
+
+    Args:
+        project: Project with its technologies, roles and images loaded
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    document = json.loads(dump_project_json(project))
+    document["technologies"].sort(key=lambda item: item["id"])
+    document["roles"].sort(key=lambda item: item["id"])
+    canonical = json.dumps(document, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def read_version_state(path: str) -> dict[str, VersionEntry]:
+    """
+    Read the ``project_versions`` rows of an existing database file.
+
+    Args:
+        path: SQLite file, typically the live database about to be replaced
+
+    Returns:
+        Entries keyed by slug; empty if the file or table does not exist
+    """
+    try:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    except sqlite3.OperationalError:
+        return {}
+    try:
+        rows = connection.execute(
+            "SELECT slug, content_hash, version, deleted FROM project_versions"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        connection.close()
+    return {
+        slug: VersionEntry(content_hash, version, bool(deleted))
+        for slug, content_hash, version, deleted in rows
+    }
+
+
+def stamp_catalog_versions(db: Session, previous: dict[str, VersionEntry]) -> int:
+    """
+    Write ``project_versions`` for the projects in ``db``.
+
+    Args:
+        db: Session bound to the freshly built catalog (committed on success)
+        previous: Versioning state of the catalog being replaced
+
+    Returns:
+        The new catalog version
+    """
+    projects = db.scalars(
+        select(Project).options(
+            selectinload(Project.technologies),
+            selectinload(Project.roles),
+            selectinload(Project.images),
+        )
+    )
+    hashes = {project.slug: project_content_hash(project) for project in projects}
+
+    current_version = max((entry.version for entry in previous.values()), default=0)
+    next_version = current_version + 1
+    entries = {}
+    for slug, content_hash in hashes.items():
+        old = previous.get(slug)
+        if old is not None and not old.deleted and old.content_hash == content_hash:
+            entries[slug] = old
+        else:
+            entries[slug] = VersionEntry(content_hash, next_version)
+    for slug, old in previous.items():
+        if slug in hashes:
+            continue
+        # Keep earlier tombstones so clients further behind still learn of them
+        entries[slug] = old if old.deleted else VersionEntry(old.content_hash, next_version, True)
+
+    db.execute(delete(ProjectVersion))
+    if entries:
+        db.execute(
+            insert(ProjectVersion),
+            [
+                {
+                    "slug": slug,
+                    "content_hash": entry.content_hash,
+                    "version": entry.version,
+                    "deleted": entry.deleted,
+                }
+                for slug, entry in entries.items()
+            ],
+        )
+    db.commit()
+    return max((entry.version for entry in entries.values()), default=0)
+
+
+def catalog_version(db: Session) -> int:
+    """Return the current catalog version (0 for an unversioned catalog)."""
+    return db.scalar(select(func.coalesce(func.max(ProjectVersion.version), 0)))
+
+
+def get_changes(db: Session, since: int) -> tuple[int, list[str], list[str]]:
+    """
+    List the slugs upserted and deleted after catalog version ``since``.
+
+    Args:
+        db: Database session
+        since: Catalog version the client last synced to
+
+    Returns:
+        ``(version, upserted, deleted)`` with slugs ordered by version
+    """
+    rows = db.execute(
+        select(ProjectVersion.slug, ProjectVersion.version, ProjectVersion.deleted)
+        .where(ProjectVersion.version > since)
+        .order_by(ProjectVersion.version, ProjectVersion.slug)
+    ).all()
+    version = rows[-1].version if rows else catalog_version(db)
+    upserted = [row.slug for row in rows if not row.deleted]
+    deleted = [row.slug for row in rows if row.deleted]
+    return version, upserted, deleted
@@ -1,13 +1,137 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+# SQLite database URL (override with DATABASE_URL, e.g. to point at a benchmark catalog)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./portfolio.db")
+
+# Serve from a per-worker in-memory copy of the database file
+DATABASE_IN_MEMORY = os.getenv("DATABASE_IN_MEMORY", "").lower() in ("1", "true", "yes")
+
+# Minimum seconds between checks of the source file for new data
+DATABASE_REFRESH_INTERVAL = float(os.getenv("DATABASE_REFRESH_INTERVAL", "1.0"))
+
+
+# Path of the SQLite file behind the URL (None or ":memory:" for in-memory URLs)
+DATABASE_PATH = make_url(SQLALCHEMY_DATABASE_URL).database
+
+
+def file_identity(path: Optional[str]) -> Optional[tuple[int, int]]:
+    """
+    Return ``(st_dev, st_ino)`` for ``path``, which changes when a file is renamed over it.
+
+    Args:
+        path: File path, or None
+
+    Returns:
+        Device and inode numbers, or None if the file does not exist
+    """
+    if not path or path == ":memory:":
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class InMemoryReplica:
+    """
+    Shared-cache ``:memory:`` copy of an on-disk SQLite database.
+
+    The file is copied with the sqlite3 backup API. A persistent read-only
+    connection to the file watches ``PRAGMA data_version``, which changes
+    whenever another connection commits, and the file's inode is compared to
+    catch a reseed that renames a new file into place. Each reload goes into
+    a new in-memory database, so connections already checked out keep
+    reading a consistent snapshot until released.
+    """
+
+    _names = itertools.count()
+
+    def __init__(self, source_path: str):
+        self.source_path = source_path
+        self.uri: Optional[str] = None
+        self._pid: Optional[int] = None
+        self._anchor: Optional[sqlite3.Connection] = None
+        self._source: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._identity: Optional[tuple[int, int]] = None
+        self._lock = threading.RLock()
+
+    def load(self) -> None:
+        """Copy the source file into a fresh in-memory database and switch to it."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Connections inherited across fork must not be reused
+                self._anchor = self._source = None
+                self._pid = os.getpid()
+            identity = file_identity(self.source_path)
+            if self._source is not None and identity != self._identity:
+                # The file was swapped; the old handle still reads the replaced inode
+                self._source.close()
+                self._source = None
+            if self._source is None:
+                self._source = sqlite3.connect(
+                    f"file:{self.source_path}?mode=ro",
+                    uri=True,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+
+            uri = f"file:portfolio-replica-{self._pid}-{next(self._names)}?mode=memory&cache=shared"
+            anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._source.backup(anchor)
+            self._data_version = self._read_data_version()
+            self._identity = identity
+
+            previous, self._anchor, self.uri = self._anchor, anchor, uri
+            if previous is not None:
+                # Checked-out connections keep the old copy alive until they close
+                previous.close()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection to the current in-memory copy (``create_engine`` creator)."""
+        with self._lock:
+            if self._pid != os.getpid() or self.uri is None:
+                self.load()
+            return sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+
+    def is_stale(self) -> bool:
+        """Whether the source file has committed changes since the last load."""
+        with self._lock:
+            if self._source is None or self._pid != os.getpid():
+                return True
+            if file_identity(self.source_path) != self._identity:
+                return True
+            return self._read_data_version() != self._data_version
+
+    def _read_data_version(self) -> int:
+        return self._source.execute("PRAGMA data_version").fetchone()[0]
 
-# SQLite database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./portfolio.db"
 
-# Create engine with check_same_thread=False for SQLite
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+def create_replica_engine(replica: InMemoryReplica) -> Engine:
+    """Create an engine whose connections all point at ``replica``'s current copy."""
+    return create_engine("sqlite://", creator=replica.connect, poolclass=QueuePool)
+
+
+if DATABASE_IN_MEMORY:
+    replica: Optional[InMemoryReplica] = InMemoryReplica(DATABASE_PATH)
+    engine = create_replica_engine(replica)
+else:
+    replica = None
+    # Create engine with check_same_thread=False for SQLite
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 
 # Create SessionLocal class for database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -15,6 +139,69 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Create Base class for declarative models
 Base = declarative_base()
 
+# Callbacks run after the served data changes (e.g. to drop response caches)
+_refresh_listeners: list[Callable[[], None]] = []
+_refresh_lock = threading.Lock()
+_last_refresh_check = 0.0
+_database_identity = file_identity(DATABASE_PATH)
+_generation = 0
+
+
+def on_database_refresh(callback: Callable[[], None]) -> None:
+    """
+    Register a callback to run whenever the served database is replaced or reloaded.
+
+    Args:
+        callback: Zero-argument callable, e.g. ``response_cache.clear``
+    """
+    _refresh_listeners.append(callback)
+
+
+def database_generation() -> int:
+    """Number of times this process has switched to new database contents."""
+    return _generation
+
+
+def refresh_if_stale() -> bool:
+    """
+    Switch to new database contents if the file was replaced or reloaded.
+
+    A reseed renames a freshly built file over ``DATABASE_PATH``. When its
+    inode changes, the pool is disposed so new sessions open the new file
+    while in-flight sessions finish on the old one; with the in-memory mode
+    the replica is reloaded instead. Checks run at most once per
+    ``DATABASE_REFRESH_INTERVAL`` seconds.
+
+    Returns:
+        True if the process switched to new contents
+    """
+    global _last_refresh_check, _database_identity, _generation
+
+    now = time.monotonic()
+    if now - _last_refresh_check < DATABASE_REFRESH_INTERVAL:
+        return False
+
+    with _refresh_lock:
+        if now - _last_refresh_check < DATABASE_REFRESH_INTERVAL:
+            return False
+        _last_refresh_check = now
+
+        if replica is not None:
+            if not replica.is_stale():
+                return False
+            replica.load()
+        else:
+            identity = file_identity(DATABASE_PATH)
+            if identity == _database_identity:
+                return False
+            _database_identity = identity
+        engine.dispose()
+        _generation += 1
+
+    for callback in _refresh_listeners:
+        callback()
+    return True
+
 
 def get_db():
     """
@@ -23,6 +210,7 @@ def get_db():
     Yields:
         Session: SQLAlchemy database session
     """
+    refresh_if_stale()
     db = SessionLocal()
     try:
         yield db
@@ -30,6 +218,16 @@ def get_db():
         db.close()
 
 
+def refresh_database() -> None:
+    """
+    Dependency for endpoints that answer from caches before opening a session.
+
+    Switches to a reseeded database (dropping cached responses) first, as
+    ``get_db`` does, so a cache hit never serves the previous catalog.
+    """
+    refresh_if_stale()
+
+
 def init_db():
     """Initialize database by creating all tables."""
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,144 @@
+"""
+Server-Sent Events announcing catalog updates.
+
+One watcher task per worker polls for a new database generation (a reseed
+swapped the file in) and reads the catalog version. Subscribers all wait on
+a single shared ``asyncio.Event`` that is replaced on every change, so an
+idle connection costs one suspended task and no per-connection queue. Slow
+clients only ever receive the latest version: nothing accumulates while
+their socket is not draining, which is the only backpressure an
+announce-the-latest-state stream needs.
+"""
+
+import asyncio
+import json
+import os
+from typing import AsyncIterator, Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.catalog_versions import catalog_version
+from app.database import SessionLocal, database_generation, refresh_if_stale
+
+# Seconds between comment lines that keep idle connections (and proxies) alive
+EVENTS_HEARTBEAT_INTERVAL = float(os.getenv("EVENTS_HEARTBEAT_INTERVAL", "15"))
+
+# Seconds between checks for a new catalog generation
+EVENTS_POLL_INTERVAL = float(os.getenv("EVENTS_POLL_INTERVAL", "1.0"))
+
+# Concurrent event streams accepted per worker
+EVENTS_MAX_SUBSCRIBERS = int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "5000"))
+
+# Reconnection delay suggested to clients, in milliseconds
+EVENTS_RETRY_MS = 5000
+
+HEARTBEAT = b": heartbeat\n\n"
+
+
+def read_catalog_version() -> int:
+    """Read the catalog version from the served database."""
+    with SessionLocal() as db:
+        return catalog_version(db)
+
+
+def format_event(version: int, generation: int) -> bytes:
+    """Encode a ``version`` event; the id lets clients resume with ``Last-Event-ID``."""
+    data = json.dumps({"version": version, "generation": generation}, separators=(",", ":"))
+    return f"id: {version}\nevent: version\ndata: {data}\n\n".encode()
+
+
+class CatalogEventBroker:
+    """Fan out catalog version changes to every open event stream in this worker."""
+
+    def __init__(self, read_version: Callable[[], int] = read_catalog_version):
+        self.read_version = read_version
+        self.version: Optional[int] = None
+        self.generation = 0
+        self.subscribers = 0
+        self._changed: Optional[asyncio.Event] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Events and tasks are bound to the loop that created them
+            self._loop, self._watcher = loop, None
+            self._changed = asyncio.Event()
+            self.version = None
+        if self.version is None:
+            self.version = await run_in_threadpool(self.read_version)
+            self.generation = database_generation()
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.ensure_future(self._watch())
+
+    async def _watch(self) -> None:
+        while self.subscribers:
+            await asyncio.sleep(EVENTS_POLL_INTERVAL)
+            await self.poll()
+
+    async def poll(self) -> bool:
+        """
+        Check for a new catalog generation and wake subscribers if it changed.
+
+        Returns:
+            True if a new version was published
+        """
+        await run_in_threadpool(refresh_if_stale)
+        generation = database_generation()
+        if generation == self.generation:
+            return False
+        self.generation = generation
+        version = await run_in_threadpool(self.read_version)
+        if version == self.version:
+            return False
+        self.publish(version)
+        return True
+
+    def is_full(self) -> bool:
+        """Whether this worker already serves ``EVENTS_MAX_SUBSCRIBERS`` streams."""
+        return self.subscribers >= EVENTS_MAX_SUBSCRIBERS
+
+    def publish(self, version: int) -> None:
+        """Record ``version`` and wake every waiting stream."""
+        self.version = version
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def stream(self, last_event_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """
+        Yield SSE frames: the current version, then each change, with heartbeats.
+
+        Args:
+            last_event_id: Version the client last saw (``Last-Event-ID``); the
+                initial event is skipped when it is still current
+
+        Yields:
+            Encoded SSE frames
+        """
+        self.subscribers += 1
+        try:
+            await self._start()
+            yield f"retry: {EVENTS_RETRY_MS}\n\n".encode()
+            sent = last_event_id
+            while True:
+                # Take the event before comparing, so a version published while
+                # suspended in a yield is not missed
+                changed = self._changed
+                if sent != str(self.version):
+                    sent = str(self.version)
+                    yield format_event(self.version, self.generation)
+                    continue
+                try:
+                    await asyncio.wait_for(changed.wait(), EVENTS_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+        finally:
+            self.subscribers -= 1
+            if not self.subscribers and self._watcher is not None:
+                self._watcher.cancel()
+                self._watcher = None
+
+
+# Process-wide broker used by the events endpoint
+catalog_events = CatalogEventBroker()
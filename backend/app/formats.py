@@ -0,0 +1,105 @@
+"""
+Response body formats negotiated from the ``Accept`` header.
+
+Project documents are always rendered as JSON through the response
+schemas; MessagePack and CBOR bodies are converted from those bytes, so
+every format carries exactly the same document. The encoders are imported
+on first use so the API process only loads them when a client asks.
+"""
+
+import json
+from typing import Callable, Optional
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+CBOR = "application/cbor"
+
+# Served formats in order of preference when the client rates several equally
+SUPPORTED_FORMATS = (JSON, MSGPACK, CBOR)
+
+# Accept media types understood for each served format
+FORMAT_ALIASES = {
+    "application/json": JSON,
+    "application/msgpack": MSGPACK,
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.msgpack": MSGPACK,
+    "application/cbor": CBOR,
+}
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """
+    Pick the response format from an ``Accept`` header.
+
+    Exact media types win over ``application/*`` and ``*/*`` at the same
+    quality. JSON is returned when the client accepts none of the formats,
+    so browsers and clients without an ``Accept`` header keep getting JSON.
+
+    Args:
+        accept: Raw header value, e.g. ``"application/msgpack, application/json;q=0.5"``
+
+    Returns:
+        One of ``SUPPORTED_FORMATS``
+    """
+    if not accept:
+        return JSON
+
+    exact: dict[str, float] = {}
+    wildcard = 0.0
+    for item in accept.split(","):
+        media_type, *params = item.split(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in FORMAT_ALIASES:
+            served = FORMAT_ALIASES[media_type]
+            exact[served] = max(exact.get(served, 0.0), quality)
+        elif media_type in ("*/*", "application/*"):
+            wildcard = max(wildcard, quality)
+
+    best, best_rank = JSON, (0.0, False)
+    for served in SUPPORTED_FORMATS:
+        rank = (exact[served], True) if served in exact else (wildcard, False)
+        if rank[0] > 0 and rank > best_rank:
+            best, best_rank = served, rank
+    return best
+
+
+def _encode_msgpack(document) -> bytes:
+    import msgpack
+
+    return msgpack.packb(document, use_bin_type=True)
+
+
+def _encode_cbor(document) -> bytes:
+    import cbor2
+
+    return cbor2.dumps(document)
+
+
+ENCODERS: dict[str, Callable[[object], bytes]] = {
+    MSGPACK: _encode_msgpack,
+    CBOR: _encode_cbor,
+}
+
+
+def convert_json(body: bytes, media_type: str) -> bytes:
+    """
+    Re-encode a JSON response body in another format.
+
+    Args:
+        body: JSON produced by the response schemas
+        media_type: Target format, one of ``SUPPORTED_FORMATS``
+
+    Returns:
+        The same document encoded as ``media_type``
+    """
+    if media_type == JSON:
+        return bytes(body)
+    return ENCODERS[media_type](json.loads(bytes(body)))
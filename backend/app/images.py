@@ -0,0 +1,317 @@
+"""
+On-demand image resizing for ``/images/...?w=&fmt=``.
+
+Requested widths snap to ``ALLOWED_WIDTHS`` so only a handful of variants
+can exist per image. Variants are encoded with Pillow in a process pool
+(never on the event loop), written to a size-capped on-disk LRU cache and
+served from there. Concurrent requests for the same variant share one
+encode through a single-flight layer.
+
+Pillow is imported inside the pool workers only, so the API process does
+not load it.
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import QueryParams
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.cache import SingleFlight
+from app.static import PrecompressedStaticFiles
+
+# Output widths; requests snap up to the next one (or down to the largest)
+ALLOWED_WIDTHS = (320, 640, 960, 1280, 1920)
+
+# Output formats: Pillow encoder name, file suffix and encoder options
+IMAGE_FORMATS = {
+    "webp": ("WEBP", ".webp", {"quality": 80, "method": 4}),
+    "avif": ("AVIF", ".avif", {"quality": 60}),
+    "jpeg": ("JPEG", ".jpg", {"quality": 82, "optimize": True, "progressive": True}),
+    "png": ("PNG", ".png", {"optimize": True}),
+}
+
+# Source files that can be transformed, with the format kept when no fmt is given
+RESIZABLE_SUFFIXES = {".png": "png", ".jpg": "jpeg", ".jpeg": "jpeg", ".webp": "webp"}
+
+# Where variants are cached and how much disk they may use
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", "./cache/images")
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Encoder processes per worker
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+# Variant responses never change for a given URL until the source file does
+VARIANT_CACHE_CONTROL = "public, max-age=86400"
+
+
+def snap_width(requested: int) -> int:
+    """
+    Snap a requested width to the allowlist.
+
+    Args:
+        requested: Width asked for by the client
+
+    Returns:
+        Smallest allowed width at least as wide, or the largest allowed width
+    """
+    for width in ALLOWED_WIDTHS:
+        if width >= requested:
+            return width
+    return ALLOWED_WIDTHS[-1]
+
+
+def render_variant(source: str, destination: str, width: Optional[int], fmt: str) -> None:
+    """
+    Resize and re-encode ``source`` into ``destination`` (runs in a pool process).
+
+    Images are never upscaled. The output is written to a temporary file and
+    renamed, so readers never see a partial variant.
+
+    Args:
+        source: Original image path
+        destination: Variant path inside the cache directory
+        width: Target width, or None to keep the original width
+        fmt: Key of ``IMAGE_FORMATS``
+    """
+    from PIL import Image, ImageOps
+
+    encoder, _, options = IMAGE_FORMATS[fmt]
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if width is not None and width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        if encoder == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        directory = os.path.dirname(destination)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                image.save(f, encoder, **options)
+            os.replace(tmp_path, destination)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class DiskLRUCache:
+    """
+    Size-capped directory of files evicted least-recently-used first.
+
+    Recency is kept in memory and mirrored to file mtimes on every hit, so the
+    order survives restarts. Each worker keeps its own index of the shared
+    directory; a file evicted by another worker is treated as a miss.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: Optional[OrderedDict[str, int]] = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str, suffix: str) -> Path:
+        """Return the cache path for ``key`` (hashed, fanned out over subdirectories)."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}{suffix}"
+
+    def get(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Look up a cached file and mark it most recently used.
+
+        Args:
+            path: Path from ``path_for``
+
+        Returns:
+            The file's stat result, or None on a miss
+        """
+        with self._lock:
+            entries = self._load()
+            name = str(path)
+            try:
+                os.utime(path)
+                stat_result = os.stat(path)
+            except FileNotFoundError:
+                self._size -= entries.pop(name, 0)
+                return None
+            if name not in entries:
+                # Written by another worker
+                entries[name] = stat_result.st_size
+                self._size += stat_result.st_size
+            entries.move_to_end(name)
+            self._evict(keep=name)
+            return stat_result
+
+    def add(self, path: Path) -> os.stat_result:
+        """
+        Register a newly written file and evict old ones past the size cap.
+
+        Args:
+            path: File just written at a ``path_for`` location
+
+        Returns:
+            The file's stat result
+        """
+        with self._lock:
+            entries = self._load()
+            name = str(path)
+            stat_result = os.stat(path)
+            self._size += stat_result.st_size - entries.pop(name, 0)
+            entries[name] = stat_result.st_size
+            self._evict(keep=name)
+            return stat_result
+
+    @property
+    def size(self) -> int:
+        """Bytes currently tracked in the cache."""
+        with self._lock:
+            self._load()
+            return self._size
+
+    def _load(self) -> OrderedDict:
+        if self._entries is None:
+            files = []
+            if self.directory.exists():
+                for path in self.directory.rglob("*"):
+                    if path.is_file() and not path.name.endswith(".tmp"):
+                        stat_result = path.stat()
+                        files.append((stat_result.st_mtime_ns, str(path), stat_result.st_size))
+            files.sort()
+            self._entries = OrderedDict((name, size) for _, name, size in files)
+            self._size = sum(size for _, _, size in files)
+        return self._entries
+
+    def _evict(self, keep: str) -> None:
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            name, size = next(iter(self._entries.items()))
+            if name == keep:
+                self._entries.move_to_end(name)
+                continue
+            del self._entries[name]
+            self._size -= size
+            try:
+                os.unlink(name)
+            except FileNotFoundError:
+                pass
+
+
+class ImageTransformer:
+    """Produce cached image variants, encoding each at most once at a time."""
+
+    def __init__(self, cache: DiskLRUCache, executor: Optional[Executor] = None):
+        self.cache = cache
+        self._executor = executor
+        self._executor_lock = threading.Lock()
+        self._flight = SingleFlight()
+
+    def executor(self) -> Executor:
+        """Return the encoder pool, starting it on first use (after any fork)."""
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: forking a process that runs threads can deadlock the child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    async def variant(
+        self, source: str, source_stat: os.stat_result, width: Optional[int], fmt: str
+    ) -> tuple[Path, os.stat_result]:
+        """
+        Return the cached variant of ``source``, encoding it on a miss.
+
+        Args:
+            source: Original image path
+            source_stat: Its stat result (size and mtime are part of the cache key)
+            width: Snapped target width, or None for the original width
+            fmt: Key of ``IMAGE_FORMATS``
+
+        Returns:
+            Variant path and stat result
+        """
+        key = f"{source}:{source_stat.st_mtime_ns}:{source_stat.st_size}:{width}:{fmt}"
+        path = self.cache.path_for(key, IMAGE_FORMATS[fmt][1])
+        # Cache bookkeeping stats, touches and unlinks files: keep it off the event loop
+        stat_result = await run_in_threadpool(self.cache.get, path)
+        if stat_result is None:
+            stat_result = await self._flight.do_async(key, self._render, source, path, width, fmt)
+        return path, stat_result
+
+    async def _render(
+        self, source: str, path: Path, width: Optional[int], fmt: str
+    ) -> os.stat_result:
+        stat_result = await run_in_threadpool(self.cache.get, path)
+        if stat_result is not None:
+            return stat_result
+        executor = await run_in_threadpool(self.executor)
+        # Await the encoder pool directly: blocking on it from the threadpool would
+        # hold a thread the sync database renders need for the whole encode
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, render_variant, source, str(path), width, fmt)
+        return await run_in_threadpool(self.cache.add, path)
+
+
+class ResizingStaticFiles(PrecompressedStaticFiles):
+    """
+    Static files that also serve resized/re-encoded images for ``?w=`` and ``?fmt=``.
+
+    Requests without those parameters are served exactly as before.
+    """
+
+    def __init__(self, *args, transformer: Optional[ImageTransformer] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.transformer = transformer or ImageTransformer(
+            DiskLRUCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES)
+        )
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        params = QueryParams(scope["query_string"])
+        if "w" not in params and "fmt" not in params:
+            return await super().get_response(path, scope)
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+
+        entry = await self.lookup_entry(path)
+        if entry is None:
+            raise HTTPException(status_code=404)
+        source_format = RESIZABLE_SUFFIXES.get(Path(entry.path).suffix.lower())
+        if source_format is None:
+            raise HTTPException(status_code=400, detail="This file cannot be transformed")
+
+        width = self._parse_width(params.get("w"))
+        fmt = params.get("fmt", source_format)
+        if fmt not in IMAGE_FORMATS:
+            raise HTTPException(
+                status_code=400, detail=f"fmt must be one of: {', '.join(IMAGE_FORMATS)}"
+            )
+
+        variant_path, variant_stat = await self.transformer.variant(
+            entry.path, entry.stat_result, width, fmt
+        )
+        response = StaticFiles.file_response(self, variant_path, variant_stat, scope)
+        response.headers["Cache-Control"] = VARIANT_CACHE_CONTROL
+        return response
+
+    @staticmethod
+    def _parse_width(value: Optional[str]) -> Optional[int]:
+        if value is None:
+            return None
+        # isdigit() alone also accepts digits int() rejects, e.g. "²"
+        if not (value.isascii() and value.isdigit()) or int(value) == 0:
+            raise HTTPException(status_code=400, detail="w must be a positive integer")
+        return snap_width(int(value))
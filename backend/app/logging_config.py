@@ -0,0 +1,79 @@
+"""
+Structured JSON logging written from a background thread.
+
+Request handlers only put records on an in-memory queue through a
+``QueueHandler``; a ``QueueListener`` thread formats them as one JSON object
+per line and writes them out, so a slow log volume never blocks a request.
+The listener is a thread, so each worker starts its own after forking.
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+# Minimum level written to the log
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as single-line JSON objects.
+
+    Structured values passed as ``extra={"fields": {...}}`` are merged into
+    the top level of the object next to the timestamp, level and message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, separators=(",", ":"), default=str)
+
+
+def configure_logging(stream: Optional[TextIO] = None, level: str = LOG_LEVEL) -> QueueListener:
+    """
+    Route the root logger through a queue to a JSON writer thread.
+
+    Args:
+        stream: Where log lines are written (default: stdout)
+        level: Minimum level logged
+
+    Returns:
+        The started listener; call ``stop()`` to flush and join it on shutdown
+    """
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter())
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        if isinstance(existing, QueueHandler):
+            root.removeHandler(existing)
+    root.addHandler(QueueHandler(records))
+    root.setLevel(level)
+
+    listener = QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def shutdown_logging(listener: QueueListener) -> None:
+    """Write out queued records, stop the writer thread and detach the queue handler."""
+    listener.stop()
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        if isinstance(existing, QueueHandler) and existing.queue is listener.queue:
+            root.removeHandler(existing)
@@ -1,10 +1,42 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse
 
+from app.cache import response_cache
+from app.database import on_database_refresh, replica
+from app.images import ResizingStaticFiles
+from app.logging_config import configure_logging, shutdown_logging
+from app.media_index import MEDIA_DIR, MediaIndex
+from app.middleware import AccessLogMiddleware, CompressionMiddleware, LoadSheddingMiddleware
 from app.routers import projects_router
+from app.static import PrecompressedStaticFiles
+from app.warmup import readiness, start_warmup, wait_for_warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Per-worker startup: start the log writer, load the catalog copy and media index,
+    then warm pools and caches (reported by /api/ready) before accepting connections.
+    """
+    log_listener = configure_logging()
+    readiness.reset()
+    if replica is not None:
+        readiness.measure("replica", replica.load)
+    readiness.measure("media_index", media_index.load)
+    warmup = start_warmup(app)
+    try:
+        if warmup is not None:
+            await wait_for_warmup(warmup)
+        yield
+    finally:
+        if warmup is not None:
+            warmup.cancel()
+        shutdown_logging(log_listener)
+
 
 app = FastAPI(
     title="Portfolio API",
@@ -12,8 +44,17 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
 
+# Cached payloads are stale once the in-memory catalog copy is reloaded
+on_database_refresh(response_cache.clear)
+
+# Per-worker concurrency limit with a bounded wait queue; excess API requests get
+# 503 + Retry-After instead of queueing behind blocking SQLite reads. Added first
+# so it runs inside CORS and compression.
+app.add_middleware(LoadSheddingMiddleware)
+
 # CORS middleware - configure origins based on environment
 # Development: allow localhost
 # Production: allow production domain only
@@ -29,9 +70,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
-app.mount("/images", StaticFiles(directory="static/images"), name="images")
-app.mount("/videos", StaticFiles(directory="static/images"), name="videos")
+# Brotli/gzip compression negotiated from Accept-Encoding. Cached API payloads
+# arrive already compressed and pass through untouched.
+app.add_middleware(CompressionMiddleware)
+
+# Structured JSON access log (route, status, latency, bytes on the wire, SQL time),
+# written by a background thread; outermost so it sees shed requests too
+app.add_middleware(AccessLogMiddleware)
+
+# Static media (MEDIA_DIR), indexed once per worker (app/media_index.py)
+media_index = MediaIndex(MEDIA_DIR)
+
+# Mount static files (serving .br/.gz siblings from scripts/precompress_static.py);
+# images also accept ?w=&fmt= for resized variants (app/images.py). Both mounts
+# resolve files from one in-memory index of the directory.
+app.mount("/images", ResizingStaticFiles(directory=MEDIA_DIR, index=media_index), name="images")
+app.mount(
+    "/videos", PrecompressedStaticFiles(directory=MEDIA_DIR, index=media_index), name="videos"
+)
 
 # Register routers
 app.include_router(projects_router, prefix="/api", tags=["projects"])
@@ -41,3 +97,9 @@ app.include_router(projects_router, prefix="/api", tags=["projects"])
 async def health_check():
     """Health check endpoint"""
     return {"status": "ok", "version": "1.0.0"}
+
+
+@app.get("/api/ready")
+async def readiness_check():
+    """Readiness endpoint: 200 once this worker is warm, 503 while warming or after a failure"""
+    return JSONResponse(readiness.report(), status_code=200 if readiness.ready else 503)
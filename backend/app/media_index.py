@@ -0,0 +1,211 @@
+"""
+In-memory index of a static media directory.
+
+The directory is walked once and every file's size, mtime, content hash,
+MIME type and ETag are kept in a dict, so path resolution, 404s,
+conditional requests and response headers need no filesystem access; only
+sending a body touches the file (a ``stat`` to confirm the entry, then the read).
+
+Precompressed ``.br``/``.gz`` siblings of indexed files are kept apart from
+the path lookup (``lookup_variant``), so they are only ever served as an
+encoding of their source, never as a file of their own.
+
+Writers signal changes by touching a stamp file in the directory
+(``touch_media_stamp``). The index checks the stamp at most once per
+``MEDIA_INDEX_REFRESH_INTERVAL`` seconds and rebuilds when it moved,
+re-hashing only files whose size or mtime changed. A file found changed
+without the stamp moving (see ``IndexedFileResponse`` in ``app.static``)
+marks the index stale so the next check rebuilds it anyway.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import formatdate
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Optional
+
+# Static media directory served at /images and /videos (relative to the working directory)
+MEDIA_DIR = os.getenv("MEDIA_DIR", "static/images")
+
+# Seconds between checks of the stamp file
+MEDIA_INDEX_REFRESH_INTERVAL = float(os.getenv("MEDIA_INDEX_REFRESH_INTERVAL", "1.0"))
+
+# Touched by the seeder and build scripts after they change files; never served
+MEDIA_STAMP_NAME = ".media-stamp"
+
+# File suffix written by scripts/precompress_static.py for each encoding
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class MediaEntry:
+    """Everything needed to answer a request for one file except its body."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    media_type: str
+    etag: str
+    last_modified: str
+    stat_result: os.stat_result
+
+
+def touch_media_stamp(directory: os.PathLike) -> None:
+    """Tell running servers that files under ``directory`` changed."""
+    (Path(directory) / MEDIA_STAMP_NAME).touch()
+
+
+def hash_file(path: str) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_entry(path: str, stat_result: os.stat_result, content_hash: str) -> MediaEntry:
+    """Build the index entry for one file."""
+    return MediaEntry(
+        path=path,
+        size=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+        content_hash=content_hash,
+        media_type=guess_type(path)[0] or "text/plain",
+        etag=f'"{content_hash[:32]}"',
+        last_modified=formatdate(stat_result.st_mtime, usegmt=True),
+        stat_result=stat_result,
+    )
+
+
+class MediaIndex:
+    """Path → ``MediaEntry`` for every file below a directory."""
+
+    def __init__(self, directory: os.PathLike):
+        self.directory = os.path.realpath(directory)
+        self._entries: Optional[dict[str, MediaEntry]] = None
+        self._variants: dict[tuple[str, str], MediaEntry] = {}
+        self._stamp: Optional[int] = None
+        self._stale = False
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def load(self) -> dict[str, MediaEntry]:
+        """Build the index if it has not been built yet and return it."""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._rebuild()
+        return self._entries
+
+    def lookup(self, path: str) -> Optional[MediaEntry]:
+        """
+        Find the entry for a request path.
+
+        Args:
+            path: Path relative to the directory, as passed to ``StaticFiles.get_response``
+
+        Returns:
+            The entry, or None if no such file exists
+        """
+        return self.load().get(path.replace(os.sep, "/"))
+
+    def lookup_variant(self, path: str, encoding: str) -> Optional[MediaEntry]:
+        """
+        Find the precompressed sibling of a file for one encoding.
+
+        Args:
+            path: Path of the source file, as passed to ``lookup``
+            encoding: Key of ``ENCODING_SUFFIXES``
+
+        Returns:
+            The sibling's entry, or None if it was not generated
+        """
+        self.load()
+        return self._variants.get((path.replace(os.sep, "/"), encoding))
+
+    def mark_stale(self) -> None:
+        """Rebuild on the next check even if the stamp file did not move."""
+        self._stale = True
+
+    def is_due(self) -> bool:
+        """Whether the refresh interval has elapsed since the last stamp check."""
+        return time.monotonic() - self._last_check >= MEDIA_INDEX_REFRESH_INTERVAL
+
+    def refresh_if_stale(self) -> bool:
+        """
+        Rebuild the index if the stamp file changed since the last build, or
+        the index was marked stale.
+
+        Checks run at most once per ``MEDIA_INDEX_REFRESH_INTERVAL`` seconds.
+
+        Returns:
+            True if the index was rebuilt
+        """
+        if not self.is_due():
+            return False
+        with self._lock:
+            if not self.is_due():
+                return False
+            self._last_check = time.monotonic()
+            if self._entries is not None and not self._stale and self._read_stamp() == self._stamp:
+                return False
+            self._rebuild()
+            return True
+
+    def _read_stamp(self) -> Optional[int]:
+        try:
+            return os.stat(os.path.join(self.directory, MEDIA_STAMP_NAME)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _rebuild(self) -> None:
+        # Read the stamp first: a change made during the walk triggers another rebuild
+        stamp = self._read_stamp()
+        self._stale = False
+        previous = self._entries or {}
+        entries = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name == MEDIA_STAMP_NAME:
+                    continue
+                full_path = os.path.join(root, name)
+                # Like StaticFiles, never serve symlinks that leave the directory
+                real_path = os.path.realpath(full_path)
+                if os.path.commonpath([real_path, self.directory]) != self.directory:
+                    continue
+                try:
+                    stat_result = os.stat(full_path)
+                except FileNotFoundError:
+                    continue
+                key = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+                old = previous.get(key)
+                if (
+                    old is not None
+                    and old.size == stat_result.st_size
+                    and old.mtime_ns == stat_result.st_mtime_ns
+                ):
+                    content_hash = old.content_hash
+                else:
+                    content_hash = hash_file(full_path)
+                entries[key] = make_entry(full_path, stat_result, content_hash)
+        variants = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            for key in [key for key in entries if key.endswith(suffix)]:
+                # A .gz/.br without its source next to it is an ordinary file
+                if key[: -len(suffix)] in entries:
+                    variants[(key[: -len(suffix)], encoding)] = entries.pop(key)
+        self._entries = entries
+        self._variants = variants
+        self._stamp = stamp
+        self._last_check = time.monotonic()
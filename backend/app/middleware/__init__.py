@@ -0,0 +1,9 @@
+"""
+ASGI middleware for the application.
+"""
+
+from app.middleware.access_log import AccessLogMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.load_shedding import LoadSheddingMiddleware
+
+__all__ = ["AccessLogMiddleware", "CompressionMiddleware", "LoadSheddingMiddleware"]
@@ -0,0 +1,129 @@
+"""
+Structured access logging with sampling of successful requests.
+
+One ``app.access`` record per request carries the route template, status,
+latency, response bytes and the time spent in SQL. Errors and slow requests
+are always logged; other requests are sampled at ``ACCESS_LOG_SAMPLE_RATE``.
+Records go through the queue set up by ``app.logging_config``, so writing
+them never happens on the request path.
+"""
+
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Fraction of successful, fast requests logged (errors and slow requests always are)
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+
+# Requests slower than this many milliseconds are always logged
+ACCESS_LOG_SLOW_MS = float(os.getenv("ACCESS_LOG_SLOW_MS", "500"))
+
+access_logger = logging.getLogger("app.access")
+
+
+@dataclass
+class DatabaseTiming:
+    """SQL statements executed on behalf of one request and their total time."""
+
+    queries: int = 0
+    seconds: float = 0.0
+
+
+# Set per request; sync endpoints see the same object from the threadpool
+current_db_timing: ContextVar[Optional[DatabaseTiming]] = ContextVar(
+    "current_db_timing", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_db_timing.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timing = current_db_timing.get()
+    started = conn.info.get("query_started")
+    if timing is not None and started:
+        timing.queries += 1
+        timing.seconds += time.perf_counter() - started.pop()
+
+
+def route_template(scope: Scope) -> str:
+    """The matched route's path template (e.g. ``/api/projects/{slug}``), else the raw path."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get("path", "")
+
+
+class AccessLogMiddleware:
+    """Log one structured record per HTTP request."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = ACCESS_LOG_SAMPLE_RATE,
+        slow_ms: float = ACCESS_LOG_SLOW_MS,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.rng = rng
+
+    def should_log(self, status: int, duration_ms: float) -> bool:
+        """Whether a request is logged: always for errors and slow ones, else sampled."""
+        if status >= 400 or duration_ms >= self.slow_ms:
+            return True
+        return self.sample_rate >= 1 or self.rng() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not access_logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timing = DatabaseTiming()
+        token = current_db_timing.set(timing)
+        status = 500
+        sent = 0
+
+        async def send_and_count(message: Message) -> None:
+            nonlocal status, sent
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                sent += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_count)
+        finally:
+            current_db_timing.reset(token)
+            duration_ms = (time.perf_counter() - started) * 1000
+            if self.should_log(status, duration_ms):
+                client = scope.get("client")
+                access_logger.info(
+                    "request",
+                    extra={
+                        "fields": {
+                            "method": scope["method"],
+                            "route": route_template(scope),
+                            "path": scope["path"],
+                            "status": status,
+                            "duration_ms": round(duration_ms, 2),
+                            "bytes": sent,
+                            "db_ms": round(timing.seconds * 1000, 2),
+                            "db_queries": timing.queries,
+                            "client": client[0] if client else None,
+                        }
+                    },
+                )
@@ -0,0 +1,263 @@
+"""
+Per-worker concurrency limiting and load shedding.
+
+At most ``MAX_CONCURRENT_REQUESTS`` API requests are handled at once; up to
+``MAX_QUEUED_REQUESTS`` more wait (for at most ``QUEUE_TIMEOUT`` seconds)
+for a slot, and anything beyond that is answered immediately with ``503``
+and ``Retry-After``. Queueing more work than the threadpool and SQLite can
+absorb only makes every request slower, so shedding the excess keeps tail
+latency bounded for the requests that are admitted.
+
+Optionally, each client is also limited by a token bucket
+(``RATE_LIMIT_PER_SECOND`` sustained, ``RATE_LIMIT_BURST`` burst) and gets
+``429`` with ``Retry-After`` when it runs dry.
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Requests handled at once per worker (0 disables the limit)
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "32"))
+
+# Requests allowed to wait for a slot; later arrivals are shed immediately
+MAX_QUEUED_REQUESTS = int(os.getenv("MAX_QUEUED_REQUESTS", "64"))
+
+# Seconds a queued request waits for a slot before it is shed
+QUEUE_TIMEOUT = float(os.getenv("QUEUE_TIMEOUT", "2.0"))
+
+# Retry-After sent with 503 responses, in seconds
+SHED_RETRY_AFTER = int(os.getenv("SHED_RETRY_AFTER", "1"))
+
+# Per-client token bucket: sustained requests per second (0 disables) and burst size
+RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "0"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "20"))
+
+# Buckets kept per worker; the least recently seen clients are forgotten first
+RATE_LIMIT_MAX_CLIENTS = 10_000
+
+# Only API requests are limited; static media is served without touching SQLite
+LIMITED_PATH_PREFIX = "/api"
+
+# Health and readiness checks must answer under load; event streams are
+# long-lived and have their own subscriber limit
+EXEMPT_PATHS = ("/api/health", "/api/ready", "/api/projects/events")
+
+
+class ConcurrencyLimiter:
+    """Counting semaphore with a bounded FIFO wait queue; a limit of 0 disables it."""
+
+    def __init__(self, limit: int, max_queue: int):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.shed = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def queued(self) -> int:
+        """Requests currently waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Take a slot, waiting in the queue for up to ``timeout`` seconds.
+
+        Args:
+            timeout: Longest time to wait when every slot is busy
+
+        Returns:
+            True if a slot was taken (``release`` must follow), False if shed
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures are bound to the loop that created them
+            self._loop, self.active, self._waiters = loop, 0, deque()
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            return False
+
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return False
+
+    @asynccontextmanager
+    async def slot(self, timeout: float = QUEUE_TIMEOUT) -> AsyncIterator[None]:
+        """
+        Hold a slot for one step of work that can no longer be shed.
+
+        Used by streams that keep querying after their response has started,
+        e.g. one page of the NDJSON export: the step queues like a request,
+        but waits for its turn again instead of failing when it times out.
+
+        Args:
+            timeout: Longest wait per attempt, and the pause after a full queue
+        """
+        if self.limit <= 0:
+            yield
+            return
+        while not await self.acquire(timeout):
+            await asyncio.sleep(timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """Free a slot, handing it straight to the longest-waiting request."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class TokenBucketLimiter:
+    """Per-client token buckets refilled at ``rate`` tokens per second; 0 disables them."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_clients: int = RATE_LIMIT_MAX_CLIENTS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.clock = clock
+        self.rejected = 0
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def take(self, client: str) -> float:
+        """
+        Spend one token from ``client``'s bucket.
+
+        Args:
+            client: Client identity, e.g. its IP address
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until a token is available
+        """
+        now = self.clock()
+        tokens, updated = self._buckets.pop(client, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / self.rate
+        self._buckets[client] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+# Per-worker limiters used by LoadSheddingMiddleware unless others are passed
+request_limiter = ConcurrencyLimiter(MAX_CONCURRENT_REQUESTS, MAX_QUEUED_REQUESTS)
+client_rate_limiter = TokenBucketLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+
+
+class LoadSheddingMiddleware:
+    """
+    Shed API requests beyond the worker's concurrency and queue limits.
+
+    A slot is held until the response starts, i.e. while the request is
+    being computed; streaming the body to a slow client does not occupy it.
+    Streams that render their body from the database as they go take a slot
+    per query with ``ConcurrencyLimiter.slot`` instead.
+    The client address comes from the ASGI scope, which uvicorn fills from
+    ``X-Forwarded-For`` for requests proxied by nginx on localhost.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[ConcurrencyLimiter] = None,
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        queue_timeout: float = QUEUE_TIMEOUT,
+    ):
+        self.app = app
+        self.limiter = limiter or request_limiter
+        self.rate_limiter = rate_limiter or client_rate_limiter
+        self.queue_timeout = queue_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not path.startswith(LIMITED_PATH_PREFIX)
+            or path.startswith(EXEMPT_PATHS)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if self.rate_limiter.rate > 0:
+            client = scope["client"][0] if scope.get("client") else "unknown"
+            wait = self.rate_limiter.take(client)
+            if wait > 0:
+                self.rate_limiter.rejected += 1
+                response = JSONResponse(
+                    {"detail": "Too many requests"},
+                    status_code=429,
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+                await response(scope, receive, send)
+                return
+
+        if self.limiter.limit <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.limiter.acquire(self.queue_timeout):
+            self.limiter.shed += 1
+            response = JSONResponse(
+                {"detail": "Server is busy, retry shortly"},
+                status_code=503,
+                headers={"Retry-After": str(SHED_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self.limiter.release()
+
+        async def send_and_release(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_release)
+        finally:
+            release()
@@ -0,0 +1,429 @@
+"""
+Batched, resumable schema migrations for the SQLite catalog.
+
+The schema version lives in ``PRAGMA user_version``. SQLite cannot alter
+most column definitions in place, so a migration rebuilds a table into the
+shape declared by the SQLAlchemy models:
+
+1. In one short transaction, create ``<table>__new`` from the model's DDL,
+   add triggers that mirror every insert, update and delete on the old
+   table into it, and record a checkpoint.
+2. Copy rows over in ``rowid`` order, ``MIGRATION_BATCH_SIZE`` at a time.
+   Each batch and its checkpoint commit together, so a crashed run resumes
+   from the last committed batch, and the write lock is only held per batch.
+3. In a final transaction, drop the old table, rename the new one into
+   place, recreate its indexes, check foreign keys and bump the version.
+
+Columns the old table lacks are filled with the model's default. After
+each rebuild the live table is verified against the metadata.
+
+Tables and indexes that are only added, never changed, are created in a
+single transaction instead. Once every migration has run, the whole schema
+is verified, so a database that still differs from the models is reported
+rather than stamped as current.
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, TypeVar, Union
+
+from sqlalchemy import Table, literal
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+import app.models  # noqa: F401  (registers the tables on Base.metadata)
+from app.database import Base
+
+# Rows copied per transaction
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "500"))
+
+# Seconds to pause between batches so readers and writers get the database
+MIGRATION_BATCH_PAUSE = float(os.getenv("MIGRATION_BATCH_PAUSE", "0.01"))
+
+# Copy progress of in-flight rebuilds, one row per migration version
+CHECKPOINT_TABLE = "schema_migration_checkpoints"
+
+DIALECT = sqlite.dialect()
+
+T = TypeVar("T")
+
+
+class MigrationError(Exception):
+    """A migration could not be applied or left the schema inconsistent."""
+
+
+@dataclass(frozen=True)
+class TableRebuild:
+    """Rebuild ``table`` into the shape its model currently declares."""
+
+    version: int
+    table: str
+    description: str
+
+    @property
+    def model(self) -> Table:
+        return Base.metadata.tables[self.table]
+
+    @property
+    def new_table(self) -> str:
+        return f"{self.table}__new"
+
+
+@dataclass(frozen=True)
+class CreateMissing:
+    """Create model tables and indexes the database does not have yet."""
+
+    version: int
+    description: str
+    tables: tuple[str, ...] = ()
+    indexes: tuple[str, ...] = ()
+
+    @property
+    def models(self) -> list[Table]:
+        return [Base.metadata.tables[name] for name in self.tables]
+
+    @property
+    def model_indexes(self) -> list:
+        by_name = {
+            index.name: index for table in Base.metadata.tables.values() for index in table.indexes
+        }
+        return [by_name[name] for name in self.indexes]
+
+
+Migration = Union[TableRebuild, CreateMissing]
+
+# Applied in order; a database at version N has had every migration <= N applied
+MIGRATIONS: list[Migration] = [
+    TableRebuild(
+        version=1,
+        table="projects",
+        description="drop created_at/updated_at, add order_num",
+    ),
+    CreateMissing(
+        version=2,
+        description="add project_versions and project_related",
+        tables=("project_versions", "project_related"),
+    ),
+    CreateMissing(
+        version=3,
+        description="index projects by (order_num, id) and images by project",
+        indexes=("ix_projects_order_num_id", "ix_project_images_project_id"),
+    ),
+]
+
+# Version of a database created from the current models
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def quote(name: str) -> str:
+    return DIALECT.identifier_preparer.quote(name)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the database's schema version (``PRAGMA user_version``)."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def stamp_schema_version(conn: sqlite3.Connection, version: int = SCHEMA_VERSION) -> None:
+    """Mark a database as being at ``version``, e.g. right after ``create_all``."""
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({quote(table)})")]
+
+
+def verify_table(conn: sqlite3.Connection, model: Table) -> list[str]:
+    """
+    Compare one live table with its model.
+
+    Args:
+        conn: Connection to the database
+        model: Table from ``Base.metadata``
+
+    Returns:
+        Human-readable differences; empty when the table matches
+    """
+    info = {row[1]: row for row in conn.execute(f"PRAGMA table_info({quote(model.name)})")}
+    if not info:
+        return [f"{model.name}: table is missing"]
+
+    problems = []
+    for column in model.columns:
+        row = info.pop(column.name, None)
+        if row is None:
+            problems.append(f"{model.name}.{column.name}: column is missing")
+        elif not column.primary_key and bool(row[3]) == column.nullable:
+            expected = "nullable" if column.nullable else "NOT NULL"
+            problems.append(f"{model.name}.{column.name}: expected {expected}")
+        elif bool(row[5]) != column.primary_key:
+            problems.append(f"{model.name}.{column.name}: primary key mismatch")
+    problems.extend(f"{model.name}.{name}: unexpected column" for name in info)
+
+    live_indexes = {
+        row[1]: bool(row[2])
+        for row in conn.execute(f"PRAGMA index_list({quote(model.name)})")
+        if row[3] == "c"
+    }
+    for index in model.indexes:
+        if index.name not in live_indexes:
+            problems.append(f"{model.name}: index {index.name} is missing")
+        elif live_indexes[index.name] != bool(index.unique):
+            problems.append(f"{model.name}: index {index.name} uniqueness mismatch")
+    return problems
+
+
+def verify_schema(conn: sqlite3.Connection, tables: Optional[Iterable[Table]] = None) -> list[str]:
+    """
+    Compare the live schema with the SQLAlchemy metadata.
+
+    Args:
+        conn: Connection to the database
+        tables: Tables to check (default: every table in ``Base.metadata``)
+
+    Returns:
+        Human-readable differences; empty when the schema matches
+    """
+    problems = []
+    for model in tables if tables is not None else Base.metadata.sorted_tables:
+        problems.extend(verify_table(conn, model))
+    return problems
+
+
+def column_default(column) -> str:
+    """SQL literal used for a model column the old table does not have."""
+    if column.default is not None and column.default.is_scalar:
+        value = column.default.arg
+    elif column.server_default is not None:
+        return str(column.server_default.arg)
+    elif column.nullable:
+        value = None
+    else:
+        raise MigrationError(f"{column.table.name}.{column.name} is NOT NULL without a default")
+    return str(literal(value).compile(dialect=DIALECT, compile_kwargs={"literal_binds": True}))
+
+
+class MigrationRunner:
+    """Apply pending migrations to one SQLite file."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = MIGRATION_BATCH_SIZE,
+        batch_pause: float = MIGRATION_BATCH_PAUSE,
+        progress: Optional[Callable[[str], None]] = None,
+        migrations: Optional[list[TableRebuild]] = None,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.progress = progress or (lambda message: None)
+        self.migrations = migrations if migrations is not None else MIGRATIONS
+        self.conn = sqlite3.connect(path, isolation_level=None, timeout=30)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} ("
+            "version INTEGER PRIMARY KEY, last_rowid INTEGER NOT NULL, "
+            "rows_copied INTEGER NOT NULL)"
+        )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "MigrationRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def pending(self) -> list[Migration]:
+        """Migrations newer than the database's schema version."""
+        current = get_schema_version(self.conn)
+        return [migration for migration in self.migrations if migration.version > current]
+
+    def run(self) -> int:
+        """
+        Apply every pending migration, resuming an interrupted one first.
+
+        Returns:
+            The schema version afterwards
+
+        Raises:
+            MigrationError: If a migration fails or the schema still differs from the models
+        """
+        for migration in self.pending():
+            self.apply(migration)
+        problems = verify_schema(self.conn)
+        if problems:
+            raise MigrationError(f"schema differs from the models: {'; '.join(problems)}")
+        return get_schema_version(self.conn)
+
+    def apply(self, migration: Migration) -> None:
+        """Apply one migration, skipping the rebuild if the table already matches."""
+        if isinstance(migration, CreateMissing):
+            self._create(migration)
+            return
+        if not table_columns(self.conn, migration.table):
+            raise MigrationError(f"{migration.table} does not exist; create it with init_db")
+        checkpoint = self._checkpoint(migration)
+        if checkpoint is None and not verify_table(self.conn, migration.model):
+            self._transaction(lambda: stamp_schema_version(self.conn, migration.version))
+            self.progress(f"v{migration.version}: {migration.table} already up to date")
+            return
+
+        if checkpoint is None:
+            self._start(migration)
+            checkpoint = (0, 0)
+        else:
+            self.progress(
+                f"v{migration.version}: resuming {migration.table} after {checkpoint[1]} rows"
+            )
+        self._copy(migration, *checkpoint)
+        self._swap(migration)
+        self.progress(f"v{migration.version}: {migration.description}")
+
+    def _create(self, migration: CreateMissing) -> None:
+        def create() -> int:
+            created = 0
+            for model in migration.models:
+                if not table_columns(self.conn, model.name):
+                    self.conn.execute(str(CreateTable(model).compile(dialect=DIALECT)))
+                    for index in model.indexes:
+                        self.conn.execute(str(CreateIndex(index).compile(dialect=DIALECT)))
+                    created += 1
+            live = {row[0] for row in self.conn.execute("SELECT name FROM sqlite_master")}
+            for index in migration.model_indexes:
+                if index.name not in live:
+                    self.conn.execute(str(CreateIndex(index).compile(dialect=DIALECT)))
+                    created += 1
+            stamp_schema_version(self.conn, migration.version)
+            return created
+
+        if self._transaction(create):
+            self.progress(f"v{migration.version}: {migration.description}")
+        else:
+            self.progress(f"v{migration.version}: already up to date")
+
+    def _transaction(self, body: Callable[[], T]) -> T:
+        # IMMEDIATE takes the write lock up front instead of failing on upgrade
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = body()
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        return result
+
+    def _checkpoint(self, migration: TableRebuild) -> Optional[tuple[int, int]]:
+        return self.conn.execute(
+            f"SELECT last_rowid, rows_copied FROM {CHECKPOINT_TABLE} WHERE version = ?",
+            (migration.version,),
+        ).fetchone()
+
+    def _column_sql(self, migration: TableRebuild, prefix: str = "") -> tuple[str, str]:
+        """Target column list and the matching expressions over the old table."""
+        old_columns = set(table_columns(self.conn, migration.table))
+        names, expressions = ["rowid"], [f"{prefix}rowid"]
+        for column in migration.model.columns:
+            names.append(quote(column.name))
+            if column.name in old_columns:
+                expressions.append(f"{prefix}{quote(column.name)}")
+            else:
+                expressions.append(column_default(column))
+        return ", ".join(names), ", ".join(expressions)
+
+    def _start(self, migration: TableRebuild) -> None:
+        old, new = quote(migration.table), quote(migration.new_table)
+        ddl = str(CreateTable(migration.model).compile(dialect=DIALECT)).replace(
+            f"CREATE TABLE {old} ", f"CREATE TABLE {new} ", 1
+        )
+        names, values = self._column_sql(migration, prefix="NEW.")
+        upsert = f"INSERT OR REPLACE INTO {new} ({names}) VALUES ({values});"
+        remove = f"DELETE FROM {new} WHERE rowid = OLD.rowid;"
+
+        def start() -> None:
+            self.conn.execute(f"DROP TABLE IF EXISTS {new}")
+            self.conn.execute(ddl)
+            # Writes during the copy reach the new table through these triggers
+            for event, body in (
+                ("INSERT", upsert),
+                ("UPDATE", remove + upsert),
+                ("DELETE", remove),
+            ):
+                trigger = quote(f"{migration.new_table}_{event.lower()}")
+                self.conn.execute(
+                    f"CREATE TRIGGER {trigger} AFTER {event} ON {old} BEGIN {body} END"
+                )
+            self.conn.execute(
+                f"INSERT INTO {CHECKPOINT_TABLE} VALUES (?, 0, 0)", (migration.version,)
+            )
+
+        self._transaction(start)
+        self.progress(f"v{migration.version}: copying {migration.table}")
+
+    def _copy(self, migration: TableRebuild, last_rowid: int, copied: int) -> None:
+        old, new = quote(migration.table), quote(migration.new_table)
+        names, expressions = self._column_sql(migration)
+
+        def copy_batch() -> tuple[int, int]:
+            upper, count = self.conn.execute(
+                f"SELECT max(rowid), count(*) FROM (SELECT rowid FROM {old} "
+                "WHERE rowid > ? ORDER BY rowid LIMIT ?)",
+                (last_rowid, self.batch_size),
+            ).fetchone()
+            if count:
+                # Rows the triggers already wrote are newer; keep them
+                self.conn.execute(
+                    f"INSERT OR IGNORE INTO {new} ({names}) SELECT {expressions} FROM {old} "
+                    "WHERE rowid > ? AND rowid <= ?",
+                    (last_rowid, upper),
+                )
+                self.conn.execute(
+                    f"UPDATE {CHECKPOINT_TABLE} SET last_rowid = ?, rows_copied = ? "
+                    "WHERE version = ?",
+                    (upper, copied + count, migration.version),
+                )
+            return upper, count
+
+        while True:
+            upper, count = self._transaction(copy_batch)
+            if not count:
+                return
+            last_rowid, copied = upper, copied + count
+            self.progress(f"v{migration.version}: copied {copied} rows of {migration.table}")
+            time.sleep(self.batch_pause)
+
+    def _swap(self, migration: TableRebuild) -> None:
+        old, new = quote(migration.table), quote(migration.new_table)
+
+        def swap() -> None:
+            for event in ("insert", "update", "delete"):
+                self.conn.execute(
+                    f"DROP TRIGGER IF EXISTS {quote(f'{migration.new_table}_{event}')}"
+                )
+            self.conn.execute(f"DROP TABLE {old}")
+            self.conn.execute(f"ALTER TABLE {new} RENAME TO {old}")
+            for index in migration.model.indexes:
+                self.conn.execute(str(CreateIndex(index).compile(dialect=DIALECT)))
+            violations = self.conn.execute("PRAGMA foreign_key_check").fetchall()
+            if violations:
+                raise MigrationError(f"foreign key violations after rebuild: {violations[:5]}")
+            # Checked before the version is bumped, so a mismatch rolls the swap back
+            problems = verify_table(self.conn, migration.model)
+            if problems:
+                raise MigrationError("; ".join(problems))
+            self.conn.execute(
+                f"DELETE FROM {CHECKPOINT_TABLE} WHERE version = ?", (migration.version,)
+            )
+            stamp_schema_version(self.conn, migration.version)
+
+        # Dropping the old table must not cascade into the tables referencing it;
+        # foreign key enforcement can only be switched outside a transaction
+        foreign_keys = self.conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            self._transaction(swap)
+        finally:
+            self.conn.execute(f"PRAGMA foreign_keys = {foreign_keys}")
@@ -1,5 +1,5 @@
 """SQLAlchemy models for the portfolio application."""
 
-from app.models.project import Project, ProjectImage, Role, Technology
+from app.models.project import Project, ProjectImage, ProjectVersion, Role, Technology
 
-__all__ = ["Project", "Technology", "Role", "ProjectImage"]
+__all__ = ["Project", "Technology", "Role", "ProjectImage", "ProjectVersion"]
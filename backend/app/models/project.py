@@ -1,6 +1,6 @@
 """SQLAlchemy models for projects and related entities."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, String, Table, Text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -23,6 +23,18 @@ project_roles = Table(
     Column("role_id", String, ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True),
 )
 
+# Top-k related projects per project, precomputed at seed time (app/recommendations.py)
+project_related = Table(
+    "project_related",
+    Base.metadata,
+    Column("project_id", String, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("rank", Integer, primary_key=True),
+    Column(
+        "related_project_id", String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    ),
+    Column("score", Float, nullable=False),
+)
+
 
 class Project(Base):
     """Project model representing portfolio projects."""
@@ -38,6 +50,9 @@ class Project(Base):
     github_url = Column(String, nullable=True)
     order_num = Column(Integer, default=0, nullable=False)
 
+    # Keyset pagination in list order (GET /api/projects/export.ndjson)
+    __table_args__ = (Index("ix_projects_order_num_id", "order_num", "id"),)
+
     # Relationships
     technologies = relationship(
         "Technology", secondary=project_technologies, back_populates="projects"
@@ -83,10 +98,23 @@ class ProjectImage(Base):
     __tablename__ = "project_images"
 
     id = Column(String, primary_key=True)
-    project_id = Column(String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), index=True, nullable=False
+    )
     url = Column(String, nullable=False)
     alt_text = Column(String, nullable=False)
     order_num = Column(Integer, default=0, nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="images")
+
+
+class ProjectVersion(Base):
+    """Content hash and last-changed catalog version per slug, kept across reseeds."""
+
+    __tablename__ = "project_versions"
+
+    slug = Column(String, primary_key=True)
+    content_hash = Column(String, nullable=False)
+    version = Column(Integer, index=True, nullable=False)
+    deleted = Column(Boolean, default=False, nullable=False)
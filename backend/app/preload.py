@@ -0,0 +1,54 @@
+"""
+``Link: rel=preload`` headers for project media.
+
+A client only finds a project's image URLs after downloading and parsing the
+detail JSON. Sending the first few as preload links in the response headers
+lets browsers (and CDNs that turn ``Link`` headers into ``103 Early Hints``)
+start fetching them while the body is still arriving. The header value is
+derived from the rendered JSON once and stored with the cached payload.
+"""
+
+import json
+import mimetypes
+import os
+from typing import Optional
+
+# Images, by order, advertised as preload links on project detail responses (0 disables)
+PRELOAD_IMAGE_COUNT = int(os.getenv("PRELOAD_IMAGE_COUNT", "2"))
+
+
+def preload_link(url: str) -> Optional[str]:
+    """
+    Format one ``Link`` entry for a media URL.
+
+    Only images are preloaded: browsers have no ``as`` destination for video,
+    so a preloaded video would be fetched twice.
+
+    Args:
+        url: Image URL as it appears in the response, e.g. ``/images/projects/a/1.png``
+
+    Returns:
+        ``<url>; rel=preload; as=image; type=...``, or None for non-image URLs
+    """
+    media_type, _ = mimetypes.guess_type(url)
+    if not media_type or not media_type.startswith("image/"):
+        return None
+    return f"<{url}>; rel=preload; as=image; type={media_type}"
+
+
+def preload_headers(body: bytes, count: int = PRELOAD_IMAGE_COUNT) -> dict[str, str]:
+    """
+    Build the ``Link`` header for a serialized project detail document.
+
+    Args:
+        body: Project detail JSON
+        count: Number of images to preload, lowest ``order`` first
+
+    Returns:
+        ``{"Link": ...}``, or an empty dict when there is nothing to preload
+    """
+    if count <= 0:
+        return {}
+    images = sorted(json.loads(bytes(body)).get("images", []), key=lambda image: image["order"])
+    links = [link for link in map(preload_link, (image["url"] for image in images)) if link]
+    return {"Link": ", ".join(links[:count])} if links else {}
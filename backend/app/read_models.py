@@ -0,0 +1,99 @@
+"""
+Lightweight read models for the project serving path.
+
+Frozen, slotted dataclasses populated from Core ``select()`` rows. Unlike ORM
+entities they carry no ``_sa_instance_state``, instrumented attributes or
+relationship collections, so a request allocates only the data it serves.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from pydantic_core import to_json
+
+
+@dataclass(frozen=True, slots=True)
+class TechnologyRead:
+    """Technology attached to a project."""
+
+    id: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class RoleRead:
+    """Role attached to a project."""
+
+    id: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectImageRead:
+    """Project image or video."""
+
+    id: str
+    project_id: str
+    url: str
+    alt_text: str
+    order_num: int
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectRead:
+    """Project with its related rows, ready to serialize."""
+
+    id: str
+    title: str
+    slug: str
+    summary: str
+    description: str
+    live_url: Optional[str]
+    github_url: Optional[str]
+    order_num: int
+    roles: tuple[RoleRead, ...] = ()
+    technologies: tuple[TechnologyRead, ...] = ()
+    images: tuple[ProjectImageRead, ...] = ()
+
+
+def project_to_dict(project: ProjectRead) -> dict:
+    """
+    Convert a read model to the ``ProjectResponse`` shape (aliased keys, field order).
+
+    Args:
+        project: Project read model
+
+    Returns:
+        Dictionary ready for JSON encoding
+    """
+    return {
+        "id": project.id,
+        "title": project.title,
+        "slug": project.slug,
+        "summary": project.summary,
+        "description": project.description,
+        "liveUrl": project.live_url,
+        "githubUrl": project.github_url,
+        "roles": [{"id": role.id, "name": role.name} for role in project.roles],
+        "technologies": [{"id": tech.id, "name": tech.name} for tech in project.technologies],
+        "images": [
+            {
+                "id": image.id,
+                "projectId": image.project_id,
+                "url": image.url,
+                "altText": image.alt_text,
+                "order": image.order_num,
+            }
+            for image in project.images
+        ],
+    }
+
+
+def dump_read_project_json(project: ProjectRead) -> bytes:
+    """Serialize one read model to ``ProjectResponse`` JSON bytes."""
+    return to_json(project_to_dict(project))
+
+
+def dump_read_projects_json(projects: Iterable[ProjectRead]) -> bytes:
+    """Serialize read models to ``list[ProjectResponse]`` JSON bytes."""
+    return to_json([project_to_dict(project) for project in projects])
@@ -0,0 +1,124 @@
+"""
+Related-project recommendations precomputed at seed time.
+
+Each project is a bit-vector over its technologies and roles. Jaccard
+similarity between every pair is computed with NumPy matrix products, one
+block of rows at a time, and the top-k neighbours of each project are
+written to the ``project_related`` table. Serving a request is then a
+single indexed lookup.
+
+NumPy is imported inside ``compute_related`` so the API process only loads
+it when the seeder (or a test) rebuilds the table.
+"""
+
+import os
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import Project
+from app.models.project import project_related, project_roles, project_technologies
+
+# Related projects stored per project
+RELATED_TOP_K = int(os.getenv("RELATED_TOP_K", "5"))
+
+# Rows of the similarity matrix computed at once (bounds memory to BLOCK x projects)
+SIMILARITY_BLOCK_ROWS = 512
+
+# Scores are compared at this resolution when ranking
+SCORE_SCALE = 1 << 20
+
+
+def compute_related(
+    memberships: list[set[str]], top_k: int = RELATED_TOP_K
+) -> list[list[tuple[int, float]]]:
+    """
+    Find each item's most similar items by Jaccard similarity of their memberships.
+
+    Items sharing nothing are never related. Ties are broken by position, so
+    earlier items (lower ``order_num``) win.
+
+    Args:
+        memberships: Feature set per item, e.g. ``{"tech:<id>", "role:<id>"}``
+        top_k: Maximum neighbours to keep per item
+
+    Returns:
+        For each item, ``(index, score)`` pairs ordered by descending score
+    """
+    import numpy as np
+
+    count = len(memberships)
+    if count == 0 or top_k <= 0:
+        return [[] for _ in memberships]
+
+    features = {feature: column for column, feature in enumerate(set().union(*memberships))}
+    matrix = np.zeros((count, max(len(features), 1)), dtype=np.float32)
+    for row, item in enumerate(memberships):
+        matrix[row, [features[feature] for feature in item]] = 1.0
+    sizes = matrix.sum(axis=1)
+    positions = np.arange(count)
+
+    # Integer sort keys: quantized score first, earlier position on ties. Unique
+    # keys let argpartition pick the exact top-k without sorting whole rows.
+    keep = min(top_k, count)
+    related = []
+    for start in range(0, count, SIMILARITY_BLOCK_ROWS):
+        block = matrix[start : start + SIMILARITY_BLOCK_ROWS]
+        rows = np.arange(len(block))
+        intersection = block @ matrix.T
+        union = sizes[start : start + len(block), None] + sizes[None, :] - intersection
+        scores = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+        # An item is never related to itself
+        scores[rows, positions[start : start + len(block)]] = 0.0
+
+        keys = np.rint(scores * SCORE_SCALE).astype(np.int64) * count - positions
+        candidates = np.argpartition(-keys, keep - 1, axis=1)[:, :keep]
+        ranked = np.take_along_axis(
+            candidates, np.argsort(-np.take_along_axis(keys, candidates, axis=1), axis=1), axis=1
+        )
+        for row, indices in zip(rows, ranked):
+            related.append(
+                [
+                    (int(index), float(scores[row, index]))
+                    for index in indices
+                    if scores[row, index] > 0
+                ]
+            )
+    return related
+
+
+def rebuild_related_projects(db: Session, top_k: int = RELATED_TOP_K) -> int:
+    """
+    Recompute the ``project_related`` table from current memberships.
+
+    Args:
+        db: Database session (committed on success)
+        top_k: Related projects to store per project
+
+    Returns:
+        Number of rows written
+    """
+    project_ids = list(db.scalars(select(Project.id).order_by(Project.order_num, Project.id)))
+    memberships = {project_id: set() for project_id in project_ids}
+    for project_id, technology_id in db.execute(select(project_technologies)):
+        memberships[project_id].add(f"tech:{technology_id}")
+    for project_id, role_id in db.execute(select(project_roles)):
+        memberships[project_id].add(f"role:{role_id}")
+
+    related = compute_related([memberships[project_id] for project_id in project_ids], top_k)
+    rows = [
+        {
+            "project_id": project_ids[row],
+            "rank": rank,
+            "related_project_id": project_ids[index],
+            "score": round(score, 6),
+        }
+        for row, neighbours in enumerate(related)
+        for rank, (index, score) in enumerate(neighbours)
+    ]
+
+    db.execute(delete(project_related))
+    if rows:
+        db.execute(insert(project_related), rows)
+    db.commit()
+    return len(rows)
@@ -2,6 +2,8 @@
 Repository layer for database operations.
 """
 
+from app.repositories.json_project_repository import JsonProjectRepository
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.read_model_repository import ReadModelRepository
 
-__all__ = ["ProjectRepository"]
+__all__ = ["ProjectRepository", "JsonProjectRepository", "ReadModelRepository"]
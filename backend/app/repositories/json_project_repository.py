@@ -0,0 +1,131 @@
+"""
+Repository that has SQLite compose project response JSON directly.
+"""
+
+from typing import Optional
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.orm import Session
+
+from app.models import Project, ProjectImage, Role, Technology
+from app.models.project import project_roles, project_technologies
+
+
+def _json_array(*columns, from_, where, order_by=None):
+    """
+    Correlated ``json_group_array(json_object(...))`` over ``from_`` rows.
+
+    ``columns`` are ``(key, column)`` pairs. Rows are ordered in an inner
+    subquery because ``json_group_array`` aggregates in scan order.
+    """
+    inner = select(*(column.label(key) for key, column in columns)).select_from(from_).where(where)
+    if order_by is not None:
+        inner = inner.order_by(order_by)
+    inner = inner.correlate(Project).subquery()
+
+    pairs = []
+    for key, _ in columns:
+        pairs.extend([key, inner.c[key]])
+    return func.json(select(func.json_group_array(func.json_object(*pairs))).scalar_subquery())
+
+
+# Nested collections, keyed with the ProjectResponse aliases
+_roles_json = _json_array(
+    ("id", Role.id),
+    ("name", Role.name),
+    from_=project_roles.join(Role, Role.id == project_roles.c.role_id),
+    where=project_roles.c.project_id == Project.id,
+)
+_technologies_json = _json_array(
+    ("id", Technology.id),
+    ("name", Technology.name),
+    from_=project_technologies.join(
+        Technology, Technology.id == project_technologies.c.technology_id
+    ),
+    where=project_technologies.c.project_id == Project.id,
+)
+_images_json = _json_array(
+    ("id", ProjectImage.id),
+    ("projectId", ProjectImage.project_id),
+    ("url", ProjectImage.url),
+    ("altText", ProjectImage.alt_text),
+    ("order", ProjectImage.order_num),
+    from_=ProjectImage.__table__,
+    where=ProjectImage.project_id == Project.id,
+    order_by=ProjectImage.order_num,
+)
+
+# One ProjectResponse document per projects row, keys in schema field order
+_project_json = func.json_object(
+    "id", Project.id,
+    "title", Project.title,
+    "slug", Project.slug,
+    "summary", Project.summary,
+    "description", Project.description,
+    "liveUrl", Project.live_url,
+    "githubUrl", Project.github_url,
+    "roles", _roles_json,
+    "technologies", _technologies_json,
+    "images", _images_json,
+)  # fmt: skip
+
+
+class JsonProjectRepository:
+    """
+    Read-only project repository returning response JSON built by SQLite.
+
+    Skips ORM hydration and Pydantic serialization entirely: correlated
+    ``json_group_array`` subqueries render technologies, roles and ordered
+    images, and the result is the final response body.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def get_all_projects_json(self) -> bytes:
+        """
+        Render every project as a JSON array, ordered by order_num.
+
+        Returns:
+            JSON bytes matching ``list[ProjectResponse]``
+        """
+        documents = select(_project_json.label("doc")).order_by(Project.order_num).subquery()
+        statement = select(
+            func.coalesce(func.json_group_array(func.json(documents.c.doc)), literal_column("'[]'"))
+        )
+        return self.db.execute(statement).scalar_one().encode()
+
+    def get_project_json_by_slug(self, slug: str) -> Optional[bytes]:
+        """
+        Render a single project by slug.
+
+        Args:
+            slug: The project slug to search for
+
+        Returns:
+            JSON bytes matching ``ProjectResponse`` if found, None otherwise
+        """
+        statement = select(_project_json).where(Project.slug == slug).limit(1)
+        document = self.db.execute(statement).scalar_one_or_none()
+        return document.encode() if document is not None else None
+
+    def get_projects_json_by_slugs(self, slugs: list[str]) -> dict[str, bytes]:
+        """
+        Render several projects by slug with one ``IN`` query.
+
+        Args:
+            slugs: Project slugs to look up
+
+        Returns:
+            JSON bytes matching ``ProjectResponse``, keyed by the slugs found
+        """
+        if not slugs:
+            return {}
+        statement = select(Project.slug, _project_json).where(Project.slug.in_(slugs))
+        return {slug: document.encode() for slug, document in self.db.execute(statement)}
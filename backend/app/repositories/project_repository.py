@@ -4,9 +4,11 @@ Repository for project data access operations.
 
 from typing import Optional
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models import Project
+from app.models.project import project_related
 
 
 class ProjectRepository:
@@ -59,3 +61,93 @@ class ProjectRepository:
             .filter(Project.slug == slug)
             .first()
         )
+
+    def get_projects_page(self, after: Optional[tuple[int, str]], limit: int) -> list[Project]:
+        """
+        Retrieve the next page of projects in list order using keyset pagination.
+
+        Pages are located through the ``(order_num, id)`` index, so fetching a
+        page costs the same however deep into the catalog it is.
+
+        Args:
+            after: ``(order_num, id)`` of the last project of the previous page,
+                or None for the first page
+            limit: Maximum projects to return
+
+        Returns:
+            Project models ordered by ``order_num`` then ``id``
+        """
+        query = (
+            select(Project)
+            .options(
+                selectinload(Project.technologies),
+                selectinload(Project.roles),
+                selectinload(Project.images),
+            )
+            .order_by(Project.order_num, Project.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(tuple_(Project.order_num, Project.id) > after)
+        return list(self.db.scalars(query))
+
+    def get_projects_by_slugs(self, slugs: list[str]) -> list[Project]:
+        """
+        Retrieve several projects by slug in one ``IN`` query.
+
+        Collections are loaded with ``selectinload`` (one extra ``IN`` query
+        each) rather than joined, so the cost stays flat as the batch grows.
+
+        Args:
+            slugs: Project slugs to look up
+
+        Returns:
+            Project models found, in no particular order
+        """
+        if not slugs:
+            return []
+        query = (
+            select(Project)
+            .options(
+                selectinload(Project.technologies),
+                selectinload(Project.roles),
+                selectinload(Project.images),
+            )
+            .where(Project.slug.in_(slugs))
+        )
+        return list(self.db.scalars(query))
+
+    def get_related_projects(self, slug: str) -> Optional[list]:
+        """
+        Retrieve the precomputed related projects for a slug in one indexed lookup.
+
+        Args:
+            slug: The project slug to find neighbours for
+
+        Returns:
+            Rows with id, title, slug, summary and score ordered by rank
+            (empty if none were stored), or None if the slug is unknown
+        """
+        projects = Project.__table__
+        related = projects.alias("related")
+        query = (
+            select(
+                projects.c.id.label("source_id"),
+                related.c.id,
+                related.c.title,
+                related.c.slug,
+                related.c.summary,
+                project_related.c.score,
+            )
+            .select_from(
+                projects.outerjoin(
+                    project_related, project_related.c.project_id == projects.c.id
+                ).outerjoin(related, related.c.id == project_related.c.related_project_id)
+            )
+            .where(projects.c.slug == slug)
+            .order_by(project_related.c.rank)
+        )
+        rows = self.db.execute(query).all()
+        if not rows:
+            return None
+        return [row for row in rows if row.id is not None]
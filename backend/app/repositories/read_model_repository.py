@@ -0,0 +1,131 @@
+"""
+Repository returning slotted read models built from Core ``select()`` rows.
+"""
+
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Project, ProjectImage, Role, Technology
+from app.models.project import project_roles, project_technologies
+from app.read_models import ProjectImageRead, ProjectRead, RoleRead, TechnologyRead
+
+projects_table = Project.__table__
+images_table = ProjectImage.__table__
+roles_table = Role.__table__
+technologies_table = Technology.__table__
+
+
+class ReadModelRepository:
+    """
+    Read-only project repository that bypasses the ORM identity map.
+
+    Loads projects and each related table with one Core query apiece and
+    stitches them into frozen ``ProjectRead`` instances.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def get_all_projects(self) -> list[ProjectRead]:
+        """
+        Retrieve all projects with related data.
+
+        Returns:
+            List of ProjectRead models ordered by order_num
+        """
+        query = select(projects_table).order_by(projects_table.c.order_num)
+        return self._load(query, all_projects=True)
+
+    def get_project_by_slug(self, slug: str) -> Optional[ProjectRead]:
+        """
+        Retrieve a single project by slug with related data.
+
+        Args:
+            slug: The project slug to search for
+
+        Returns:
+            ProjectRead if found, None otherwise
+        """
+        query = select(projects_table).where(projects_table.c.slug == slug).limit(1)
+        projects = self._load(query)
+        return projects[0] if projects else None
+
+    def get_projects_by_slugs(self, slugs: list[str]) -> list[ProjectRead]:
+        """
+        Retrieve several projects by slug with one ``IN`` query plus one per relation.
+
+        Args:
+            slugs: Project slugs to look up
+
+        Returns:
+            ProjectRead models found, in no particular order
+        """
+        if not slugs:
+            return []
+        return self._load(select(projects_table).where(projects_table.c.slug.in_(slugs)))
+
+    def _load(self, project_query, all_projects: bool = False) -> list[ProjectRead]:
+        project_rows = self.db.execute(project_query).all()
+        if not project_rows:
+            return []
+
+        ids = None if all_projects else [row.id for row in project_rows]
+        roles = self._related_names(project_roles, roles_table, "role_id", RoleRead, ids)
+        technologies = self._related_names(
+            project_technologies, technologies_table, "technology_id", TechnologyRead, ids
+        )
+        images = self._images(ids)
+
+        return [
+            ProjectRead(
+                id=row.id,
+                title=row.title,
+                slug=row.slug,
+                summary=row.summary,
+                description=row.description,
+                live_url=row.live_url,
+                github_url=row.github_url,
+                order_num=row.order_num,
+                roles=tuple(roles.get(row.id, ())),
+                technologies=tuple(technologies.get(row.id, ())),
+                images=tuple(images.get(row.id, ())),
+            )
+            for row in project_rows
+        ]
+
+    def _related_names(self, link_table, target_table, target_key, read_model, ids):
+        query = select(link_table.c.project_id, target_table.c.id, target_table.c.name).join(
+            target_table, target_table.c.id == link_table.c[target_key]
+        )
+        if ids is not None:
+            query = query.where(link_table.c.project_id.in_(ids))
+
+        grouped = defaultdict(list)
+        for project_id, item_id, name in self.db.execute(query):
+            grouped[project_id].append(read_model(item_id, name))
+        return grouped
+
+    def _images(self, ids):
+        query = select(
+            images_table.c.id,
+            images_table.c.project_id,
+            images_table.c.url,
+            images_table.c.alt_text,
+            images_table.c.order_num,
+        ).order_by(images_table.c.project_id, images_table.c.order_num)
+        if ids is not None:
+            query = query.where(images_table.c.project_id.in_(ids))
+
+        grouped = defaultdict(list)
+        for row in self.db.execute(query):
+            grouped[row.project_id].append(ProjectImageRead(*row))
+        return grouped
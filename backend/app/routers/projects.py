@@ -2,34 +2,373 @@
 API router for project endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.database import get_db
-from app.repositories.project_repository import ProjectRepository
-from app.schemas import ProjectDetailResponse, ProjectResponse
+from app.cache import CachedPayload, negotiated_response, response_cache, single_flight
+from app.catalog_versions import get_changes
+from app.database import database_generation, get_db, refresh_database
+from app.events import catalog_events
+from app.formats import JSON, convert_json, negotiate_format
+from app.middleware.load_shedding import request_limiter
+from app.preload import preload_headers
+from app.read_models import dump_read_project_json, dump_read_projects_json
+from app.repositories import JsonProjectRepository, ProjectRepository, ReadModelRepository
+from app.schemas import (
+    CatalogChangesResponse,
+    ProjectBatchResponse,
+    ProjectDetailResponse,
+    ProjectResponse,
+    RelatedProjectResponse,
+    dump_project_json,
+    dump_projects_json,
+    dump_related_json,
+)
+from app.snapshot import SnapshotPayload, catalog_snapshot
 
 router = APIRouter()
 
+# Response cache keys
+PROJECT_LIST_KEY = "projects:list"
+PROJECT_DETAIL_KEY = "projects:detail:{slug}"
+PROJECT_RELATED_KEY = "projects:related:{slug}"
+
+# How cache misses are rendered: "orm" (SQLAlchemy models + Pydantic),
+# "readmodel" (Core rows into slotted dataclasses) or "json" (SQLite builds
+# the response document with json_group_array)
+PROJECT_BACKEND = os.getenv("PROJECT_BACKEND", "orm")
+
+# Upper bound on slugs accepted by one batch lookup
+MAX_BATCH_SLUGS = 50
+
+# Projects fetched per query by the NDJSON export
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "200"))
+
+
+def render_project_list(db: Session, backend: Optional[str] = None) -> bytes:
+    """Serialize every project to response JSON using ``backend`` (default: configured)."""
+    backend = backend or PROJECT_BACKEND
+    if backend == "json":
+        return JsonProjectRepository(db).get_all_projects_json()
+    if backend == "readmodel":
+        return dump_read_projects_json(ReadModelRepository(db).get_all_projects())
+    return dump_projects_json(ProjectRepository(db).get_all_projects())
+
+
+def render_project(db: Session, slug: str, backend: Optional[str] = None) -> Optional[bytes]:
+    """Serialize one project to response JSON, or None if the slug is unknown."""
+    backend = backend or PROJECT_BACKEND
+    if backend == "json":
+        return JsonProjectRepository(db).get_project_json_by_slug(slug)
+    if backend == "readmodel":
+        read_model = ReadModelRepository(db).get_project_by_slug(slug)
+        return dump_read_project_json(read_model) if read_model is not None else None
+    project = ProjectRepository(db).get_project_by_slug(slug)
+    return dump_project_json(project) if project is not None else None
+
+
+def render_projects_by_slugs(
+    db: Session, slugs: list[str], backend: Optional[str] = None
+) -> dict[str, bytes]:
+    """Serialize the projects among ``slugs`` with one ``IN`` query, keyed by slug."""
+    backend = backend or PROJECT_BACKEND
+    if backend == "json":
+        return JsonProjectRepository(db).get_projects_json_by_slugs(slugs)
+    if backend == "readmodel":
+        projects = ReadModelRepository(db).get_projects_by_slugs(slugs)
+        return {project.slug: dump_read_project_json(project) for project in projects}
+    projects = ProjectRepository(db).get_projects_by_slugs(slugs)
+    return {project.slug: dump_project_json(project) for project in projects}
+
+
+def render_export_page(
+    db: Session, after: Optional[tuple[int, str]]
+) -> tuple[bytes, Optional[tuple[int, str]]]:
+    """
+    Serialize the next page of projects as NDJSON lines.
+
+    Args:
+        db: Database session; closed afterwards so no connection is held
+            while the client reads the page
+        after: Keyset position returned for the previous page (None to start)
+
+    Returns:
+        The lines, and the position to continue from (None after the last page)
+    """
+    try:
+        projects = ProjectRepository(db).get_projects_page(after, EXPORT_PAGE_SIZE)
+        body = b"".join(dump_project_json(project) + b"\n" for project in projects)
+    finally:
+        db.close()
+    if len(projects) < EXPORT_PAGE_SIZE:
+        return body, None
+    return body, (projects[-1].order_num, projects[-1].id)
+
+
+async def stream_projects_ndjson(db: Session) -> AsyncIterator[bytes]:
+    """
+    Yield the catalog one page of NDJSON lines at a time, rendered off the event loop.
 
-@router.get("/projects", response_model=list[ProjectResponse])
-async def get_projects(db: Session = Depends(get_db)):
+    The request's concurrency slot is freed once the response starts, so each
+    page query takes one of its own; writing a page to a slow client holds none.
+    """
+    after = None
+    while True:
+        async with request_limiter.slot():
+            body, after = await run_in_threadpool(render_export_page, db, after)
+        if body:
+            yield body
+        if after is None:
+            return
+
+
+@contextmanager
+def render_session(request: Request) -> Iterator[Session]:
+    """
+    Open a session owned by a coalesced render rather than by one request.
+
+    A shared render keeps running when the request that started it is
+    cancelled, after ``get_db`` has closed that request's session, so it
+    opens its own through the same dependency (including test overrides).
+    """
+    provider = request.app.dependency_overrides.get(get_db, get_db)
+    sessions = provider()
+    try:
+        yield next(sessions)
+    finally:
+        sessions.close()
+
+
+def cache_rendered(
+    key: str, body: bytes, generation: int, headers: Optional[dict[str, str]] = None
+) -> CachedPayload:
+    """
+    Cache a rendered body, unless the database was swapped while it rendered.
+
+    A render that started before a reseed can finish after the swap cleared
+    the cache; storing it would bring the previous catalog back. It is still
+    returned to its own callers, uncached.
+
+    Args:
+        key: Response cache key
+        body: Rendered JSON document
+        generation: ``database_generation()`` when the render started
+        headers: Extra response headers stored with the body
+
+    Returns:
+        The cached payload, or an uncached one for a stale render
+    """
+    if database_generation() != generation:
+        return CachedPayload(body, headers=headers)
+    return response_cache.get_or_create(key, lambda: body, headers=headers)
+
+
+def cache_project_detail(slug: str, body: bytes, generation: int) -> CachedPayload:
+    """Cache a rendered project detail document together with its preload ``Link`` header."""
+    return cache_rendered(
+        PROJECT_DETAIL_KEY.format(slug=slug), body, generation, headers=preload_headers(body)
+    )
+
+
+def parse_slugs(raw: str) -> list[str]:
+    """Split a comma-separated slug list, dropping blanks and duplicates but keeping order."""
+    return list(dict.fromkeys(slug.strip() for slug in raw.split(",") if slug.strip()))
+
+
+def snapshot_payload(key: str) -> Optional[SnapshotPayload]:
+    """Return the payload for ``key`` from the shared catalog snapshot, if one is mapped."""
+    snapshot = catalog_snapshot.current() if catalog_snapshot is not None else None
+    return snapshot.payload(key) if snapshot is not None else None
+
+
+@router.get(
+    "/projects",
+    response_model=list[ProjectResponse],
+    dependencies=[Depends(refresh_database)],
+)
+async def get_projects(request: Request):
     """
     Retrieve all projects with related technologies, roles, links, and images.
 
+    Served from the shared catalog snapshot when one is configured; otherwise
+    the serialized list (and its compressed variants) is cached after the
+    first request. Concurrent misses share one render, run off the event loop
+    with a session of its own.
+    Like the other project endpoints, it answers in MessagePack or CBOR when
+    ``Accept`` prefers them, converting and caching each format once.
+
     Returns:
-        List of projects ordered by creation date (newest first)
+        List of projects ordered by order_num
     """
-    repo = ProjectRepository(db)
-    projects = repo.get_all_projects()
-    return projects
+    payload = snapshot_payload(PROJECT_LIST_KEY) or response_cache.get(PROJECT_LIST_KEY)
+    if payload is None:
+
+        def load() -> CachedPayload:
+            with render_session(request) as db:
+                generation = database_generation()
+                body = render_project_list(db)
+            return cache_rendered(PROJECT_LIST_KEY, body, generation)
 
+        payload = await single_flight.do(PROJECT_LIST_KEY, load)
+    return await negotiated_response(PROJECT_LIST_KEY, payload, request)
 
-@router.get("/projects/{slug}", response_model=ProjectDetailResponse)
-async def get_project_by_slug(slug: str, db: Session = Depends(get_db)):
+
+# Fixed paths are declared before /projects/{slug} so they are not read as slugs
+@router.get("/projects/changes", response_model=CatalogChangesResponse)
+async def get_catalog_changes(
+    since: int = Query(0, ge=0, description="Catalog version the client last synced to"),
+    db: Session = Depends(get_db),
+):
+    """
+    List project slugs upserted or deleted after catalog version ``since``.
+
+    Clients fetch the changed slugs (e.g. through ``/projects/batch``) and
+    drop the deleted ones instead of re-downloading the whole catalog.
+
+    Args:
+        since: Catalog version the client last synced to (0 for everything)
+
+    Returns:
+        Current catalog version with the upserted and deleted slugs; ``reset``
+        is true when ``since`` is ahead of this catalog and the client should
+        replace its copy with the upserted slugs
+    """
+    version, upserted, deleted = await run_in_threadpool(get_changes, db, since)
+    reset = since > version
+    if reset:
+        version, upserted, _ = await run_in_threadpool(get_changes, db, 0)
+        deleted = []
+    return CatalogChangesResponse(version=version, upserted=upserted, deleted=deleted, reset=reset)
+
+
+@router.get("/projects/export.ndjson", response_class=StreamingResponse)
+async def export_projects_ndjson(db: Session = Depends(get_db)):
+    """
+    Stream every project as newline-delimited JSON, one project per line.
+
+    Projects are read in keyset-paginated pages of ``EXPORT_PAGE_SIZE`` and
+    each page is sent as soon as it is rendered, so memory use and time to
+    first byte do not grow with the catalog. Each page is its own short read,
+    so a reseed during the stream is picked up without repeating or skipping
+    projects that exist in both catalogs.
+
+    Returns:
+        ``application/x-ndjson`` response in ``/projects`` order
+    """
+    # The dependency closes the session before the body is sent; each page
+    # reopens it for one query and closes it again
+    return StreamingResponse(stream_projects_ndjson(db), media_type="application/x-ndjson")
+
+
+@router.get("/projects/events", response_class=StreamingResponse)
+async def get_catalog_events(request: Request):
+    """
+    Stream catalog version changes as Server-Sent Events.
+
+    Emits a ``version`` event on connect (unless ``Last-Event-ID`` is already
+    current) and whenever a reseed produces a new catalog version, with
+    heartbeat comments in between.
+
+    Returns:
+        ``text/event-stream`` response
+
+    Raises:
+        HTTPException: 503 if this worker is at its event stream limit
+    """
+    if catalog_events.is_full():
+        raise HTTPException(
+            status_code=503, detail="Too many event streams", headers={"Retry-After": "5"}
+        )
+    return StreamingResponse(
+        catalog_events.stream(request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        # X-Accel-Buffering stops nginx from holding events back
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/projects/batch", response_model=ProjectBatchResponse)
+async def get_projects_batch(
+    request: Request,
+    slugs: str = Query(..., description="Comma-separated project slugs"),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve several projects by slug in one request.
+
+    Slugs already in the snapshot or response cache are served from there;
+    the rest are loaded together with one ``IN`` query (through the
+    configured ``PROJECT_BACKEND``) and cached as detail payloads. The
+    stitched response is converted to MessagePack/CBOR when ``Accept`` asks
+    for it.
+
+    Args:
+        slugs: Comma-separated project slugs, e.g. ``a,b,c``
+
+    Returns:
+        Projects in the requested order, plus the slugs that were not found
+
+    Raises:
+        HTTPException: 400 if no slugs or more than ``MAX_BATCH_SLUGS`` are given
+    """
+    requested = parse_slugs(slugs)
+    if not requested:
+        raise HTTPException(status_code=400, detail="No slugs given")
+    if len(requested) > MAX_BATCH_SLUGS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_BATCH_SLUGS} slugs can be requested at once"
+        )
+
+    bodies = {}
+    for slug in requested:
+        key = PROJECT_DETAIL_KEY.format(slug=slug)
+        payload = snapshot_payload(key) or response_cache.get(key)
+        if payload is not None:
+            bodies[slug] = payload.body
+
+    misses = [slug for slug in requested if slug not in bodies]
+    if misses:
+
+        def load() -> dict[str, bytes]:
+            generation = database_generation()
+            rendered = render_projects_by_slugs(db, misses)
+            return {
+                slug: cache_project_detail(slug, body, generation).body
+                for slug, body in rendered.items()
+            }
+
+        bodies.update(await run_in_threadpool(load))
+
+    # Stitch the cached detail documents together instead of re-serializing them
+    found = b",".join(bodies[slug] for slug in requested if slug in bodies)
+    missing = to_json([slug for slug in requested if slug not in bodies])
+    content = b'{"projects":[' + found + b'],"missing":' + missing + b"}"
+    media_type = negotiate_format(request.headers.get("accept"))
+    if media_type != JSON:
+        content = await run_in_threadpool(convert_json, content, media_type)
+    return Response(content=content, media_type=media_type, headers={"Vary": "Accept"})
+
+
+@router.get(
+    "/projects/{slug}",
+    response_model=ProjectDetailResponse,
+    dependencies=[Depends(refresh_database)],
+)
+async def get_project_by_slug(slug: str, request: Request):
     """
     Retrieve a single project by its slug with all related data.
 
+    The first ``PRELOAD_IMAGE_COUNT`` images are also advertised in a
+    ``Link: rel=preload`` header, computed once with the cached payload, so
+    clients can fetch them while the JSON is still being parsed.
+
     Args:
         slug: The unique slug identifier for the project
 
@@ -39,10 +378,68 @@ async def get_project_by_slug(slug: str, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 404 if project with given slug is not found
     """
-    repo = ProjectRepository(db)
-    project = repo.get_project_by_slug(slug)
+    key = PROJECT_DETAIL_KEY.format(slug=slug)
+    payload = snapshot_payload(key) or response_cache.get(key)
+    if payload is None:
 
-    if project is None:
+        def load() -> Optional[CachedPayload]:
+            with render_session(request) as db:
+                generation = database_generation()
+                body = render_project(db, slug)
+            # Unknown slugs are not cached, but concurrent lookups still share one query
+            return cache_project_detail(slug, body, generation) if body is not None else None
+
+        payload = await single_flight.do(key, load)
+
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Project with slug '{slug}' not found")
+    return await negotiated_response(key, payload, request)
+
+
+@router.get(
+    "/projects/{slug}/related",
+    response_model=list[RelatedProjectResponse],
+    dependencies=[Depends(refresh_database)],
+)
+async def get_related_projects(slug: str, request: Request):
+    """
+    Retrieve projects similar to the given one.
+
+    Similarity (Jaccard over shared technologies and roles) is precomputed
+    at seed time, so this is a single indexed lookup, cached afterwards.
+
+    Args:
+        slug: The unique slug identifier for the project
+
+    Returns:
+        Related projects ordered by descending similarity score
+
+    Raises:
+        HTTPException: 404 if project with given slug is not found
+    """
+    key = PROJECT_RELATED_KEY.format(slug=slug)
+    payload = response_cache.get(key)
+    if payload is None:
+
+        def load() -> Optional[CachedPayload]:
+            with render_session(request) as db:
+                generation = database_generation()
+                related = ProjectRepository(db).get_related_projects(slug)
+                if related is None:
+                    return None
+                body = dump_related_json(related)
+            return cache_rendered(key, body, generation)
+
+        payload = await single_flight.do(key, load)
+
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"Project with slug '{slug}' not found")
+    return await negotiated_response(key, payload, request)
+
 
-    return project
+# Slugs /projects/{slug} can never serve because a fixed path above shadows them
+RESERVED_SLUGS = frozenset(
+    route.path.removeprefix("/projects/")
+    for route in router.routes
+    if route.path.count("/") == 2 and route.path.startswith("/projects/") and "{" not in route.path
+)
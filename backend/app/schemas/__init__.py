@@ -3,11 +3,17 @@ Pydantic schemas for API request/response models.
 """
 
 from app.schemas.project import (
+    CatalogChangesResponse,
+    ProjectBatchResponse,
     ProjectDetailResponse,
     ProjectImageSchema,
     ProjectResponse,
+    RelatedProjectResponse,
     RoleSchema,
     TechnologySchema,
+    dump_project_json,
+    dump_projects_json,
+    dump_related_json,
 )
 
 __all__ = [
@@ -16,4 +22,10 @@ __all__ = [
     "ProjectImageSchema",
     "ProjectResponse",
     "ProjectDetailResponse",
+    "ProjectBatchResponse",
+    "RelatedProjectResponse",
+    "CatalogChangesResponse",
+    "dump_project_json",
+    "dump_projects_json",
+    "dump_related_json",
 ]
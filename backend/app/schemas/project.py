@@ -2,9 +2,9 @@
 Pydantic schemas for project API responses.
 """
 
-from typing import Optional
+from typing import Any, Iterable, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class TechnologySchema(BaseModel):
@@ -56,3 +56,78 @@ class ProjectResponse(BaseModel):
 
 # Alias for semantic clarity in endpoint definitions
 ProjectDetailResponse = ProjectResponse
+
+
+class ProjectBatchResponse(BaseModel):
+    """Schema for a batch lookup of several projects by slug."""
+
+    projects: list[ProjectResponse] = Field(default_factory=list)
+    missing: list[str] = Field(default_factory=list)
+
+
+class CatalogChangesResponse(BaseModel):
+    """Schema for the slugs changed since a catalog version."""
+
+    version: int
+    upserted: list[str] = Field(default_factory=list)
+    deleted: list[str] = Field(default_factory=list)
+    reset: bool = False
+
+
+class RelatedProjectResponse(BaseModel):
+    """Schema for a project recommended alongside another."""
+
+    id: str
+    title: str
+    slug: str
+    summary: str
+    score: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+_project_adapter = TypeAdapter(ProjectResponse)
+_project_list_adapter = TypeAdapter(list[ProjectResponse])
+_related_list_adapter = TypeAdapter(list[RelatedProjectResponse])
+
+
+def dump_project_json(project: Any) -> bytes:
+    """
+    Serialize one project (ORM object or mapping) to response JSON bytes.
+
+    Args:
+        project: Object readable as ``ProjectResponse``
+
+    Returns:
+        JSON bytes using the public field aliases
+    """
+    validated = _project_adapter.validate_python(project, from_attributes=True)
+    return _project_adapter.dump_json(validated, by_alias=True)
+
+
+def dump_projects_json(projects: Iterable[Any]) -> bytes:
+    """
+    Serialize a list of projects to response JSON bytes.
+
+    Args:
+        projects: Objects readable as ``ProjectResponse``
+
+    Returns:
+        JSON array bytes using the public field aliases
+    """
+    validated = _project_list_adapter.validate_python(list(projects), from_attributes=True)
+    return _project_list_adapter.dump_json(validated, by_alias=True)
+
+
+def dump_related_json(related: Iterable[Any]) -> bytes:
+    """
+    Serialize related-project rows to response JSON bytes.
+
+    Args:
+        related: Objects readable as ``RelatedProjectResponse``
+
+    Returns:
+        JSON array bytes
+    """
+    validated = _related_list_adapter.validate_python(list(related), from_attributes=True)
+    return _related_list_adapter.dump_json(validated)
@@ -0,0 +1,156 @@
+"""
+Pre-fork server: import and warm the application once, then fork workers.
+
+``uvicorn --workers N`` spawns fresh interpreters that each re-import FastAPI,
+SQLAlchemy, Pydantic and the app. Here the parent does that work once, binds
+the listening socket and forks uvicorn workers that inherit the warmed state
+through copy-on-write. Dead workers are re-forked from the same warm parent.
+
+Usage:
+    python -m app.server --host 127.0.0.1 --port 8000 --workers 2
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+# Workers that exit sooner than this after being forked are treated as a crash loop
+MIN_WORKER_LIFETIME = 1.0
+
+
+def warm_up():
+    """
+    Import the app and build lazily-initialised state before forking.
+
+    Returns:
+        The ASGI application
+    """
+    from sqlalchemy.orm import configure_mappers
+
+    from app.database import SessionLocal, engine
+    from app.main import app
+    from app.snapshot import CATALOG_SNAPSHOT_PATH, build_snapshot
+
+    configure_mappers()
+    app.openapi()
+
+    if CATALOG_SNAPSHOT_PATH:
+        # Serialize the catalog once here; every worker maps the same file
+        with SessionLocal() as db:
+            build_snapshot(db, CATALOG_SNAPSHOT_PATH)
+
+    # Connections must not be shared across fork; each worker opens its own
+    engine.dispose()
+    return app
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Bind the listening socket in the parent so all workers accept from it."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(config: uvicorn.Config, sock: socket.socket) -> None:
+    """Serve requests in a forked child until signalled to stop."""
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD):
+        signal.signal(sig, signal.SIG_DFL)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Arbiter:
+    """Fork, supervise and stop a fixed number of uvicorn workers."""
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        self.config = config
+        self.sock = sock
+        self.workers = workers
+        self.children: dict[int, float] = {}
+        self.stopping = False
+
+    def spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(self.config, self.sock)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+
+    def stop(self, sig: int, frame=None) -> None:
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        # Move warmed objects out of the GC's generations so collections in
+        # the workers don't touch (and copy) the shared pages
+        gc.freeze()
+        for _ in range(self.workers):
+            self.spawn()
+
+        exit_code = 0
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            if time.monotonic() - started < MIN_WORKER_LIFETIME:
+                print(f"Worker {pid} exited during startup; shutting down", file=sys.stderr)
+                exit_code = 1
+                self.stop(signal.SIGTERM)
+                continue
+            print(f"Worker {pid} exited with status {status}; restarting", file=sys.stderr)
+            self.spawn()
+        return exit_code
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-fork server for the Portfolio API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--no-access-log", dest="access_log", action="store_false")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    app = warm_up()
+    sock = bind_socket(args.host, args.port)
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        log_level=args.log_level,
+        access_log=args.access_log,
+    )
+    print(f"Serving on http://{args.host}:{args.port} with {args.workers} pre-forked workers")
+    sys.exit(Arbiter(config, sock, args.workers).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Memory-mapped catalog snapshot shared by every worker.
+
+The seeder (or the pre-fork parent) serializes the project list and every
+project detail once, with their Brotli/gzip variants, into a single file:
+
+    header | payload bytes ... | JSON offset index
+
+Workers ``mmap`` the file read-only and serve ``memoryview`` slices of it,
+so the pages live once in the OS page cache however many workers run. A new
+snapshot is written to a temporary file and renamed into place with the
+next generation number in its header; readers compare that counter with
+their mapping's and remap when it changed. A snapshot that cannot be mapped
+is logged and skipped: the previous mapping keeps serving, or, without one,
+requests are rendered from the database as if no snapshot were configured.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import DATABASE_REFRESH_INTERVAL
+from app.middleware.compression import MINIMUM_SIZE, SUPPORTED_ENCODINGS, compress
+from app.preload import preload_headers
+
+# Path of the snapshot file; empty disables snapshot serving
+CATALOG_SNAPSHOT_PATH = os.getenv("CATALOG_SNAPSHOT_PATH", "")
+
+# magic, generation, index offset, index length
+SNAPSHOT_MAGIC = b"PFCATv1\0"
+HEADER = struct.Struct("<8sQQQ")
+
+# Key under which the uncompressed body is stored in the index
+IDENTITY = "identity"
+
+# Index key holding a payload's extra response headers (absent when there are none)
+HEADERS = "headers"
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotPayload:
+    """Payload backed by slices of a mapped snapshot (``CachedPayload`` interface)."""
+
+    __slots__ = ("body", "media_type", "headers", "formats", "_encoded")
+
+    def __init__(
+        self,
+        body: memoryview,
+        encoded: dict[str, memoryview],
+        headers: Optional[dict[str, str]] = None,
+        formats: Optional[dict] = None,
+    ):
+        self.body = body
+        self.media_type = "application/json"
+        self.headers = headers or {}
+        # MessagePack/CBOR conversions, shared by every payload for this key
+        # of this snapshot, so they go away when the snapshot is swapped
+        self.formats = formats if formats is not None else {}
+        self._encoded = encoded
+
+    def encoded(self, encoding: str) -> bytes | memoryview:
+        """Return the stored ``encoding`` variant, compressing only if it was not stored."""
+        variant = self._encoded.get(encoding)
+        return variant if variant is not None else compress(bytes(self.body), encoding)
+
+    def has_encoding(self, encoding: str) -> bool:
+        """Whether the ``encoding`` variant is stored in the snapshot."""
+        return encoding in self._encoded
+
+
+class CatalogSnapshot:
+    """Read-only mapping of one snapshot file."""
+
+    def __init__(self, path: str):
+        """
+        Map ``path`` and load its offset index.
+
+        Args:
+            path: Snapshot file written by ``write_snapshot``
+
+        Raises:
+            ValueError: If the file is not a complete catalog snapshot
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is too short for a catalog snapshot")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.generation, index_offset, index_length = HEADER.unpack_from(self._map)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a catalog snapshot")
+        if index_offset + index_length > len(self._map):
+            raise ValueError(f"{path} is truncated")
+        self._view = memoryview(self._map)
+        self._index = json.loads(self._view[index_offset : index_offset + index_length].tobytes())
+        self._formats: dict[str, dict] = {}
+
+    def payload(self, key: str) -> Optional[SnapshotPayload]:
+        """
+        Return the payload stored under ``key`` without copying it.
+
+        Args:
+            key: Response cache key, e.g. ``"projects:list"``
+
+        Returns:
+            SnapshotPayload if the key is in the snapshot, None otherwise
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        slices = {
+            encoding: self._view[span[0] : span[0] + span[1]]
+            for encoding, span in entry.items()
+            if encoding != HEADERS
+        }
+        body = slices.pop(IDENTITY)
+        return SnapshotPayload(body, slices, entry.get(HEADERS), self._formats.setdefault(key, {}))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def read_generation(path: str) -> int:
+    """Return the generation of the snapshot at ``path``, or 0 if there is none."""
+    try:
+        with open(path, "rb") as f:
+            magic, generation, _, _ = HEADER.unpack(f.read(HEADER.size))
+    except (OSError, struct.error):
+        return 0
+    return generation if magic == SNAPSHOT_MAGIC else 0
+
+
+def write_snapshot(
+    path: str,
+    payloads: dict[str, bytes],
+    headers: Optional[dict[str, dict[str, str]]] = None,
+) -> int:
+    """
+    Atomically write a snapshot of ``payloads`` to ``path``.
+
+    Args:
+        path: Destination snapshot file
+        payloads: Response cache keys mapped to serialized JSON bodies
+        headers: Extra response headers for some of the keys
+
+    Returns:
+        The generation number of the new snapshot
+    """
+    generation = read_generation(path) + 1
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".snapshot-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0" * HEADER.size)
+            index = {}
+            for key, body in payloads.items():
+                variants = {IDENTITY: body}
+                if len(body) >= MINIMUM_SIZE:
+                    variants.update({enc: compress(body, enc) for enc in SUPPORTED_ENCODINGS})
+                entry = {}
+                for encoding, data in variants.items():
+                    entry[encoding] = (f.tell(), len(data))
+                    f.write(data)
+                if headers and headers.get(key):
+                    entry[HEADERS] = headers[key]
+                index[key] = entry
+
+            index_bytes = json.dumps(index, separators=(",", ":")).encode()
+            index_offset = f.tell()
+            f.write(index_bytes)
+            f.seek(0)
+            f.write(HEADER.pack(SNAPSHOT_MAGIC, generation, index_offset, len(index_bytes)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return generation
+
+
+def build_snapshot(db: Session, path: str) -> int:
+    """
+    Render the list and every project detail from ``db`` into a snapshot.
+
+    Args:
+        db: Database session
+        path: Destination snapshot file
+
+    Returns:
+        The generation number of the new snapshot
+    """
+    from app.models import Project
+    from app.routers.projects import (
+        PROJECT_DETAIL_KEY,
+        PROJECT_LIST_KEY,
+        render_project,
+        render_project_list,
+    )
+
+    payloads = {PROJECT_LIST_KEY: render_project_list(db)}
+    headers = {}
+    for slug in db.scalars(select(Project.slug).order_by(Project.order_num)):
+        key = PROJECT_DETAIL_KEY.format(slug=slug)
+        payloads[key] = render_project(db, slug)
+        headers[key] = preload_headers(payloads[key])
+    return write_snapshot(path, payloads, headers)
+
+
+class SnapshotReader:
+    """Tracks the current snapshot at a path and remaps it when its generation changes."""
+
+    def __init__(self, path: str, refresh_interval: float = DATABASE_REFRESH_INTERVAL):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._failed_generation: Optional[int] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        """
+        Return the mapped snapshot, remapping if a new generation was written.
+
+        The header is read at most once per ``refresh_interval`` seconds.
+        Payloads from a replaced snapshot stay valid until released, since
+        their memoryviews keep the old mapping alive.
+
+        Returns:
+            The current snapshot, or None if no usable snapshot file exists
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.refresh_interval:
+            return self._snapshot
+
+        with self._lock:
+            if now - self._last_check >= self.refresh_interval:
+                self._last_check = now
+                self._refresh()
+        return self._snapshot
+
+    def _refresh(self) -> None:
+        if not os.path.exists(self.path):
+            self._snapshot = None
+            return
+        generation = read_generation(self.path)
+        if self._snapshot is not None and self._snapshot.generation == generation:
+            return
+        if generation == self._failed_generation:
+            # Already reported; wait for the next write
+            return
+        try:
+            self._snapshot = CatalogSnapshot(self.path)
+            self._failed_generation = None
+        except (OSError, ValueError) as e:
+            self._failed_generation = generation
+            fallback = (
+                f"keeping generation {self._snapshot.generation}"
+                if self._snapshot is not None
+                else "rendering from the database"
+            )
+            logger.error("Cannot map catalog snapshot %s (%s); %s", self.path, e, fallback)
+
+
+# Process-wide reader used by the project endpoints (None when disabled)
+catalog_snapshot = SnapshotReader(CATALOG_SNAPSHOT_PATH) if CATALOG_SNAPSHOT_PATH else None
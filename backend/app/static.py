@@ -0,0 +1,246 @@
+"""
+Static media serving with precompressed variants.
+"""
+
+import os
+import stat
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Optional
+
+import anyio
+from fastapi import HTTPException
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Receive, Scope, Send
+
+from app.media_index import ENCODING_SUFFIXES, MediaEntry, MediaIndex, make_entry
+from app.middleware.compression import compress, is_compressible, negotiate_encoding
+
+# Build-time levels: spend CPU once so requests spend none
+PRECOMPRESS_LEVELS = {"br": 11, "gzip": 9}
+
+
+class IndexedFileResponse(FileResponse):
+    """
+    ``FileResponse`` for a ``MediaIndex`` entry that rechecks the file before sending it.
+
+    A file replaced without touching the stamp no longer matches its entry;
+    sending the entry's size as Content-Length would truncate or overrun the
+    body. When size or mtime differ, headers come from the current file and
+    the index is marked stale.
+    """
+
+    def __init__(self, entry: MediaEntry, index: MediaIndex, **kwargs):
+        super().__init__(entry.path, stat_result=entry.stat_result, **kwargs)
+        self.entry = entry
+        self.index = index
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            current = await anyio.to_thread.run_sync(os.stat, self.path)
+        except FileNotFoundError:
+            self.index.mark_stale()
+            await Response(status_code=404)(scope, receive, send)
+            return
+        if (current.st_size, current.st_mtime_ns) != (self.entry.size, self.entry.mtime_ns):
+            self.index.mark_stale()
+            self.stat_result = current
+            for name in ("content-length", "last-modified", "etag"):
+                del self.headers[name]
+            self.set_stat_headers(current)
+        await super().__call__(scope, receive, send)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    ``StaticFiles`` that serves ``.br``/``.gz`` siblings when the client accepts them.
+
+    Siblings are produced ahead of time by ``scripts/precompress_static.py``,
+    so compressible assets (SVG, JSON, ...) cost no compression CPU per request.
+
+    With a ``MediaIndex``, files are resolved, 404s and conditional requests
+    answered and headers built from memory; only a response with a body
+    checks the file, to catch changes made without touching the stamp.
+    """
+
+    def __init__(self, *args, index: Optional[MediaIndex] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.index = index
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if self.index is None:
+            return await super().get_response(path, scope)
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        entry = await self.lookup_entry(path)
+        if entry is None:
+            raise HTTPException(status_code=404)
+        return self.entry_response(path, entry, scope)
+
+    def lookup_path(self, path: str) -> tuple[str, Optional[os.stat_result]]:
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and is_precompressed_sibling(full_path):
+            # Only served as an encoding of its source, never as a file of its own
+            return "", None
+        return full_path, stat_result
+
+    async def lookup_entry(self, path: str) -> Optional[MediaEntry]:
+        """
+        Resolve a request path from the index, or with a ``stat()`` without one.
+
+        Args:
+            path: Path relative to the mounted directory
+
+        Returns:
+            The file's entry, or None if it does not exist
+        """
+        if self.index is None:
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                return None
+            return make_entry(full_path, stat_result, content_hash="")
+        if self.index.is_due():
+            await anyio.to_thread.run_sync(self.index.refresh_if_stale)
+        return self.index.lookup(path)
+
+    def entry_response(self, path: str, entry: MediaEntry, scope: Scope) -> Response:
+        """Build the response for an indexed file, answering conditionals from memory."""
+        request_headers = Headers(scope=scope)
+        headers = {"ETag": entry.etag, "Last-Modified": entry.last_modified}
+        served = entry
+        if is_compressible(entry.media_type):
+            headers["Vary"] = "Accept-Encoding"
+            encoding = negotiate_encoding(request_headers.get("accept-encoding"))
+            if encoding is not None:
+                variant = self.index.lookup_variant(path, encoding)
+                if variant is not None and is_fresh_variant(variant.stat_result, entry.stat_result):
+                    served = variant
+                    headers["ETag"] = variant.etag
+                    headers["Content-Encoding"] = encoding
+
+        response = IndexedFileResponse(
+            served, self.index, media_type=entry.media_type, headers=headers
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def file_response(
+        self,
+        full_path: os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if status_code != 200 or not is_compressible(response.media_type):
+            return response
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"))
+        variant = self._lookup_variant(str(full_path), stat_result, encoding)
+        if variant is None:
+            response.headers["Vary"] = "Accept-Encoding"
+            return response
+
+        variant_path, variant_stat = variant
+        compressed = FileResponse(
+            variant_path,
+            stat_result=variant_stat,
+            media_type=response.media_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(compressed.headers, request_headers):
+            return NotModifiedResponse(compressed.headers)
+        return compressed
+
+    @staticmethod
+    def _lookup_variant(
+        full_path: str, source_stat: os.stat_result, encoding: Optional[str]
+    ) -> Optional[tuple[str, os.stat_result]]:
+        if encoding is None:
+            return None
+        variant_path = full_path + ENCODING_SUFFIXES[encoding]
+        try:
+            variant_stat = os.stat(variant_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not is_fresh_variant(variant_stat, source_stat):
+            return None
+        return variant_path, variant_stat
+
+
+def is_precompressed_sibling(full_path: str) -> bool:
+    """Whether ``full_path`` is a ``.br``/``.gz`` sibling written next to an existing source."""
+    for suffix in ENCODING_SUFFIXES.values():
+        if full_path.endswith(suffix) and os.path.isfile(full_path[: -len(suffix)]):
+            return True
+    return False
+
+
+def is_fresh_variant(variant_stat: os.stat_result, source_stat: os.stat_result) -> bool:
+    """
+    Whether a precompressed sibling still matches its source.
+
+    A source edited after ``precompress_static.py`` last ran is newer than its
+    siblings; serving them would hand compressing clients the old content.
+    """
+    return variant_stat.st_mtime_ns >= source_stat.st_mtime_ns
+
+
+def precompress_file(path: Path, force: bool = False) -> list[Path]:
+    """
+    Write ``.br`` and ``.gz`` siblings for one compressible file.
+
+    A sibling is skipped when it is already newer than the source (unless
+    ``force``) and discarded when compression would not make it smaller.
+
+    Args:
+        path: Source file
+        force: Rewrite siblings even if they are up to date
+
+    Returns:
+        Paths of the siblings written
+    """
+    media_type, _ = guess_type(path.name)
+    if not is_compressible(media_type):
+        return []
+
+    source_mtime = path.stat().st_mtime_ns
+    data = None
+    written = []
+    for encoding, suffix in ENCODING_SUFFIXES.items():
+        variant = path.with_name(path.name + suffix)
+        if not force and variant.exists() and variant.stat().st_mtime_ns >= source_mtime:
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = compress(data, encoding, PRECOMPRESS_LEVELS[encoding])
+        if len(compressed) >= len(data):
+            variant.unlink(missing_ok=True)
+            continue
+        variant.write_bytes(compressed)
+        written.append(variant)
+    return written
+
+
+def precompress_directory(directory: Path, force: bool = False) -> list[Path]:
+    """
+    Precompress every compressible file below ``directory``.
+
+    Args:
+        directory: Root of the static tree (e.g. ``static/images``)
+        force: Rewrite siblings even if they are up to date
+
+    Returns:
+        Paths of the siblings written
+    """
+    suffixes = tuple(ENCODING_SUFFIXES.values())
+    written = []
+    for path in sorted(directory.rglob("*")):
+        if path.is_file() and not path.name.endswith(suffixes):
+            written.extend(precompress_file(path, force=force))
+    return written
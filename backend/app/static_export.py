@@ -0,0 +1,126 @@
+"""
+Static JSON export of the read API for nginx to serve directly.
+
+``/api/projects`` and every ``/api/projects/{slug}`` are rendered through
+the same schemas as the live endpoints and written as files, each with
+``.br``/``.gz`` siblings:
+
+    <export dir>/api/projects.json
+    <export dir>/api/projects/<slug>.json
+
+nginx ``try_files $uri.json @backend`` serves them (``gzip_static`` /
+``brotli_static`` pick the siblings), so Python is only reached for paths
+without a file. Detail responses from the backend carry a preload ``Link``
+header; nginx cannot derive it from a file, so the export also writes
+``<export dir>/preload-links.conf``, an nginx ``map`` include from each
+detail file's URI to that header value. A new export is built in a sibling directory and swapped in
+with two renames; in the instant between them nginx falls back to the app.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Project
+from app.preload import preload_headers
+from app.static import precompress_file
+
+# Directory written by the seeder after each reseed; empty disables the export
+STATIC_EXPORT_DIR = os.getenv("STATIC_EXPORT_DIR", "")
+
+# nginx map include with the preload Link header per exported detail document
+PRELOAD_MAP_NAME = "preload-links.conf"
+
+
+def nginx_string(value: str) -> str:
+    """Quote ``value`` as an nginx string literal with no variable references."""
+    # nginx has no escape for "$", but in a URL %24 means the same
+    value = value.replace("\\", "\\\\").replace('"', '\\"').replace("$", "%24")
+    return f'"{value}"'
+
+
+def preload_map(links: dict[str, str]) -> bytes:
+    """
+    Render ``map`` entries (``"<uri>" "<Link value>";``) for nginx to include.
+
+    Args:
+        links: Link header value per exported file URI, e.g. ``/api/projects/a.json``
+
+    Returns:
+        The include file contents
+    """
+    lines = ["# Generated by app.static_export; rewritten with every export\n"]
+    for uri, link in links.items():
+        lines.append(f"{nginx_string(uri)} {nginx_string(link)};\n")
+    return "".join(lines).encode()
+
+
+def write_export(directory: Path, documents: dict[str, bytes]) -> list[Path]:
+    """
+    Write JSON documents and their precompressed siblings below ``directory``.
+
+    Args:
+        directory: Export root (must exist)
+        documents: Body per relative file path, e.g. ``api/projects.json``
+
+    Returns:
+        Paths of the JSON files written
+    """
+    written = []
+    for relative, body in documents.items():
+        path = directory / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+        precompress_file(path, force=True)
+        written.append(path)
+    return written
+
+
+def export_catalog(db: Session, directory: str) -> int:
+    """
+    Render the project list and every project detail into ``directory``.
+
+    The previous export, if any, is replaced as a whole. nginx only reads
+    ``PRELOAD_MAP_NAME`` when it (re)loads its configuration.
+
+    Args:
+        db: Database session
+        directory: Export root served by nginx
+
+    Returns:
+        Number of JSON documents written
+    """
+    from app.routers.projects import render_project, render_project_list
+
+    documents = {"api/projects.json": render_project_list(db)}
+    links = {}
+    for slug in db.scalars(select(Project.slug).order_by(Project.order_num)):
+        relative = f"api/projects/{slug}.json"
+        documents[relative] = render_project(db, slug)
+        link = preload_headers(documents[relative]).get("Link")
+        if link:
+            links[f"/{relative}"] = link
+
+    target = Path(directory).resolve()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    build_dir = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        write_export(build_dir, documents)
+        (build_dir / PRELOAD_MAP_NAME).write_bytes(preload_map(links))
+        os.chmod(build_dir, 0o755)
+        previous = None
+        if target.exists():
+            previous = target.with_name(f".{target.name}-old")
+            shutil.rmtree(previous, ignore_errors=True)
+            os.replace(target, previous)
+        os.replace(build_dir, target)
+        if previous is not None:
+            shutil.rmtree(previous)
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+    return len(documents)
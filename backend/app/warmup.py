@@ -0,0 +1,247 @@
+"""
+Per-worker warm-up and readiness.
+
+``app.server.warm_up`` prepares what forked workers can share; connection
+pools, response caches and compressed payloads are per process, so each
+worker warms them itself during startup, retrying with backoff until it
+succeeds. Startup waits up to ``STARTUP_WARMUP_TIMEOUT`` seconds for it, and
+uvicorn only accepts connections once startup is complete, so a cold worker
+takes no traffic from the shared socket. If the wait runs out, the worker
+serves anyway and keeps warming in the background. Until warm-up finishes
+``/api/ready`` answers ``503`` while ``/api/health`` keeps reporting the
+process as alive.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Callable, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.cache import response_cache
+from app.database import database_generation, get_db
+from app.middleware.compression import SUPPORTED_ENCODINGS
+from app.models import Project
+from app.routers.projects import (
+    PROJECT_DETAIL_KEY,
+    PROJECT_LIST_KEY,
+    cache_project_detail,
+    cache_rendered,
+    render_project,
+    render_project_list,
+    snapshot_payload,
+)
+
+# Warm pools and caches in the background after startup (ready immediately when off)
+STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "1").lower() in ("1", "true", "yes")
+
+# Project detail payloads rendered and cached during warm-up, in list order
+WARMUP_DETAIL_COUNT = int(os.getenv("WARMUP_DETAIL_COUNT", "20"))
+
+# Seconds startup waits for warm-up before serving anyway (warming continues)
+STARTUP_WARMUP_TIMEOUT = float(os.getenv("STARTUP_WARMUP_TIMEOUT", "30"))
+
+# Seconds before retrying a failed warm-up, doubled per failure up to the maximum
+WARMUP_RETRY_DELAY = float(os.getenv("WARMUP_RETRY_DELAY", "0.5"))
+WARMUP_RETRY_MAX_DELAY = float(os.getenv("WARMUP_RETRY_MAX_DELAY", "30"))
+
+# Steps run by warm_up_worker, as reported by /api/ready
+WARMUP_COMPONENTS = ("database", "project_list", "project_details")
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Warm-up progress of this worker: per-component timings and failures."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget previous progress, e.g. when the app starts up again."""
+        self.ready = False
+        self.timings_ms: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+
+    def measure(self, component: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run one warm-up step, recording its duration or its error.
+
+        Args:
+            component: Name reported by ``/api/ready``, e.g. ``"database"``
+            func: Step to run
+            *args: Positional arguments for ``func``
+
+        Returns:
+            The value returned by ``func``
+
+        Raises:
+            Exception: Whatever ``func`` raised, after recording it
+        """
+        started = time.perf_counter()
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.errors[component] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.timings_ms[component] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    def report(self) -> dict[str, Any]:
+        """Body of the ``/api/ready`` response."""
+        status = "ready" if self.ready else "failed" if self.errors else "warming"
+        report: dict[str, Any] = {"status": status, "components": dict(self.timings_ms)}
+        if self.errors:
+            report["errors"] = dict(self.errors)
+        return report
+
+
+# This worker's readiness, reported by /api/ready
+readiness = Readiness()
+
+
+def warm_database(db: Session) -> int:
+    """Open as many pooled connections as the pool keeps, so requests never connect."""
+    engine = db.get_bind()
+    size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+    connections = [engine.connect() for _ in range(size)]
+    try:
+        for connection in connections:
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+    return size
+
+
+def warm_project_list(db: Session) -> None:
+    """Render and cache the project list with its compressed variants."""
+    if snapshot_payload(PROJECT_LIST_KEY) is not None:
+        return
+    generation = database_generation()
+    payload = response_cache.get(PROJECT_LIST_KEY) or cache_rendered(
+        PROJECT_LIST_KEY, render_project_list(db), generation
+    )
+    for encoding in SUPPORTED_ENCODINGS:
+        payload.encoded(encoding)
+
+
+def warm_project_details(db: Session, count: int) -> None:
+    """Render and cache the first ``count`` project details, as the list shows them."""
+    generation = database_generation()
+    slugs = db.scalars(select(Project.slug).order_by(Project.order_num).limit(count))
+    for slug in slugs.all():
+        key = PROJECT_DETAIL_KEY.format(slug=slug)
+        if snapshot_payload(key) is not None or response_cache.get(key) is not None:
+            continue
+        body = render_project(db, slug)
+        if body is not None:
+            cache_project_detail(slug, body, generation).encoded(SUPPORTED_ENCODINGS[0])
+
+
+def warm_up_worker(app: FastAPI, target: Optional[Readiness] = None) -> Readiness:
+    """
+    Warm this worker's connection pool and response caches, then mark it ready.
+
+    Errors left by a previous attempt are cleared first. The session comes
+    from the same ``get_db`` dependency the endpoints use (including test
+    overrides). Rendering the hot payloads also exercises the ORM mappers
+    and Pydantic serializers on their first use.
+
+    Args:
+        app: The application, for its dependency overrides
+        target: Readiness to update (default: this worker's)
+
+    Returns:
+        The updated readiness
+    """
+    target = target or readiness
+    for component in WARMUP_COMPONENTS:
+        target.errors.pop(component, None)
+    provider = app.dependency_overrides.get(get_db, get_db)
+    sessions = provider()
+    db = next(sessions)
+    try:
+        target.measure("database", warm_database, db)
+        target.measure("project_list", warm_project_list, db)
+        target.measure("project_details", warm_project_details, db, WARMUP_DETAIL_COUNT)
+    except Exception:
+        logger.exception("Worker warm-up failed")
+        return target
+    finally:
+        sessions.close()
+    target.ready = True
+    return target
+
+
+async def warm_up_until_ready(
+    app: FastAPI,
+    target: Optional[Readiness] = None,
+    delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+) -> Readiness:
+    """
+    Run ``warm_up_worker`` in the threadpool until it succeeds.
+
+    A worker can start before the first seed or while the database is being
+    replaced; failed attempts are retried after an exponentially growing
+    delay, and ``/api/ready`` reports the last error in between.
+
+    Args:
+        app: The application, for its dependency overrides
+        target: Readiness to update (default: this worker's)
+        delay: Seconds before the first retry (default: ``WARMUP_RETRY_DELAY``)
+        max_delay: Longest wait between attempts (default: ``WARMUP_RETRY_MAX_DELAY``)
+
+    Returns:
+        The readiness, once ready
+    """
+    target = target or readiness
+    delay = WARMUP_RETRY_DELAY if delay is None else delay
+    max_delay = WARMUP_RETRY_MAX_DELAY if max_delay is None else max_delay
+    while not (await run_in_threadpool(warm_up_worker, app, target)).ready:
+        logger.warning("Retrying worker warm-up in %.1fs", delay)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
+    return target
+
+
+def start_warmup(app: FastAPI) -> Optional[asyncio.Task]:
+    """
+    Start warming this worker in the background, or mark it ready if warm-up is off.
+
+    Returns:
+        The running warm-up task, or None when ``STARTUP_WARMUP`` is disabled
+    """
+    if not STARTUP_WARMUP:
+        readiness.ready = True
+        return None
+    return asyncio.ensure_future(warm_up_until_ready(app))
+
+
+async def wait_for_warmup(task: asyncio.Task, timeout: Optional[float] = None) -> bool:
+    """
+    Wait for a warm-up task started by ``start_warmup``, for at most ``timeout``.
+
+    The task is left running when the wait runs out.
+
+    Args:
+        task: The warm-up task
+        timeout: Seconds to wait (default: ``STARTUP_WARMUP_TIMEOUT``)
+
+    Returns:
+        True if the worker is warm
+    """
+    timeout = STARTUP_WARMUP_TIMEOUT if timeout is None else timeout
+    try:
+        await asyncio.wait_for(asyncio.shield(task), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Worker not warm after %.1fs; serving while warm-up continues", timeout)
+        return False
+    return True
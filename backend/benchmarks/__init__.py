@@ -0,0 +1,5 @@
+"""
+Benchmark suite for the API hot paths.
+
+Run with ``python -m benchmarks.run`` from the backend directory.
+"""
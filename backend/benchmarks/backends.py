@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Compare project rendering backends on cache misses.
+
+Times how long each backend takes to turn the database into response JSON
+for the list and detail endpoints, bypassing HTTP and the response cache,
+and records each render's peak traced memory with tracemalloc.
+
+Usage:
+    python -m benchmarks.backends --sizes 10,100,1000
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.routers.projects import render_project, render_project_list
+from benchmarks.catalog import create_catalog_database
+from benchmarks.harness import (
+    environment_metadata,
+    measure,
+    measure_allocations,
+    write_results,
+)
+
+BACKENDS = ["orm", "readmodel", "json"]
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent / "results"
+
+
+def benchmark_backends(num_projects: int, iterations: int) -> list[dict[str, Any]]:
+    """Time list and detail rendering for every backend on one catalog size."""
+    entries = []
+    with tempfile.TemporaryDirectory(prefix="portfolio-bench-") as tmp_dir:
+        db_path = str(Path(tmp_dir) / "catalog.db")
+        create_catalog_database(db_path, num_projects)
+        engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+        session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        slug = f"project-{num_projects // 2:05d}"
+
+        for backend in BACKENDS:
+            scenarios = {
+                "render_list": lambda db: render_project_list(db, backend),
+                "render_detail": lambda db: render_project(db, slug, backend),
+            }
+            for scenario, render in scenarios.items():
+
+                def run_once():
+                    # Fresh session per call: no identity-map reuse between iterations
+                    with session_local() as db:
+                        return render(db)
+
+                result = measure(run_once, iterations)
+                result.update(measure_allocations(run_once))
+                entries.append(
+                    {
+                        "scenario": f"{scenario}_{backend}",
+                        "catalog_size": num_projects,
+                        "response_bytes": len(run_once()),
+                        **result,
+                    }
+                )
+                label = f"{scenario}_{backend}"
+                print(
+                    f"  {label:<24} n={num_projects:<6} "
+                    f"p50={result['latency_ms']['p50']:>9.3f}ms "
+                    f"ops/s={result['throughput_ops']:>9.1f} "
+                    f"peak={result['peak_bytes'] / 1024:>9.1f}KiB"
+                )
+        engine.dispose()
+    return entries
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="10,100,1000", help="comma-separated catalog sizes")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in (int(size) for size in args.sizes.split(",") if size.strip()):
+        print(f"Rendering catalog of {size} projects...")
+        results.extend(benchmark_backends(size, args.iterations))
+
+    meta = environment_metadata()
+    meta.update({"iterations": args.iterations, "backends": BACKENDS})
+    path = write_results({"meta": meta, "results": results}, args.output_dir)
+    print(f"\n✓ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Synthetic project catalogs for benchmarks and query-plan tests.
+
+Catalogs are generated from a seeded RNG so the same size and seed always
+produce the same rows, which keeps benchmark runs comparable over time.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.catalog_versions import stamp_catalog_versions
+from app.database import Base
+from app.models import Project, ProjectImage, Role, Technology
+from app.recommendations import rebuild_related_projects
+
+# Fan-out ranges modelled on the real catalog in scripts/seed_db.py
+TECHNOLOGIES_PER_PROJECT = (3, 10)
+ROLES_PER_PROJECT = (1, 3)
+IMAGES_PER_PROJECT = (1, 8)
+VIDEO_PROBABILITY = 0.15
+
+TECHNOLOGY_NAMES = [
+    "TypeScript", "React", "TailwindCSS", "Vite", "Node.js", "Express", "GraphQL",
+    "Apollo", "PostgreSQL", "SQLite", "Python", "FastAPI", "SQLAlchemy", "Pydantic",
+    "Docker", "Nginx", "AWS", "Vercel", "Jest", "Vitest", "Playwright", "Storybook",
+    "Redux", "React Query", "Next.js", "Remix", "Prisma", "Redis", "OpenAI API",
+    "LangChain", "Supabase", "Firebase", "Mapbox", "D3.js", "Three.js", "Framer Motion",
+    "Zod", "tRPC", "Go", "Rust",
+]  # fmt: skip
+
+ROLE_NAMES = [
+    "Frontend Developer", "Backend Developer", "Full Stack Developer", "AI Engineer",
+    "UI Designer", "Tech Lead", "DevOps Engineer", "Product Engineer",
+]  # fmt: skip
+
+WORDS = (
+    "portfolio project dashboard travel list profile archive galaxy explorer map "
+    "component query cache render stream design layout responsive accessible "
+    "search filter pipeline deploy feature user data api schema model"
+).split()
+
+
+@dataclass(frozen=True)
+class CatalogStats:
+    """Row counts written by ``populate_catalog``."""
+
+    projects: int
+    technologies: int
+    roles: int
+    images: int
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _description(rng: random.Random, techs: list[str]) -> str:
+    paragraphs = "\n\n".join(_sentence(rng, rng.randint(25, 60)) for _ in range(rng.randint(2, 5)))
+    return f"{paragraphs}\n\n### Tech Stack\n- **Stack:** {', '.join(techs)}\n"
+
+
+def populate_catalog(session: Session, num_projects: int, seed: int = 0) -> CatalogStats:
+    """
+    Insert a synthetic catalog through the ORM, mirroring the seeder's write path.
+
+    Args:
+        session: SQLAlchemy session bound to an empty schema
+        num_projects: Number of projects to generate
+        seed: RNG seed; identical inputs produce identical catalogs
+
+    Returns:
+        CatalogStats with the number of rows written per table
+    """
+    rng = random.Random(seed)
+
+    technologies = [Technology(id=_uuid(rng), name=name) for name in TECHNOLOGY_NAMES]
+    roles = [Role(id=_uuid(rng), name=name) for name in ROLE_NAMES]
+    session.add_all(technologies)
+    session.add_all(roles)
+
+    image_count = 0
+    for order_num in range(num_projects):
+        slug = f"project-{order_num:05d}"
+        project_techs = rng.sample(technologies, rng.randint(*TECHNOLOGIES_PER_PROJECT))
+        project = Project(
+            id=_uuid(rng),
+            title=f"Project {order_num:05d}",
+            slug=slug,
+            summary=_sentence(rng, rng.randint(15, 35)),
+            description=_description(rng, [tech.name for tech in project_techs]),
+            live_url=f"https://{slug}.example.com" if rng.random() < 0.7 else None,
+            github_url=f"https://github.com/example/{slug}" if rng.random() < 0.8 else None,
+            order_num=order_num,
+        )
+        project.technologies.extend(project_techs)
+        project.roles.extend(rng.sample(roles, rng.randint(*ROLES_PER_PROJECT)))
+
+        for image_order in range(rng.randint(*IMAGES_PER_PROJECT)):
+            is_video = image_order == 0 and rng.random() < VIDEO_PROBABILITY
+            prefix, ext = ("/videos/projects", "mp4") if is_video else ("/images/projects", "png")
+            project.images.append(
+                ProjectImage(
+                    id=_uuid(rng),
+                    project_id=project.id,
+                    url=f"{prefix}/{slug}/{slug}-{image_order + 1}.{ext}",
+                    alt_text=f"{project.title} - Image {image_order + 1}",
+                    order_num=image_order,
+                )
+            )
+            image_count += 1
+
+        session.add(project)
+
+    session.commit()
+    return CatalogStats(
+        projects=num_projects,
+        technologies=len(technologies),
+        roles=len(roles),
+        images=image_count,
+    )
+
+
+def create_catalog_database(db_path: str, num_projects: int, seed: int = 0) -> CatalogStats:
+    """
+    Create a fresh SQLite file at ``db_path`` and populate it with a synthetic catalog.
+
+    Args:
+        db_path: Filesystem path of the database to create (overwritten tables)
+        num_projects: Number of projects to generate
+        seed: RNG seed passed to ``populate_catalog``
+
+    Returns:
+        CatalogStats with the number of rows written per table
+    """
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    try:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        try:
+            stats = populate_catalog(session, num_projects, seed=seed)
+            # Same derived data the seeder stores, so every endpoint is served realistically
+            rebuild_related_projects(session)
+            stamp_catalog_versions(session, {})
+            return stats
+        finally:
+            session.close()
+    finally:
+        engine.dispose()
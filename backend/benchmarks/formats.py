@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Compare JSON, MessagePack and CBOR project payloads.
+
+For the list and detail documents of each catalog size, records the body
+size (raw and Brotli/gzip compressed, as cached by the API) and the time to
+encode the document and to decode the body, the work a client does per
+response.
+
+Usage:
+    python -m benchmarks.formats --sizes 10,100,1000
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+import cbor2
+import msgpack
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.formats import CBOR, JSON, MSGPACK, convert_json
+from app.middleware.compression import compress
+from app.routers.projects import render_project, render_project_list
+from benchmarks.catalog import create_catalog_database
+from benchmarks.harness import environment_metadata, measure, write_results
+
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent / "results"
+
+CODECS: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    JSON: (lambda document: json.dumps(document, separators=(",", ":")).encode(), json.loads),
+    MSGPACK: (lambda document: msgpack.packb(document, use_bin_type=True), msgpack.unpackb),
+    CBOR: (cbor2.dumps, cbor2.loads),
+}
+
+
+def benchmark_formats(num_projects: int, iterations: int) -> list[dict[str, Any]]:
+    """Measure size and codec time of the list and detail documents in every format."""
+    entries = []
+    with tempfile.TemporaryDirectory(prefix="portfolio-bench-") as tmp_dir:
+        db_path = str(Path(tmp_dir) / "catalog.db")
+        create_catalog_database(db_path, num_projects)
+        engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+        with sessionmaker(bind=engine)() as db:
+            documents = {
+                "list": render_project_list(db),
+                "detail": render_project(db, f"project-{num_projects // 2:05d}"),
+            }
+        engine.dispose()
+
+    for scenario, json_body in documents.items():
+        document = json.loads(json_body)
+        for media_type, (encode, decode) in CODECS.items():
+            body = convert_json(json_body, media_type)
+            encoded = measure(lambda: encode(document), iterations)
+            decoded = measure(lambda: decode(body), iterations)
+            label = f"{scenario}_{media_type.split('/')[1]}"
+            entries.append(
+                {
+                    "scenario": label,
+                    "catalog_size": num_projects,
+                    "response_bytes": len(body),
+                    "br_bytes": len(compress(body, "br")),
+                    "gzip_bytes": len(compress(body, "gzip")),
+                    "encode": encoded,
+                    "decode": decoded,
+                }
+            )
+            print(
+                f"  {label:<16} n={num_projects:<6} "
+                f"bytes={len(body) / 1024:>9.1f}KiB "
+                f"br={entries[-1]['br_bytes'] / 1024:>8.1f}KiB "
+                f"encode p50={encoded['latency_ms']['p50']:>8.3f}ms "
+                f"decode p50={decoded['latency_ms']['p50']:>8.3f}ms"
+            )
+    return entries
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="10,100,1000", help="comma-separated catalog sizes")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in (int(size) for size in args.sizes.split(",") if size.strip()):
+        print(f"Encoding catalog of {size} projects...")
+        results.extend(benchmark_formats(size, args.iterations))
+
+    meta = environment_metadata()
+    meta.update({"iterations": args.iterations, "formats": list(CODECS)})
+    path = write_results({"meta": meta, "results": results}, args.output_dir)
+    print(f"\n✓ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
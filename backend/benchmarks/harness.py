@@ -0,0 +1,238 @@
+"""
+Timing, load-generation and result-file helpers for the benchmark suite.
+"""
+
+import asyncio
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def summarize(samples_ms: Sequence[float], elapsed_s: float, errors: int = 0) -> dict[str, Any]:
+    """
+    Reduce raw latency samples to the statistics stored in result files.
+
+    Args:
+        samples_ms: Per-operation latencies in milliseconds
+        elapsed_s: Wall-clock duration of the whole measurement
+        errors: Number of failed operations (not included in samples)
+
+    Returns:
+        Dictionary with operation count, throughput and latency percentiles
+    """
+    ordered = sorted(samples_ms)
+
+    def percentile(pct: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+        return round(ordered[index], 3)
+
+    return {
+        "operations": len(ordered),
+        "errors": errors,
+        "elapsed_s": round(elapsed_s, 4),
+        "throughput_ops": round(len(ordered) / elapsed_s, 2) if elapsed_s else 0.0,
+        "latency_ms": {
+            "min": percentile(0),
+            "mean": round(statistics.fmean(ordered), 3) if ordered else 0.0,
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99),
+            "max": percentile(100),
+        },
+    }
+
+
+def measure(fn: Callable[[], Any], iterations: int, warmup: int = 1) -> dict[str, Any]:
+    """
+    Time a synchronous callable sequentially.
+
+    Args:
+        fn: Zero-argument callable to time
+        iterations: Number of timed calls
+        warmup: Number of untimed calls made first
+
+    Returns:
+        Summary dictionary as produced by ``summarize``
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - call_started) * 1000)
+    return summarize(samples, time.perf_counter() - started)
+
+
+def measure_allocations(fn: Callable[[], Any], iterations: int = 5) -> dict[str, Any]:
+    """
+    Measure peak memory allocated by a synchronous callable with tracemalloc.
+
+    Tracing starts fresh for each call, so the peak is the most memory the
+    call itself held live at once (ORM instances, rows, intermediate dicts).
+
+    Args:
+        fn: Zero-argument callable to profile (called once untraced as warmup)
+        iterations: Number of traced calls; the median is reported
+
+    Returns:
+        Dictionary with the median peak traced bytes per call
+    """
+    fn()
+    peaks = []
+    for _ in range(iterations):
+        tracemalloc.start()
+        try:
+            fn()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return {"peak_bytes": int(statistics.median(peaks))}
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    paths: Sequence[str],
+    total_requests: int,
+    concurrency: int,
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """
+    Drive ``total_requests`` GETs through ``client`` from ``concurrency`` workers.
+
+    Paths are requested round-robin so detail and static scenarios exercise
+    every slug or file rather than one hot key.
+
+    Args:
+        client: httpx client bound to a running server or an ASGI transport
+        paths: Request paths to cycle through
+        total_requests: Number of requests to issue across all workers
+        concurrency: Number of concurrent in-flight requests
+        headers: Optional request headers (e.g. Accept-Encoding)
+
+    Returns:
+        Summary dictionary as produced by ``summarize``, plus response bytes
+    """
+    path_cycle = itertools.cycle(paths)
+    remaining = iter(range(total_requests))
+    samples: list[float] = []
+    errors = 0
+    response_bytes = 0
+
+    async def worker() -> None:
+        nonlocal errors, response_bytes
+        for _ in remaining:
+            path = next(path_cycle)
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, headers=headers)
+                body = await response.aread()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            if response.status_code >= 400:
+                errors += 1
+                continue
+            samples.append((time.perf_counter() - started) * 1000)
+            response_bytes += len(body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result = summarize(samples, time.perf_counter() - started, errors)
+    result["response_bytes"] = response_bytes
+    return result
+
+
+def environment_metadata() -> dict[str, Any]:
+    """Describe the machine and revision a run was recorded on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def write_results(results: dict[str, Any], output_dir: Path) -> Path:
+    """
+    Write a results document to ``output_dir`` as timestamped JSON.
+
+    Args:
+        results: Document with ``meta`` and ``results`` keys
+        output_dir: Directory to create the file in
+
+    Returns:
+        Path of the written file
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = output_dir / f"bench-{stamp}.json"
+    path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Pair up scenarios from two result documents and compute relative changes.
+
+    Args:
+        baseline: Earlier results document
+        current: Newer results document
+
+    Returns:
+        One row per (scenario, catalog_size) present in both documents, with
+        p50/p95 latency and throughput change as percentages (negative
+        latency change and positive throughput change are improvements)
+    """
+
+    def key(entry: dict[str, Any]) -> tuple[str, int]:
+        return entry["scenario"], entry["catalog_size"]
+
+    def change(old: float, new: float) -> float | None:
+        return round((new - old) / old * 100, 1) if old else None
+
+    previous = {key(entry): entry for entry in baseline["results"]}
+    rows = []
+    for entry in current["results"]:
+        before = previous.get(key(entry))
+        if before is None:
+            continue
+        rows.append(
+            {
+                "scenario": entry["scenario"],
+                "catalog_size": entry["catalog_size"],
+                "p50_change_pct": change(before["latency_ms"]["p50"], entry["latency_ms"]["p50"]),
+                "p95_change_pct": change(before["latency_ms"]["p95"], entry["latency_ms"]["p95"]),
+                "throughput_change_pct": change(before["throughput_ops"], entry["throughput_ops"]),
+            }
+        )
+    return rows
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner for the API hot paths.
+
+Builds a synthetic catalog per size, serves it (a local uvicorn process by
+default), drives load against the project endpoints and static images, and
+writes a timestamped JSON result file that later runs can be compared with.
+
+Usage:
+    python -m benchmarks.run --sizes 10,100,1000,10000
+    python -m benchmarks.run --mode inprocess --requests 200
+    python -m benchmarks.run --compare results/bench-A.json results/bench-B.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.catalog import create_catalog_database
+from benchmarks.harness import (
+    BACKEND_DIR,
+    compare_results,
+    environment_metadata,
+    run_load,
+    summarize,
+    write_results,
+)
+
+DEFAULT_SIZES = "10,100,1000,10000"
+DEFAULT_OUTPUT_DIR = BACKEND_DIR / "benchmarks" / "results"
+MAX_DETAIL_SLUGS = 200
+STATIC_DIR = BACKEND_DIR / "static" / "images"
+STATIC_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".svg"}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _static_paths() -> list[str]:
+    return [
+        "/images/" + path.relative_to(STATIC_DIR).as_posix()
+        for path in sorted(STATIC_DIR.rglob("*"))
+        if path.suffix.lower() in STATIC_SUFFIXES
+    ]
+
+
+def _detail_paths(num_projects: int) -> list[str]:
+    step = max(1, num_projects // MAX_DETAIL_SLUGS)
+    return [f"/api/projects/project-{i:05d}" for i in range(0, num_projects, step)]
+
+
+@contextlib.asynccontextmanager
+async def uvicorn_client(db_path: str, workers: int) -> AsyncIterator[httpx.AsyncClient]:
+    """Start uvicorn against ``db_path`` and yield a client once it is healthy."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "DATABASE_URL": f"sqlite:///{db_path}"},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    limits = httpx.Limits(max_connections=256, max_keepalive_connections=256)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    if (await client.get("/api/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("uvicorn did not become healthy within 30s")
+                await asyncio.sleep(0.1)
+            yield client
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@contextlib.asynccontextmanager
+async def inprocess_client(db_path: str) -> AsyncIterator[httpx.AsyncClient]:
+    """Serve the app in-process over an ASGI transport bound to ``db_path``."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.cache import response_cache
+    from app.database import get_db
+    from app.main import app
+
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    response_cache.clear()
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+async def benchmark_size(num_projects: int, args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Seed, serve and load-test a catalog of ``num_projects`` projects."""
+    entries = []
+    headers = {"Accept-Encoding": args.accept_encoding} if args.accept_encoding else None
+
+    with tempfile.TemporaryDirectory(prefix="portfolio-bench-") as tmp_dir:
+        db_path = str(Path(tmp_dir) / "catalog.db")
+
+        started = time.perf_counter()
+        stats = create_catalog_database(db_path, num_projects, seed=args.seed)
+        elapsed = time.perf_counter() - started
+        entries.append(
+            {
+                "scenario": "seed",
+                "catalog_size": num_projects,
+                "rows": asdict(stats),
+                **summarize([elapsed * 1000], elapsed),
+            }
+        )
+
+        if args.mode == "uvicorn":
+            client_cm = uvicorn_client(db_path, args.server_workers)
+        else:
+            client_cm = inprocess_client(db_path)
+
+        async with client_cm as client:
+            scenarios = {
+                "projects_list": ["/api/projects"],
+                "project_detail": _detail_paths(num_projects),
+            }
+            if args.include_static:
+                scenarios["static_image"] = _static_paths()
+
+            for scenario, paths in scenarios.items():
+                # Warm caches and connection pools before timing
+                await run_load(client, paths, min(len(paths), 20), 1, headers)
+                result = await run_load(client, paths, args.requests, args.concurrency, headers)
+                entries.append({"scenario": scenario, "catalog_size": num_projects, **result})
+                print(
+                    f"  {scenario:<16} n={num_projects:<6} "
+                    f"p50={result['latency_ms']['p50']:>8.2f}ms "
+                    f"p95={result['latency_ms']['p95']:>8.2f}ms "
+                    f"rps={result['throughput_ops']:>9.1f} errors={result['errors']}"
+                )
+
+    return entries
+
+
+async def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every configured catalog size and collect a results document."""
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results: list[dict[str, Any]] = []
+    for index, size in enumerate(sizes):
+        print(f"Benchmarking catalog of {size} projects ({args.mode})...")
+        args.include_static = index == 0
+        results.extend(await benchmark_size(size, args))
+
+    meta = environment_metadata()
+    meta.update(
+        {
+            "mode": args.mode,
+            "server_workers": args.server_workers if args.mode == "uvicorn" else None,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "accept_encoding": args.accept_encoding,
+        }
+    )
+    return {"meta": meta, "results": results}
+
+
+def print_comparison(baseline_path: Path, current_path: Path) -> None:
+    """Print per-scenario changes between two result files."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    current = json.loads(current_path.read_text(encoding="utf-8"))
+    print(f"{'scenario':<16} {'size':>6} {'p50 %':>8} {'p95 %':>8} {'rps %':>8}")
+    for row in compare_results(baseline, current):
+        print(
+            f"{row['scenario']:<16} {row['catalog_size']:>6} "
+            f"{row['p50_change_pct']!s:>8} {row['p95_change_pct']!s:>8} "
+            f"{row['throughput_change_pct']!s:>8}"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated catalog sizes")
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--mode", choices=["uvicorn", "inprocess"], default="uvicorn")
+    parser.add_argument("--server-workers", type=int, default=1, help="uvicorn --workers")
+    parser.add_argument("--seed", type=int, default=0, help="catalog RNG seed")
+    parser.add_argument("--accept-encoding", default=None, help="Accept-Encoding to send")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two result files instead of running",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.compare:
+        print_comparison(*args.compare)
+        return
+
+    results = asyncio.run(run_benchmarks(args))
+    path = write_results(results, args.output_dir)
+    print(f"\n✓ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
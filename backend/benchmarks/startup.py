@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Startup benchmarks: import time and time-to-first-healthy-response.
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 5 --output-dir benchmarks/results
+"""
+
+import argparse
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from benchmarks.catalog import create_catalog_database
+from benchmarks.harness import BACKEND_DIR, environment_metadata, summarize, write_results
+
+DEFAULT_OUTPUT_DIR = BACKEND_DIR / "benchmarks" / "results"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+# Projects in the catalog the measured servers start against
+STARTUP_CATALOG_SIZE = 10
+
+# Server launch commands compared by the startup benchmark
+SERVER_COMMANDS = {
+    "uvicorn": [sys.executable, "-m", "uvicorn", "app.main:app", "--workers", "{workers}"],
+    "prefork": [sys.executable, "-m", "app.server", "--workers", "{workers}"],
+}
+
+
+def measure_import_time(module: str = "app.main") -> dict[str, Any]:
+    """
+    Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Dictionary with the module's cumulative import time in milliseconds
+        and the slowest top-level imports it pulled in
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = None
+    top_level: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        if name == module and len(indent) == 1:
+            total_us = int(cumulative)
+        elif len(indent) == 3:
+            # Direct imports made by the module under test
+            top_level[name] = top_level.get(name, 0) + int(cumulative)
+
+    if total_us is None:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+
+    slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:10]
+    return {
+        "module": module,
+        "total_ms": round(total_us / 1000, 2),
+        "slowest_imports_ms": {name: round(us / 1000, 2) for name, us in slowest},
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def startup_environment(directory: Path, num_projects: int = STARTUP_CATALOG_SIZE) -> dict:
+    """
+    Build an environment for a measured server that only touches ``directory``.
+
+    Seeds a synthetic catalog there and points the media and image cache
+    directories at empty subdirectories, so startup (including warm-up) runs
+    against real data and never writes to the working tree.
+
+    Args:
+        directory: Scratch directory, e.g. a pytest ``tmp_path``
+        num_projects: Size of the seeded catalog
+
+    Returns:
+        Environment variables for ``measure_time_to_healthy``
+    """
+    db_path = directory / "portfolio.db"
+    create_catalog_database(str(db_path), num_projects)
+    (directory / "media").mkdir(exist_ok=True)
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "MEDIA_DIR": str(directory / "media"),
+        "IMAGE_CACHE_DIR": str(directory / "image-cache"),
+    }
+    for name in ("CATALOG_SNAPSHOT_PATH", "STATIC_EXPORT_DIR"):
+        env.pop(name, None)
+    return env
+
+
+def measure_time_to_healthy(
+    server: str, workers: int = 2, timeout: float = 30.0, env: Optional[dict] = None
+) -> float:
+    """
+    Launch a server and time how long until ``/api/health`` first returns 200.
+
+    Args:
+        server: Key of ``SERVER_COMMANDS``
+        workers: Number of worker processes
+        timeout: Seconds to wait before giving up
+        env: Server environment (default: this process's, see ``startup_environment``)
+
+    Returns:
+        Milliseconds from process launch to the first healthy response
+    """
+    port = _free_port()
+    command = [part.format(workers=workers) for part in SERVER_COMMANDS[server]]
+    command += ["--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+
+    started = time.perf_counter()
+    env = os.environ.copy() if env is None else env
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1.0) as client:
+            while True:
+                try:
+                    if client.get("/api/health").status_code == 200:
+                        return (time.perf_counter() - started) * 1000
+                except httpx.TransportError:
+                    pass
+                if process.poll() is not None:
+                    raise RuntimeError(f"{server} server exited with {process.returncode}")
+                if time.perf_counter() - started > timeout:
+                    raise RuntimeError(f"{server} server not healthy after {timeout}s")
+                time.sleep(0.01)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=3, help="measurements per scenario")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    results = []
+    imports = [measure_import_time() for _ in range(args.repeat)]
+    results.append(
+        {
+            "scenario": "import_app_main",
+            "catalog_size": None,
+            "slowest_imports_ms": imports[-1]["slowest_imports_ms"],
+            **summarize([run["total_ms"] for run in imports], 0),
+        }
+    )
+    print(f"  import app.main       p50={results[-1]['latency_ms']['p50']:>8.2f}ms")
+
+    with tempfile.TemporaryDirectory(prefix="startup-") as directory:
+        env = startup_environment(Path(directory))
+        for server in SERVER_COMMANDS:
+            samples = [
+                measure_time_to_healthy(server, args.workers, env=env) for _ in range(args.repeat)
+            ]
+            results.append(
+                {
+                    "scenario": f"first_healthy_{server}",
+                    "catalog_size": STARTUP_CATALOG_SIZE,
+                    **summarize(samples, 0),
+                }
+            )
+            print(f"  first healthy {server:<8} p50={results[-1]['latency_ms']['p50']:>8.2f}ms")
+
+    meta = environment_metadata()
+    meta.update({"repeat": args.repeat, "server_workers": args.workers})
+    path = write_results({"meta": meta, "results": results}, args.output_dir)
+    print(f"\n✓ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Build step - serializes the catalog into the memory-mapped snapshot served by workers."""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal  # noqa: E402
+from app.snapshot import CATALOG_SNAPSHOT_PATH, CatalogSnapshot, build_snapshot  # noqa: E402
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=CATALOG_SNAPSHOT_PATH or str(backend_dir / "catalog.snapshot"),
+        help="snapshot file to write (default: $CATALOG_SNAPSHOT_PATH or catalog.snapshot)",
+    )
+    args = parser.parse_args()
+
+    try:
+        with SessionLocal() as db:
+            generation = build_snapshot(db, args.path)
+        snapshot = CatalogSnapshot(args.path)
+        size = os.path.getsize(args.path)
+        print(f"✓ Wrote snapshot generation {generation} to {args.path}")
+        print(f"✓ {len(snapshot)} payloads, {size / 1024:.1f} KiB")
+    except Exception as e:
+        print(f"✗ Error building snapshot: {e}")
+        sys.exit(1)
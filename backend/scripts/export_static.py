@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Build step - writes the project API as static JSON (plus .br/.gz) for nginx to serve."""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal  # noqa: E402
+from app.static_export import STATIC_EXPORT_DIR, export_catalog  # noqa: E402
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=STATIC_EXPORT_DIR or str(backend_dir / "export"),
+        help="export root served by nginx (default: $STATIC_EXPORT_DIR or export/)",
+    )
+    args = parser.parse_args()
+
+    try:
+        with SessionLocal() as db:
+            count = export_catalog(db, args.directory)
+        print(f"✓ Exported {count} JSON documents to {args.directory}")
+    except Exception as e:
+        print(f"✗ Error exporting static JSON: {e}")
+        sys.exit(1)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Apply pending schema migrations to the SQLite database, resuming an interrupted run."""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import DATABASE_PATH  # noqa: E402
+from app.migrations import (  # noqa: E402
+    MIGRATION_BATCH_SIZE,
+    MigrationRunner,
+    get_schema_version,
+    verify_schema,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("database", nargs="?", default=DATABASE_PATH, help="SQLite file")
+    parser.add_argument("--batch-size", type=int, default=MIGRATION_BATCH_SIZE)
+    parser.add_argument(
+        "--check", action="store_true", help="only compare the schema with the models"
+    )
+    args = parser.parse_args()
+
+    try:
+        if args.check:
+            conn = sqlite3.connect(args.database)
+            problems = verify_schema(conn)
+            print(f"Schema version {get_schema_version(conn)}")
+            conn.close()
+            for problem in problems:
+                print(f"✗ {problem}")
+            if problems:
+                sys.exit(1)
+            print("✓ Schema matches the models")
+        else:
+            with MigrationRunner(
+                args.database, batch_size=args.batch_size, progress=print
+            ) as runner:
+                version = runner.run()
+            print(f"✓ Database at schema version {version}")
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        sys.exit(1)
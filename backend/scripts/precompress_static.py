@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Build step - writes .br and .gz siblings for compressible static files."""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.media_index import MEDIA_DIR, touch_media_stamp  # noqa: E402
+from app.static import precompress_directory  # noqa: E402
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        type=Path,
+        default=backend_dir / MEDIA_DIR,
+        help="static directory to precompress (default: $MEDIA_DIR or static/images)",
+    )
+    parser.add_argument("--force", action="store_true", help="rewrite up-to-date siblings")
+    args = parser.parse_args()
+
+    try:
+        print(f"Precompressing static files in {args.directory}...")
+        written = precompress_directory(args.directory, force=args.force)
+        for path in written:
+            print(f"  - {path.relative_to(args.directory)}")
+        if written:
+            # Running servers pick up the new siblings on their next index refresh
+            touch_media_stamp(args.directory)
+        print(f"✓ Wrote {len(written)} precompressed variants")
+    except Exception as e:
+        print(f"✗ Error precompressing static files: {e}")
+        sys.exit(1)
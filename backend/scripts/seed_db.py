@@ -2,8 +2,11 @@
 """Database seeding script - populates database with project data from CSV."""
 
 import csv
+import os
 import re
+import sqlite3
 import sys
+import tempfile
 import uuid
 from pathlib import Path
 
@@ -11,8 +14,34 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from app.database import SessionLocal, init_db  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.catalog_versions import read_version_state, stamp_catalog_versions  # noqa: E402
+from app.database import DATABASE_PATH, Base, SessionLocal  # noqa: E402
+from app.media_index import MEDIA_DIR, touch_media_stamp  # noqa: E402
+from app.migrations import stamp_schema_version  # noqa: E402
 from app.models import Project, ProjectImage, Role, Technology  # noqa: E402
+from app.recommendations import rebuild_related_projects  # noqa: E402
+from app.repositories import ProjectRepository  # noqa: E402
+from app.routers.projects import RESERVED_SLUGS  # noqa: E402
+from app.schemas import dump_projects_json  # noqa: E402
+from app.snapshot import CATALOG_SNAPSHOT_PATH, build_snapshot  # noqa: E402
+from app.static_export import STATIC_EXPORT_DIR, export_catalog  # noqa: E402
+
+
+def stable_id(kind: str, key: str) -> str:
+    """
+    Derive a row id from its natural key so ids survive reseeds.
+
+    Args:
+        kind: Entity kind, e.g. ``"project"``
+        key: Natural key, e.g. the project slug
+
+    Returns:
+        UUID string (deterministic for the same kind and key)
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"portfolio:{kind}:{key}"))
 
 
 def extract_technologies(description: str | None) -> list[str]:
@@ -168,139 +197,212 @@ def get_image_mappings() -> dict[str, list[dict]]:
     return result
 
 
-def seed_database():
-    """Seed the database with project data from CSV."""
-    # Initialize database tables
-    init_db()
+def build_catalog(db: Session) -> int:
+    """
+    Populate an empty database with project data from CSV.
 
-    # Create database session
-    db = SessionLocal()
+    Args:
+        db: Session bound to the database being built
 
-    try:
-        # Clear existing data
-        print("Clearing existing data...")
-        db.query(ProjectImage).delete()
-        db.query(Project).delete()
-        db.query(Technology).delete()
-        db.query(Role).delete()
-        db.commit()
-
-        # Get image mappings
-        image_mappings = get_image_mappings()
-
-        # Tracking sets for unique technologies and roles
-        technologies_dict = {}
-        roles_dict = {}
-
-        # Read and parse CSV
-        csv_path = (
-            backend_dir.parent
-            / "frontend"
-            / "src"
-            / "data"
-            / "projects-data"
-            / "projects-standardized.csv"
+    Returns:
+        Number of projects inserted
+    """
+    # Get image mappings
+    image_mappings = get_image_mappings()
+
+    # Tracking sets for unique technologies and roles
+    technologies_dict = {}
+    roles_dict = {}
+
+    # Read and parse CSV
+    csv_path = (
+        backend_dir.parent
+        / "frontend"
+        / "src"
+        / "data"
+        / "projects-data"
+        / "projects-standardized.csv"
+    )
+
+    print(f"Reading projects from {csv_path}...")
+
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
+        projects = list(reader)
+
+    print(f"Found {len(projects)} projects in CSV")
+
+    # Filter out invalid rows (rows without a slug or with malformed data)
+    valid_projects = []
+    for row in projects:
+        slug = row.get("Project Slug", "").strip() if row.get("Project Slug") else ""
+        title = row.get("Project Title", "").strip() if row.get("Project Title") else ""
+
+        # Skip rows with invalid slugs or titles that look like description fragments
+        if slug and title and not title.startswith("-") and not title.startswith("#"):
+            valid_projects.append(row)
+
+    print(f"Valid projects after filtering: {len(valid_projects)}")
+
+    # First pass: Extract all unique technologies and roles
+    print("Extracting technologies and roles...")
+    for row in valid_projects:
+        # Extract technologies
+        techs = extract_technologies(row.get("Full Description"))
+        for tech_name in techs:
+            if tech_name not in technologies_dict:
+                tech = Technology(id=stable_id("technology", tech_name), name=tech_name)
+                technologies_dict[tech_name] = tech
+
+        # Parse roles
+        role_names = parse_roles(row.get("Role(s)"))
+        for role_name in role_names:
+            if role_name not in roles_dict:
+                role = Role(id=stable_id("role", role_name), name=role_name)
+                roles_dict[role_name] = role
+
+    # Add technologies and roles to database
+    print(f"Adding {len(technologies_dict)} technologies...")
+    db.add_all(technologies_dict.values())
+
+    print(f"Adding {len(roles_dict)} roles...")
+    db.add_all(roles_dict.values())
+
+    db.commit()
+
+    # Second pass: Create projects with relationships
+    print("Creating projects...")
+    for order_num, row in enumerate(valid_projects):
+        project_slug = row["Project Slug"]
+        print(f"  - {row['Project Title']} ({project_slug})")
+
+        # Create project
+        project = Project(
+            id=stable_id("project", project_slug),
+            title=row["Project Title"],
+            slug=project_slug,
+            summary=row.get("Summary", ""),
+            description=row.get("Full Description", ""),
+            live_url=row.get("Live Site URL") if row.get("Live Site URL") != "None" else None,
+            github_url=row.get("GH Repo") if row.get("GH Repo") != "None" else None,
+            order_num=order_num,
         )
 
-        print(f"Reading projects from {csv_path}...")
-
-        with open(csv_path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            projects = list(reader)
-
-        print(f"Found {len(projects)} projects in CSV")
-
-        # Filter out invalid rows (rows without a slug or with malformed data)
-        valid_projects = []
-        for row in projects:
-            slug = row.get("Project Slug", "").strip() if row.get("Project Slug") else ""
-            title = row.get("Project Title", "").strip() if row.get("Project Title") else ""
-
-            # Skip rows with invalid slugs or titles that look like description fragments
-            if slug and title and not title.startswith("-") and not title.startswith("#"):
-                valid_projects.append(row)
-
-        print(f"Valid projects after filtering: {len(valid_projects)}")
-
-        # First pass: Extract all unique technologies and roles
-        print("Extracting technologies and roles...")
-        for row in valid_projects:
-            # Extract technologies
-            techs = extract_technologies(row.get("Full Description"))
-            for tech_name in techs:
-                if tech_name not in technologies_dict:
-                    tech = Technology(id=str(uuid.uuid4()), name=tech_name)
-                    technologies_dict[tech_name] = tech
-
-            # Parse roles
-            role_names = parse_roles(row.get("Role(s)"))
-            for role_name in role_names:
-                if role_name not in roles_dict:
-                    role = Role(id=str(uuid.uuid4()), name=role_name)
-                    roles_dict[role_name] = role
-
-        # Add technologies and roles to database
-        print(f"Adding {len(technologies_dict)} technologies...")
-        db.add_all(technologies_dict.values())
-
-        print(f"Adding {len(roles_dict)} roles...")
-        db.add_all(roles_dict.values())
-
-        db.commit()
-
-        # Second pass: Create projects with relationships
-        print("Creating projects...")
-        for order_num, row in enumerate(valid_projects):
-            project_slug = row["Project Slug"]
-            print(f"  - {row['Project Title']} ({project_slug})")
-
-            # Create project
-            project = Project(
-                id=str(uuid.uuid4()),
-                title=row["Project Title"],
-                slug=project_slug,
-                summary=row.get("Summary", ""),
-                description=row.get("Full Description", ""),
-                live_url=row.get("Live Site URL") if row.get("Live Site URL") != "None" else None,
-                github_url=row.get("GH Repo") if row.get("GH Repo") != "None" else None,
-                order_num=order_num,
-            )
-
-            # Add technology relationships
-            techs = extract_technologies(row.get("Full Description"))
-            for tech_name in techs:
-                project.technologies.append(technologies_dict[tech_name])
-
-            # Add role relationships
-            role_names = parse_roles(row.get("Role(s)"))
-            for role_name in role_names:
-                project.roles.append(roles_dict[role_name])
-
-            # Add images
-            if project_slug in image_mappings:
-                for img_data in image_mappings[project_slug]:
-                    image = ProjectImage(
-                        id=str(uuid.uuid4()),
-                        project_id=project.id,
-                        url=img_data["url"],
-                        alt_text=img_data["alt_text"],
-                        order_num=img_data["order_num"],
-                    )
-                    project.images.append(image)
-
-            db.add(project)
-
-        db.commit()
-        print(f"\n✓ Successfully seeded {len(valid_projects)} projects!")
-        print(f"✓ Created {len(technologies_dict)} technologies")
-        print(f"✓ Created {len(roles_dict)} roles")
+        # Add technology relationships
+        techs = extract_technologies(row.get("Full Description"))
+        for tech_name in techs:
+            project.technologies.append(technologies_dict[tech_name])
+
+        # Add role relationships
+        role_names = parse_roles(row.get("Role(s)"))
+        for role_name in role_names:
+            project.roles.append(roles_dict[role_name])
+
+        # Add images
+        if project_slug in image_mappings:
+            for img_data in image_mappings[project_slug]:
+                image = ProjectImage(
+                    id=stable_id("image", f"{project_slug}:{img_data['url']}"),
+                    project_id=project.id,
+                    url=img_data["url"],
+                    alt_text=img_data["alt_text"],
+                    order_num=img_data["order_num"],
+                )
+                project.images.append(image)
+
+        db.add(project)
+
+    db.commit()
+    print(f"✓ Created {len(technologies_dict)} technologies")
+    print(f"✓ Created {len(roles_dict)} roles")
+    return len(valid_projects)
+
+
+def validate_catalog(db: Session, expected_projects: int) -> None:
+    """
+    Check a freshly built catalog before it replaces the live database.
+
+    Args:
+        db: Session bound to the new database
+        expected_projects: Number of projects the build inserted
+
+    Raises:
+        ValueError: If the database is corrupt, inconsistent or incomplete, or a
+            project uses a slug shadowed by a fixed API path
+    """
+    integrity = db.execute(text("PRAGMA integrity_check")).scalar()
+    if integrity != "ok":
+        raise ValueError(f"integrity check failed: {integrity}")
+    if db.execute(text("PRAGMA foreign_key_check")).first() is not None:
+        raise ValueError("foreign key check failed")
+
+    projects = ProjectRepository(db).get_all_projects()
+    if not projects or len(projects) != expected_projects:
+        raise ValueError(f"expected {expected_projects} projects, found {len(projects)}")
+    reserved = sorted(project.slug for project in projects if project.slug in RESERVED_SLUGS)
+    if reserved:
+        raise ValueError(f"reserved project slugs: {', '.join(reserved)}")
+    # Serialize through the serving path so a bad row fails here, not in production
+    dump_projects_json(projects)
+
+
+def seed_database():
+    """
+    Seed the database with project data from CSV.
+
+    The catalog is built in a temporary file next to the live database,
+    validated, and renamed over it. Running workers keep serving the old
+    file until they notice the new inode and reopen their connection pools.
+    """
+    if not DATABASE_PATH or DATABASE_PATH == ":memory:":
+        print("✗ Error seeding database: DATABASE_URL must point at a SQLite file")
+        sys.exit(1)
+
+    target = Path(DATABASE_PATH).resolve()
+    fd, build_path = tempfile.mkstemp(
+        prefix=f".{target.name}.", suffix=".building", dir=target.parent
+    )
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{build_path}")
+
+    try:
+        print(f"Building catalog in {build_path}...")
+        Base.metadata.create_all(bind=engine)
+        # Built from the current models, so no migration applies to it
+        conn = sqlite3.connect(build_path)
+        stamp_schema_version(conn)
+        conn.close()
+        with sessionmaker(autocommit=False, autoflush=False, bind=engine)() as db:
+            num_projects = build_catalog(db)
+            print(f"✓ Stored {rebuild_related_projects(db)} related-project links")
+            version = stamp_catalog_versions(db, read_version_state(str(target)))
+            print(f"✓ Catalog version {version}")
+            print("Validating catalog...")
+            validate_catalog(db, num_projects)
+        engine.dispose()
+
+        mode = target.stat().st_mode & 0o777 if target.exists() else 0o644
+        os.chmod(build_path, mode)
+        os.replace(build_path, target)
+        print(f"\n✓ Successfully seeded {num_projects} projects into {target}")
+        touch_media_stamp(backend_dir / MEDIA_DIR)
+
+        if CATALOG_SNAPSHOT_PATH:
+            with SessionLocal() as db:
+                generation = build_snapshot(db, CATALOG_SNAPSHOT_PATH)
+            print(f"✓ Wrote catalog snapshot generation {generation}")
+
+        if STATIC_EXPORT_DIR:
+            with SessionLocal() as db:
+                count = export_catalog(db, STATIC_EXPORT_DIR)
+            print(f"✓ Exported {count} JSON documents to {STATIC_EXPORT_DIR}")
 
     except Exception as e:
         print(f"\n✗ Error seeding database: {e}")
-        db.rollback()
+        engine.dispose()
+        if os.path.exists(build_path):
+            os.unlink(build_path)
         sys.exit(1)
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,20 @@
 """Pytest fixtures for testing."""
 
 import uuid
+from contextlib import contextmanager
 
 import pytest
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.database import Base
+from app.cache import response_cache
+from app.database import Base, get_db
+from app.main import app
 
 # Import models FIRST to register them with Base.metadata
 from app.models import Project, ProjectImage, Role, Technology  # noqa: F401
+from tests.query_counter import QueryCounter
 
 
 @pytest.fixture(scope="function")
@@ -48,6 +53,53 @@ def test_session(test_db):
     session.close()
 
 
+@pytest.fixture
+def client(test_db, test_session, monkeypatch):
+    """Create a test client with database session override."""
+    # Startup warm-up would cache responses before the test has added its data
+    monkeypatch.setattr("app.warmup.STARTUP_WARMUP", False)
+
+    # Override the get_db dependency to use the test database
+    def override_get_db():
+        # Create a new session from the test database for each request
+        session_local = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    response_cache.clear()
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+    response_cache.clear()
+
+
+@pytest.fixture
+def assert_queries(test_db):
+    """
+    Assert the number of SQL statements (and optionally rows) run inside a block.
+
+    Usage:
+        with assert_queries(statements=1, max_rows=50):
+            client.get("/api/projects")
+    """
+
+    @contextmanager
+    def _assert_queries(statements: int, max_rows: int | None = None):
+        with QueryCounter(test_db) as counter:
+            yield counter
+        assert counter.count == statements, counter.report()
+        if max_rows is not None:
+            assert counter.rows <= max_rows, counter.report()
+
+    return _assert_queries
+
+
 @pytest.fixture
 def sample_technology(test_session):
     """Create a sample Technology for testing."""
@@ -0,0 +1,10 @@
+"""Helpers for comparing rendered project documents across backends."""
+
+
+def normalized(document):
+    """Sort unordered collections (technologies, roles) so documents compare by content."""
+    projects = document if isinstance(document, list) else [document]
+    for project in projects:
+        project["technologies"].sort(key=lambda item: item["id"])
+        project["roles"].sort(key=lambda item: item["id"])
+    return document
@@ -0,0 +1,43 @@
+"""SQL statement and row counting for query-plan regression tests."""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """
+    Context manager recording every statement an engine executes while active.
+
+    Rows are counted per SELECT by running ``count(*)`` over the same statement
+    and parameters on the raw DBAPI connection, so the total reflects the rows
+    the database produced for the ORM regardless of how they were fetched.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: list[str] = []
+        self.rows = 0
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed."""
+        return len(self.statements)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "after_cursor_execute", self._after_cursor_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        if statement.lstrip().upper().startswith("SELECT"):
+            row = cursor.connection.execute(f"SELECT count(*) FROM ({statement})", parameters)
+            self.rows += row.fetchone()[0]
+
+    def report(self) -> str:
+        """Human-readable listing of the captured statements for assertion messages."""
+        lines = [f"{self.count} statements, {self.rows} rows:"]
+        lines.extend(f"  [{i}] {' '.join(sql.split())}" for i, sql in enumerate(self.statements))
+        return "\n".join(lines)
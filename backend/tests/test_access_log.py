@@ -0,0 +1,138 @@
+"""Tests for structured access logging through the background log writer."""
+
+import io
+import json
+import logging
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from app.logging_config import JsonFormatter, configure_logging, shutdown_logging
+from app.middleware.access_log import AccessLogMiddleware
+from benchmarks.catalog import populate_catalog
+
+
+def access_records(caplog) -> list[dict]:
+    return [record.fields for record in caplog.records if record.name == "app.access"]
+
+
+def test_json_formatter_merges_fields():
+    """Test records become one JSON object with the structured fields at top level."""
+    record = logging.LogRecord("app.access", logging.INFO, __file__, 1, "request", None, None)
+    record.fields = {"status": 200, "route": "/api/projects"}
+
+    line = JsonFormatter().format(record)
+
+    assert "\n" not in line
+    entry = json.loads(line)
+    assert entry["message"] == "request"
+    assert entry["level"] == "INFO"
+    assert entry["status"] == 200
+    assert entry["route"] == "/api/projects"
+    assert entry["ts"].endswith("+00:00")
+
+
+def test_records_are_written_by_the_listener():
+    """Test records logged in the request path reach the stream via the queue."""
+    stream = io.StringIO()
+    listener = configure_logging(stream, level="INFO")
+    try:
+        logging.getLogger("app.access").info("request", extra={"fields": {"status": 204}})
+    finally:
+        shutdown_logging(listener)
+
+    assert json.loads(stream.getvalue())["status"] == 204
+    assert not any(
+        isinstance(handler, logging.handlers.QueueHandler)
+        for handler in logging.getLogger().handlers
+    )
+
+
+class TestAccessLog:
+    """Tests for the records the app writes per request."""
+
+    def test_logs_route_status_bytes_and_db_time(self, client, test_session, caplog):
+        """Test a cold detail request logs its route template and the SQL it ran."""
+        populate_catalog(test_session, 3)
+
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="app.access"):
+            response = client.get(
+                "/api/projects/project-00001", headers={"Accept-Encoding": "identity"}
+            )
+
+        [entry] = access_records(caplog)
+        assert entry["method"] == "GET"
+        assert entry["route"] == "/api/projects/{slug}"
+        assert entry["path"] == "/api/projects/project-00001"
+        assert entry["status"] == 200
+        assert entry["bytes"] == len(response.content)
+        assert entry["db_queries"] > 0
+        assert entry["db_ms"] > 0
+        assert entry["duration_ms"] >= entry["db_ms"]
+
+    def test_cached_response_runs_no_sql(self, client, test_session, caplog):
+        """Test a cache hit is logged with no database time."""
+        populate_catalog(test_session, 3)
+        client.get("/api/projects")
+        caplog.clear()
+
+        with caplog.at_level(logging.INFO, logger="app.access"):
+            client.get("/api/projects")
+
+        [entry] = access_records(caplog)
+        assert entry["db_queries"] == 0
+        assert entry["db_ms"] == 0
+
+
+class TestSampling:
+    """Tests for sampling successful requests."""
+
+    @staticmethod
+    def make_app(**options) -> FastAPI:
+        app = FastAPI()
+        app.add_middleware(AccessLogMiddleware, **options)
+
+        @app.get("/ok")
+        async def ok():
+            return {"ok": True}
+
+        @app.get("/missing")
+        async def missing():
+            raise HTTPException(status_code=404)
+
+        return app
+
+    async def get(self, app: FastAPI, paths: list[str]) -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for path in paths:
+                await client.get(path)
+
+    async def test_successes_are_sampled_errors_are_not(self, caplog):
+        """Test successful requests are logged at the sample rate, errors always."""
+        draws = iter([0.05, 0.5, 0.05])
+        app = self.make_app(sample_rate=0.1, rng=lambda: next(draws))
+
+        with caplog.at_level(logging.INFO, logger="app.access"):
+            await self.get(app, ["/ok", "/ok", "/missing", "/ok"])
+
+        assert [entry["status"] for entry in access_records(caplog)] == [200, 404, 200]
+
+    async def test_slow_requests_are_always_logged(self, caplog):
+        """Test requests over the slow threshold bypass sampling."""
+        app = self.make_app(sample_rate=0, slow_ms=0)
+
+        with caplog.at_level(logging.INFO, logger="app.access"):
+            await self.get(app, ["/ok"])
+
+        assert len(access_records(caplog)) == 1
+
+    async def test_disabled_logger_skips_instrumentation(self, caplog):
+        """Test nothing is recorded when the access logger is off."""
+        app = self.make_app()
+
+        with caplog.at_level(logging.WARNING, logger="app.access"):
+            await self.get(app, ["/missing"])
+
+        assert access_records(caplog) == []
@@ -0,0 +1,108 @@
+"""Tests for the batch project lookup endpoint."""
+
+import pytest
+
+import app.routers.projects as projects_router
+from app.routers.projects import MAX_BATCH_SLUGS, RESERVED_SLUGS
+from benchmarks.catalog import populate_catalog
+
+
+@pytest.fixture
+def catalog(test_session):
+    populate_catalog(test_session, 20)
+
+
+def test_batch_preserves_order_and_reports_missing(client, catalog):
+    """Test projects come back in request order with unknown slugs listed."""
+    response = client.get(
+        "/api/projects/batch", params={"slugs": "project-00009,nope,project-00002,project-00015"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [project["slug"] for project in data["projects"]] == [
+        "project-00009",
+        "project-00002",
+        "project-00015",
+    ]
+    assert data["missing"] == ["nope"]
+    assert "liveUrl" in data["projects"][0]
+
+
+def test_batch_matches_detail_documents(client, catalog):
+    """Test each batched project equals the detail endpoint's document."""
+    batch = client.get("/api/projects/batch", params={"slugs": "project-00004,project-00011"})
+
+    for project in batch.json()["projects"]:
+        assert project == client.get(f"/api/projects/{project['slug']}").json()
+
+
+def test_batch_query_count_is_flat(client, catalog, assert_queries):
+    """Test any number of slugs costs one IN query plus one per collection."""
+    slugs = ",".join(f"project-{i:05d}" for i in range(20))
+    with assert_queries(statements=4):
+        response = client.get("/api/projects/batch", params={"slugs": slugs})
+
+    assert len(response.json()["projects"]) == 20
+
+
+def test_batch_reuses_cached_details(client, catalog, assert_queries):
+    """Test cached detail payloads are stitched in and only misses hit the database."""
+    client.get("/api/projects/project-00001")
+    client.get("/api/projects/batch", params={"slugs": "project-00002"})
+
+    with assert_queries(statements=0):
+        response = client.get(
+            "/api/projects/batch", params={"slugs": "project-00001,project-00002"}
+        )
+    assert [project["slug"] for project in response.json()["projects"]] == [
+        "project-00001",
+        "project-00002",
+    ]
+
+
+def test_batch_deduplicates_and_ignores_blanks(client, catalog):
+    """Test repeated slugs and empty items are collapsed."""
+    response = client.get(
+        "/api/projects/batch", params={"slugs": " project-00003, ,project-00003,"}
+    )
+    assert [project["slug"] for project in response.json()["projects"]] == ["project-00003"]
+
+
+@pytest.mark.parametrize(
+    "slugs",
+    [",,", ",".join(f"slug-{i}" for i in range(MAX_BATCH_SLUGS + 1))],
+    ids=["empty", "too-many"],
+)
+def test_batch_rejects_bad_requests(client, slugs):
+    """Test empty and oversized batches are rejected."""
+    assert client.get("/api/projects/batch", params={"slugs": slugs}).status_code == 400
+
+
+def test_batch_requires_slugs(client):
+    """Test the slugs parameter is required."""
+    assert client.get("/api/projects/batch").status_code == 422
+
+
+@pytest.mark.parametrize("backend", ["json", "readmodel"])
+def test_batch_uses_configured_backend(client, catalog, monkeypatch, backend):
+    """Test batch documents come from PROJECT_BACKEND and match its detail documents."""
+    monkeypatch.setattr("app.routers.projects.PROJECT_BACKEND", backend)
+    calls = []
+    render = projects_router.render_projects_by_slugs
+    monkeypatch.setattr(
+        projects_router,
+        "render_projects_by_slugs",
+        lambda db, slugs: calls.append(slugs) or render(db, slugs),
+    )
+
+    batch = client.get("/api/projects/batch", params={"slugs": "project-00004,nope"}).json()
+
+    assert calls == [["project-00004", "nope"]]
+    assert batch["missing"] == ["nope"]
+    assert batch["projects"] == [client.get("/api/projects/project-00004").json()]
+
+
+def test_fixed_paths_are_reserved_slugs():
+    """Test slugs shadowed by fixed /projects/... routes are reported as reserved."""
+    assert RESERVED_SLUGS == {"batch", "changes", "events", "export.ndjson"}
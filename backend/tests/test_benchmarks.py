@@ -0,0 +1,78 @@
+"""Tests for the benchmark catalog generator and result helpers."""
+
+import sqlite3
+
+from app.models import Project, ProjectImage
+from benchmarks.catalog import (
+    IMAGES_PER_PROJECT,
+    ROLES_PER_PROJECT,
+    TECHNOLOGIES_PER_PROJECT,
+    create_catalog_database,
+    populate_catalog,
+)
+from benchmarks.harness import compare_results, summarize
+
+
+def test_populate_catalog_fan_out(test_session):
+    """Test that synthetic projects stay within the configured fan-out ranges."""
+    stats = populate_catalog(test_session, 25, seed=7)
+
+    projects = test_session.query(Project).all()
+    assert stats.projects == len(projects) == 25
+    assert stats.images == test_session.query(ProjectImage).count()
+
+    for project in projects:
+        assert (
+            TECHNOLOGIES_PER_PROJECT[0] <= len(project.technologies) <= TECHNOLOGIES_PER_PROJECT[1]
+        )
+        assert ROLES_PER_PROJECT[0] <= len(project.roles) <= ROLES_PER_PROJECT[1]
+        assert IMAGES_PER_PROJECT[0] <= len(project.images) <= IMAGES_PER_PROJECT[1]
+
+
+def test_create_catalog_database_is_reproducible(tmp_path):
+    """Test that the same seed always produces the same catalog."""
+
+    def dump(db_path):
+        with sqlite3.connect(db_path) as conn:
+            return {
+                table: conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+                for table in ("projects", "project_images", "project_technologies")
+            }
+
+    create_catalog_database(str(tmp_path / "a.db"), 5, seed=3)
+    create_catalog_database(str(tmp_path / "b.db"), 5, seed=3)
+
+    assert dump(tmp_path / "a.db") == dump(tmp_path / "b.db")
+
+
+def test_summarize_percentiles():
+    """Test latency summary statistics."""
+    summary = summarize([float(ms) for ms in range(1, 101)], elapsed_s=2.0, errors=1)
+
+    assert summary["operations"] == 100
+    assert summary["errors"] == 1
+    assert summary["throughput_ops"] == 50.0
+    assert summary["latency_ms"]["min"] == 1.0
+    assert summary["latency_ms"]["p50"] == 51.0
+    assert summary["latency_ms"]["max"] == 100.0
+
+
+def test_compare_results_matches_scenarios():
+    """Test comparing two runs pairs scenarios by name and catalog size."""
+
+    def run(p50, rps):
+        entry = {"scenario": "projects_list", "catalog_size": 10, "throughput_ops": rps}
+        entry["latency_ms"] = {"p50": p50, "p95": p50 * 2}
+        return {"meta": {}, "results": [entry]}
+
+    rows = compare_results(run(10.0, 100.0), run(5.0, 200.0))
+
+    assert rows == [
+        {
+            "scenario": "projects_list",
+            "catalog_size": 10,
+            "p50_change_pct": -50.0,
+            "p95_change_pct": -50.0,
+            "throughput_change_pct": 100.0,
+        }
+    ]
@@ -0,0 +1,121 @@
+"""Tests for catalog versioning and the delta sync endpoint."""
+
+import pytest
+
+from app.catalog_versions import (
+    catalog_version,
+    get_changes,
+    project_content_hash,
+    read_version_state,
+    stamp_catalog_versions,
+)
+from app.models import Project, ProjectVersion
+from benchmarks.catalog import populate_catalog
+
+
+@pytest.fixture
+def versioned(test_db, test_session):
+    """Catalog of 10 projects stamped as version 1; returns a restamp helper."""
+    populate_catalog(test_session, 10)
+    stamp_catalog_versions(test_session, {})
+
+    def restamp() -> int:
+        # The seeder reads the previous state from the file it replaces
+        return stamp_catalog_versions(test_session, read_version_state(test_db.url.database))
+
+    return restamp
+
+
+def get_project(session, slug: str) -> Project:
+    return session.query(Project).filter_by(slug=slug).one()
+
+
+def test_first_stamp_versions_everything(test_session, versioned):
+    """Test an unversioned catalog starts at version 1."""
+    assert catalog_version(test_session) == 1
+    version, upserted, deleted = get_changes(test_session, 0)
+    assert version == 1
+    assert len(upserted) == 10
+    assert deleted == []
+
+
+def test_unchanged_reseed_keeps_version(test_session, versioned):
+    """Test restamping identical content does not bump the version."""
+    assert versioned() == 1
+    assert get_changes(test_session, 1) == (1, [], [])
+
+
+def test_changed_and_deleted_projects(test_session, versioned):
+    """Test edits and removals are reported after the version they happened in."""
+    get_project(test_session, "project-00003").title = "Renamed"
+    test_session.delete(get_project(test_session, "project-00007"))
+    test_session.commit()
+
+    assert versioned() == 2
+    assert get_changes(test_session, 1) == (2, ["project-00003"], ["project-00007"])
+
+    # Tombstones persist for clients further behind
+    get_project(test_session, "project-00001").summary = "Changed again"
+    test_session.commit()
+    assert versioned() == 3
+    assert get_changes(test_session, 2) == (3, ["project-00001"], [])
+    assert get_changes(test_session, 1) == (
+        3,
+        ["project-00003", "project-00001"],
+        ["project-00007"],
+    )
+
+
+def test_readded_slug_is_upserted(test_session, versioned):
+    """Test a slug deleted and later re-created comes back as an upsert."""
+    project = get_project(test_session, "project-00002")
+    snapshot = {column: getattr(project, column) for column in ("id", "title", "slug")}
+    test_session.delete(project)
+    test_session.commit()
+    versioned()
+
+    test_session.add(Project(**snapshot, summary="s", description="d"))
+    test_session.commit()
+    assert versioned() == 3
+    assert test_session.get(ProjectVersion, "project-00002").deleted is False
+    assert get_changes(test_session, 2) == (3, ["project-00002"], [])
+
+
+def test_hash_ignores_collection_order(test_session, versioned):
+    """Test reordering technologies does not count as a change."""
+    project = get_project(test_session, "project-00005")
+    before = project_content_hash(project)
+    project.technologies.reverse()
+    assert project_content_hash(project) == before
+
+
+class TestChangesEndpoint:
+    """Tests for GET /api/projects/changes."""
+
+    def test_since_zero_lists_catalog(self, client, versioned):
+        """Test a fresh client receives every slug."""
+        data = client.get("/api/projects/changes").json()
+        assert data["version"] == 1
+        assert len(data["upserted"]) == 10
+        assert data["reset"] is False
+
+    def test_up_to_date_client(self, client, versioned):
+        """Test a synced client gets an empty delta."""
+        data = client.get("/api/projects/changes", params={"since": 1}).json()
+        assert data == {"version": 1, "upserted": [], "deleted": [], "reset": False}
+
+    def test_client_ahead_of_catalog_resets(self, client, versioned):
+        """Test a version from a replaced catalog history triggers a full resync."""
+        data = client.get("/api/projects/changes", params={"since": 42}).json()
+        assert data["reset"] is True
+        assert data["version"] == 1
+        assert len(data["upserted"]) == 10
+
+    def test_rejects_negative_version(self, client):
+        """Test since must be non-negative."""
+        assert client.get("/api/projects/changes", params={"since": -1}).status_code == 422
+
+    def test_single_indexed_query(self, client, versioned, assert_queries):
+        """Test a delta is one query on the version index."""
+        with assert_queries(statements=1):
+            client.get("/api/projects/changes", params={"since": 0})
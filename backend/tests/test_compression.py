@@ -0,0 +1,99 @@
+"""Tests for response compression and the cached payload variants."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.cache import CachedPayload, response_cache
+from app.middleware.compression import compress, negotiate_encoding
+from app.routers.projects import PROJECT_LIST_KEY
+from benchmarks.catalog import populate_catalog
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("gzip;q=0.2, *;q=0.1", "gzip"),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    """Test Accept-Encoding negotiation honours q-values and preference order."""
+    assert negotiate_encoding(header) == expected
+
+
+def test_cached_payload_compresses_once():
+    """Test that each encoding is computed once and then reused."""
+    payload = CachedPayload(b'{"key": "value"}' * 100)
+
+    with patch("app.cache.compress", wraps=compress) as compress_spy:
+        first = payload.encoded("gzip")
+        second = payload.encoded("gzip")
+
+    assert first is second
+    assert compress_spy.call_count == 1
+
+
+class TestProjectListCompression:
+    """Tests for compressed /api/projects responses."""
+
+    @pytest.fixture(autouse=True)
+    def catalog(self, test_session):
+        populate_catalog(test_session, 10)
+
+    @pytest.mark.parametrize("encoding", ["br", "gzip"])
+    def test_compressed_body_matches_identity(self, client, encoding):
+        """Test compressed responses decode to the identity body."""
+        identity = client.get("/api/projects", headers={"Accept-Encoding": "identity"})
+        compressed = client.get("/api/projects", headers={"Accept-Encoding": encoding})
+
+        assert "content-encoding" not in identity.headers
+        assert compressed.headers["content-encoding"] == encoding
+        assert "Accept-Encoding" in compressed.headers["vary"]
+        # httpx decodes transparently; the decoded body must be identical
+        assert compressed.content == identity.content
+
+    def test_compressed_bytes_are_reused(self, client):
+        """Test the cached payload is compressed once across requests."""
+        with patch("app.cache.compress", wraps=compress) as compress_spy:
+            for _ in range(3):
+                response = client.get("/api/projects", headers={"Accept-Encoding": "br"})
+                assert response.status_code == 200
+
+        assert compress_spy.call_count == 1
+        assert response_cache.get(PROJECT_LIST_KEY).has_encoding("br")
+
+
+def test_middleware_compresses_uncached_json(client):
+    """Test the middleware compresses large dynamic JSON like the OpenAPI schema."""
+    response = client.get("/api/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["info"]["title"] == "Portfolio API"
+
+
+def test_middleware_skips_small_responses(client):
+    """Test tiny bodies such as the health check are left uncompressed."""
+    response = client.get("/api/health", headers={"Accept-Encoding": "br, gzip"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_middleware_skips_images(client):
+    """Test already-compressed media types are not recompressed."""
+    response = client.get(
+        "/images/projects/scratch-map/scratch-map-1.png", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
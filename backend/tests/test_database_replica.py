@@ -0,0 +1,166 @@
+"""Tests for the in-memory SQLite replica mode and database swap detection."""
+
+import os
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import app.database as database
+from app.database import InMemoryReplica, create_replica_engine
+from app.repositories import ProjectRepository
+from benchmarks.catalog import create_catalog_database
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    create_catalog_database(path, 5)
+    return path
+
+
+def count_projects(engine) -> int:
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT count(*) FROM projects")).scalar_one()
+
+
+def delete_project(path: str, slug: str) -> None:
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM projects WHERE slug = ?", (slug,))
+
+
+def test_replica_serves_copy_of_file(catalog_path):
+    """Test the engine reads the catalog from memory, not the file."""
+    replica = InMemoryReplica(catalog_path)
+    engine = create_replica_engine(replica)
+
+    with sessionmaker(bind=engine)() as db:
+        project = ProjectRepository(db).get_project_by_slug("project-00002")
+        assert project is not None
+        assert project.technologies
+
+    assert replica.uri.startswith("file:portfolio-replica-")
+    # Changes committed to the file are not visible until the replica reloads
+    delete_project(catalog_path, "project-00002")
+    assert count_projects(engine) == 5
+    engine.dispose()
+
+
+def test_replica_detects_and_loads_new_data(catalog_path):
+    """Test a commit to the source marks the replica stale and reload picks it up."""
+    replica = InMemoryReplica(catalog_path)
+    engine = create_replica_engine(replica)
+    assert count_projects(engine) == 5
+    assert not replica.is_stale()
+
+    delete_project(catalog_path, "project-00000")
+    assert replica.is_stale()
+
+    replica.load()
+    engine.dispose()
+    assert not replica.is_stale()
+    assert count_projects(engine) == 4
+    engine.dispose()
+
+
+def test_checked_out_connection_keeps_previous_snapshot(catalog_path):
+    """Test a reload does not change data under an in-flight connection."""
+    replica = InMemoryReplica(catalog_path)
+    engine = create_replica_engine(replica)
+
+    with engine.connect() as in_flight:
+        delete_project(catalog_path, "project-00000")
+        replica.load()
+        engine.dispose()
+
+        assert in_flight.execute(text("SELECT count(*) FROM projects")).scalar_one() == 5
+        assert count_projects(engine) == 4
+    engine.dispose()
+
+
+def test_refresh_if_stale_reloads_and_notifies(catalog_path, monkeypatch):
+    """Test the get_db hook reloads, disposes the pool and runs listeners."""
+    replica = InMemoryReplica(catalog_path)
+    engine = create_replica_engine(replica)
+    monkeypatch.setattr(database, "replica", replica)
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "_last_refresh_check", 0.0)
+    monkeypatch.setattr(database, "DATABASE_REFRESH_INTERVAL", 0.0)
+    notified = []
+    monkeypatch.setattr(database, "_refresh_listeners", [lambda: notified.append(True)])
+
+    assert count_projects(engine) == 5
+    assert database.refresh_if_stale() is False
+
+    delete_project(catalog_path, "project-00001")
+    assert database.refresh_if_stale() is True
+    assert notified == [True]
+    assert count_projects(engine) == 4
+    engine.dispose()
+
+
+def swap_in_catalog(path: str, num_projects: int) -> None:
+    """Build a catalog next to ``path`` and rename it into place, like the seeder."""
+    build_path = path + ".building"
+    create_catalog_database(build_path, num_projects)
+    os.replace(build_path, path)
+
+
+def test_replica_reloads_after_file_swap(catalog_path):
+    """Test renaming a new file over the source is detected despite the old handle."""
+    replica = InMemoryReplica(catalog_path)
+    engine = create_replica_engine(replica)
+    assert count_projects(engine) == 5
+
+    swap_in_catalog(catalog_path, 8)
+    assert replica.is_stale()
+
+    replica.load()
+    engine.dispose()
+    assert count_projects(engine) == 8
+    assert not replica.is_stale()
+    engine.dispose()
+
+
+class TestFileSwapRefresh:
+    """Tests for refresh_if_stale with the default file-backed engine."""
+
+    @pytest.fixture
+    def file_engine(self, catalog_path, monkeypatch):
+        engine = create_engine(
+            f"sqlite:///{catalog_path}", connect_args={"check_same_thread": False}
+        )
+        monkeypatch.setattr(database, "replica", None)
+        monkeypatch.setattr(database, "engine", engine)
+        monkeypatch.setattr(database, "DATABASE_PATH", catalog_path)
+        monkeypatch.setattr(database, "_database_identity", database.file_identity(catalog_path))
+        monkeypatch.setattr(database, "_last_refresh_check", 0.0)
+        monkeypatch.setattr(database, "DATABASE_REFRESH_INTERVAL", 0.0)
+        monkeypatch.setattr(database, "_refresh_listeners", [])
+        yield engine
+        engine.dispose()
+
+    def test_unchanged_file_does_not_refresh(self, file_engine):
+        """Test in-place reads never trigger a pool reset."""
+        generation = database.database_generation()
+        assert database.refresh_if_stale() is False
+        assert database.database_generation() == generation
+
+    def test_swap_disposes_pool_and_notifies(self, file_engine, catalog_path):
+        """Test a renamed-in file is served after refresh while in-flight reads finish."""
+        notified = []
+        database.on_database_refresh(lambda: notified.append(True))
+        generation = database.database_generation()
+
+        with file_engine.connect() as in_flight:
+            swap_in_catalog(catalog_path, 8)
+            assert database.refresh_if_stale() is True
+
+            # The in-flight connection still reads the replaced file
+            assert in_flight.execute(text("SELECT count(*) FROM projects")).scalar_one() == 5
+            assert count_projects(file_engine) == 8
+
+        assert notified == [True]
+        assert database.database_generation() == generation + 1
+        assert database.refresh_if_stale() is False
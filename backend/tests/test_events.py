@@ -0,0 +1,158 @@
+"""Tests for the catalog update Server-Sent Events stream."""
+
+import asyncio
+
+import pytest
+
+import app.events as events
+from app.events import HEARTBEAT, CatalogEventBroker, format_event
+from app.main import app
+from app.middleware.compression import is_compressible
+
+IDLE_SUBSCRIBERS = 2000
+
+
+async def next_frame(stream) -> bytes:
+    return await asyncio.wait_for(stream.__anext__(), timeout=5)
+
+
+class TestBroker:
+    """Unit tests for CatalogEventBroker."""
+
+    async def test_initial_event_then_changes(self):
+        """Test a stream announces the current version, then each published one."""
+        broker = CatalogEventBroker(read_version=lambda: 3)
+        stream = broker.stream()
+
+        assert (await next_frame(stream)).startswith(b"retry: ")
+        assert await next_frame(stream) == format_event(3, broker.generation)
+        assert broker.subscribers == 1
+
+        broker.publish(4)
+        assert (await next_frame(stream)).startswith(b"id: 4\nevent: version\n")
+
+        await stream.aclose()
+        assert broker.subscribers == 0
+
+    async def test_last_event_id_skips_current_version(self, monkeypatch):
+        """Test a reconnecting client that is up to date only gets heartbeats."""
+        monkeypatch.setattr(events, "EVENTS_HEARTBEAT_INTERVAL", 0.01)
+        broker = CatalogEventBroker(read_version=lambda: 3)
+        stream = broker.stream(last_event_id="3")
+
+        await next_frame(stream)
+        assert await next_frame(stream) == HEARTBEAT
+        await stream.aclose()
+
+    async def test_slow_client_only_sees_latest_version(self):
+        """Test versions published while a client is not reading are coalesced."""
+        broker = CatalogEventBroker(read_version=lambda: 1)
+        stream = broker.stream()
+        await next_frame(stream)
+        await next_frame(stream)
+
+        for version in range(2, 50):
+            broker.publish(version)
+        assert (await next_frame(stream)).startswith(b"id: 49\n")
+        await stream.aclose()
+
+    async def test_poll_publishes_on_new_generation(self, monkeypatch):
+        """Test a database swap detected by the watcher is announced."""
+        versions = iter([1, 2])
+        broker = CatalogEventBroker(read_version=lambda: next(versions))
+        monkeypatch.setattr(events, "refresh_if_stale", lambda: False)
+        monkeypatch.setattr(events, "database_generation", lambda: 0)
+        stream = broker.stream()
+        await next_frame(stream)
+        await next_frame(stream)
+
+        assert await broker.poll() is False
+        monkeypatch.setattr(events, "database_generation", lambda: 1)
+        assert await broker.poll() is True
+        assert (await next_frame(stream)).startswith(b"id: 2\n")
+        await stream.aclose()
+
+    async def test_many_idle_subscribers_share_one_wakeup(self):
+        """Test thousands of idle streams are all woken by a single publish."""
+        broker = CatalogEventBroker(read_version=lambda: 1)
+        streams = [broker.stream() for _ in range(IDLE_SUBSCRIBERS)]
+        for stream in streams:
+            await next_frame(stream)
+            await next_frame(stream)
+        assert broker.subscribers == IDLE_SUBSCRIBERS
+
+        pending = [asyncio.ensure_future(stream.__anext__()) for stream in streams]
+        await asyncio.sleep(0)
+        broker.publish(2)
+        frames = await asyncio.wait_for(asyncio.gather(*pending), timeout=10)
+
+        assert all(frame.startswith(b"id: 2\n") for frame in frames)
+        for stream in streams:
+            await stream.aclose()
+        assert broker.subscribers == 0
+
+
+class TestEventsEndpoint:
+    """Tests for GET /api/projects/events through the full middleware stack."""
+
+    @pytest.fixture(autouse=True)
+    def broker(self, monkeypatch):
+        broker = CatalogEventBroker(read_version=lambda: 7)
+        monkeypatch.setattr("app.routers.projects.catalog_events", broker)
+        return broker
+
+    async def test_streams_uncompressed_events(self, broker):
+        """Test the stream is sent as it is produced, even to clients accepting br."""
+        messages = []
+        first_event = asyncio.Event()
+        disconnect = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+            if b"event: version" in message.get("body", b""):
+                first_event.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/projects/events",
+            "raw_path": b"/api/projects/events",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"test"), (b"accept-encoding", b"br, gzip")],
+            "client": ("127.0.0.1", 1234),
+            "server": ("test", 80),
+        }
+        task = asyncio.ensure_future(app(scope, receive, send))
+        await asyncio.wait_for(first_event.wait(), timeout=5)
+        disconnect.set()
+        await asyncio.wait_for(task, timeout=5)
+
+        start = messages[0]
+        headers = {key.decode(): value.decode() for key, value in start["headers"]}
+        assert start["status"] == 200
+        assert headers["content-type"].startswith("text/event-stream")
+        assert "content-encoding" not in headers
+        assert headers["cache-control"] == "no-cache"
+        body = b"".join(message.get("body", b"") for message in messages[1:])
+        assert format_event(7, broker.generation) in body
+
+    def test_rejects_when_full(self, client, monkeypatch):
+        """Test a worker at its stream limit sheds new connections with 503."""
+        monkeypatch.setattr(events, "EVENTS_MAX_SUBSCRIBERS", 0)
+        response = client.get("/api/projects/events")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+
+
+def test_event_stream_is_not_compressible():
+    """Test the compression middleware leaves event streams alone."""
+    assert not is_compressible("text/event-stream; charset=utf-8")
+    assert is_compressible("text/html; charset=utf-8")
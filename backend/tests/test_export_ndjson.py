@@ -0,0 +1,94 @@
+"""Tests for the streaming NDJSON catalog export."""
+
+import json
+
+import pytest
+from sqlalchemy import update
+
+import app.routers.projects as projects_router
+from app.middleware.load_shedding import request_limiter
+from app.models import Project
+from benchmarks.catalog import populate_catalog
+
+PAGE_SIZE = 10
+
+
+@pytest.fixture(autouse=True)
+def small_pages(monkeypatch):
+    monkeypatch.setattr(projects_router, "EXPORT_PAGE_SIZE", PAGE_SIZE)
+
+
+def read_lines(client) -> list[dict]:
+    response = client.get("/api/projects/export.ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.endswith("\n")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def normalized(project: dict) -> dict:
+    """Sort many-to-many collections, whose order depends on how they were loaded."""
+    for key in ("technologies", "roles"):
+        project[key].sort(key=lambda item: item["id"])
+    return project
+
+
+def test_streams_every_project_in_list_order(client, test_session):
+    """Test each line is one project document, in the same order as /projects."""
+    populate_catalog(test_session, 25)
+
+    lines = [normalized(line) for line in read_lines(client)]
+
+    assert lines == [normalized(project) for project in client.get("/api/projects").json()]
+    detail = client.get(f"/api/projects/{lines[3]['slug']}").json()
+    assert lines[3] == normalized(detail)
+
+
+def test_reads_in_keyset_pages(client, test_session, assert_queries):
+    """Test the catalog is read one bounded page at a time."""
+    populate_catalog(test_session, 25)
+
+    # Three pages, each one project query plus one per collection
+    with assert_queries(statements=12):
+        assert len(read_lines(client)) == 25
+
+
+def test_exact_multiple_of_page_size(client, test_session, assert_queries):
+    """Test a final empty page ends the stream without loading collections."""
+    populate_catalog(test_session, 2 * PAGE_SIZE)
+
+    with assert_queries(statements=9):
+        assert len(read_lines(client)) == 2 * PAGE_SIZE
+
+
+def test_duplicate_order_nums_are_not_skipped(client, test_session):
+    """Test the id tie-breaker keeps pages disjoint when order_num repeats."""
+    populate_catalog(test_session, 25)
+    test_session.execute(update(Project).values(order_num=1))
+    test_session.commit()
+
+    slugs = [line["slug"] for line in read_lines(client)]
+
+    assert sorted(slugs) == sorted(f"project-{i:05d}" for i in range(25))
+
+
+def test_empty_catalog(client):
+    """Test an empty catalog streams an empty body."""
+    assert client.get("/api/projects/export.ndjson").content == b""
+
+
+def test_each_page_takes_a_concurrency_slot(client, test_session, monkeypatch):
+    """Test page queries count against the request limit after the response started."""
+    populate_catalog(test_session, 25)
+    render_export_page = projects_router.render_export_page
+    active = []
+
+    def recording_render(db, after):
+        active.append(request_limiter.active)
+        return render_export_page(db, after)
+
+    monkeypatch.setattr(projects_router, "render_export_page", recording_render)
+
+    assert len(read_lines(client)) == 25
+    assert active == [1, 1, 1]
+    assert request_limiter.active == 0
@@ -0,0 +1,122 @@
+"""Tests for MessagePack/CBOR content negotiation."""
+
+import cbor2
+import msgpack
+import pytest
+
+from app.cache import response_cache
+from app.formats import CBOR, JSON, MSGPACK, convert_json, negotiate_format
+from app.models import Project
+from benchmarks.catalog import populate_catalog
+
+DECODERS = {MSGPACK: msgpack.unpackb, CBOR: cbor2.loads}
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, JSON),
+        ("", JSON),
+        ("*/*", JSON),
+        ("text/html,application/xhtml+xml,*/*;q=0.8", JSON),
+        ("application/msgpack", MSGPACK),
+        ("application/x-msgpack", MSGPACK),
+        ("application/cbor", CBOR),
+        ("application/msgpack, */*", MSGPACK),
+        ("application/json;q=0.5, application/cbor", CBOR),
+        ("application/msgpack;q=0.5, application/json", JSON),
+        ("application/msgpack;q=0", JSON),
+        ("text/html", JSON),
+    ],
+)
+def test_negotiate_format(accept, expected):
+    """Test exact types beat wildcards and JSON is the fallback."""
+    assert negotiate_format(accept) == expected
+
+
+def test_convert_json_round_trips():
+    """Test converted bodies decode to the same document."""
+    body = b'{"a":[1,2.5,"x",null,true],"b":{"c":"d"}}'
+    for media_type, decode in DECODERS.items():
+        assert decode(convert_json(body, media_type)) == {
+            "a": [1, 2.5, "x", None, True],
+            "b": {"c": "d"},
+        }
+    assert convert_json(memoryview(body), JSON) == body
+
+
+class TestNegotiatedEndpoints:
+    """Tests for project endpoints answering in the negotiated format."""
+
+    @pytest.fixture(autouse=True)
+    def catalog(self, test_session):
+        populate_catalog(test_session, 5)
+
+    @pytest.mark.parametrize("media_type", [MSGPACK, CBOR])
+    @pytest.mark.parametrize(
+        "path",
+        ["/api/projects", "/api/projects/project-00002", "/api/projects/project-00002/related"],
+    )
+    def test_same_document_as_json(self, client, path, media_type):
+        """Test binary responses carry exactly the JSON document."""
+        expected = client.get(path).json()
+
+        response = client.get(path, headers={"Accept": media_type})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == media_type
+        assert response.headers["vary"] == "Accept, Accept-Encoding"
+        assert DECODERS[media_type](response.content) == expected
+
+    def test_formats_are_cached_separately(self, client, monkeypatch):
+        """Test each format is converted once and cached on the JSON payload."""
+        calls = []
+        monkeypatch.setattr(
+            "app.cache.convert_json", lambda body, media_type: calls.append(media_type) or b"\x80"
+        )
+
+        for _ in range(3):
+            client.get("/api/projects", headers={"Accept": MSGPACK})
+        client.get("/api/projects")
+
+        assert calls == [MSGPACK]
+        assert response_cache.get("projects:list").formats[MSGPACK].body == b"\x80"
+        assert response_cache.get(f"projects:list@{MSGPACK}") is None
+
+    def test_clear_drops_converted_formats(self, client, test_session):
+        """Test a reseed's cache clear replaces the binary formats with the JSON."""
+        client.get("/api/projects", headers={"Accept": MSGPACK})
+        test_session.query(Project).filter_by(slug="project-00000").update({"title": "Renamed"})
+        test_session.commit()
+        response_cache.clear()
+
+        response = client.get("/api/projects", headers={"Accept": MSGPACK})
+
+        assert msgpack.unpackb(response.content)[0]["title"] == "Renamed"
+
+    def test_binary_responses_are_compressed(self, client):
+        """Test converted payloads get cached compressed variants too."""
+        response = client.get("/api/projects", headers={"Accept": MSGPACK, "Accept-Encoding": "br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert msgpack.unpackb(response.content)[0]["slug"] == "project-00000"
+
+    def test_batch(self, client):
+        """Test the stitched batch response is converted as a whole."""
+        response = client.get(
+            "/api/projects/batch",
+            params={"slugs": "project-00001,missing"},
+            headers={"Accept": CBOR},
+        )
+
+        document = cbor2.loads(response.content)
+        assert response.headers["content-type"] == CBOR
+        assert [project["slug"] for project in document["projects"]] == ["project-00001"]
+        assert document["missing"] == ["missing"]
+
+    def test_not_found_stays_json(self, client):
+        """Test errors keep their JSON body whatever the client accepts."""
+        response = client.get("/api/projects/missing", headers={"Accept": MSGPACK})
+
+        assert response.status_code == 404
+        assert response.headers["content-type"] == JSON
@@ -0,0 +1,289 @@
+"""Tests for on-demand image resizing."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+
+import anyio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+from starlette.concurrency import run_in_threadpool
+
+from app.images import (
+    ALLOWED_WIDTHS,
+    DiskLRUCache,
+    ImageTransformer,
+    ResizingStaticFiles,
+    snap_width,
+)
+
+CONCURRENT_REQUESTS = 20
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submissions and can hold them until released."""
+
+    def __init__(self):
+        super().__init__(max_workers=4)
+        self.submitted = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+
+        def run():
+            self.release.wait(timeout=5)
+            return fn(*args, **kwargs)
+
+        return super().submit(run)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Create a static tree with a 2000x1000 PNG and a text file."""
+    root = tmp_path / "static"
+    project_dir = root / "projects" / "demo"
+    project_dir.mkdir(parents=True)
+    Image.new("RGBA", (2000, 1000), (200, 40, 40, 255)).save(project_dir / "photo.png")
+    Image.new("RGB", (100, 50), (0, 0, 0)).save(project_dir / "small.jpg")
+    (project_dir / "notes.txt").write_text("not an image")
+    return root
+
+
+@pytest.fixture
+def executor():
+    executor = CountingExecutor()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskLRUCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def image_client(static_dir, cache, executor):
+    """Serve ``static_dir`` through ResizingStaticFiles with a counting executor."""
+    app = FastAPI()
+    files = ResizingStaticFiles(
+        directory=static_dir, transformer=ImageTransformer(cache, executor=executor)
+    )
+    app.mount("/images", files, name="images")
+    return TestClient(app)
+
+
+def decode(response) -> Image.Image:
+    return Image.open(BytesIO(response.content))
+
+
+@pytest.mark.parametrize(
+    "requested, expected", [(1, 320), (320, 320), (321, 640), (1000, 1280), (5000, 1920)]
+)
+def test_snap_width(requested, expected):
+    """Test widths snap up to the allowlist and cap at its largest entry."""
+    assert snap_width(requested) == expected
+    assert snap_width(requested) in ALLOWED_WIDTHS
+
+
+class TestResizingStaticFiles:
+    """Tests for GET /images/...?w=&fmt=."""
+
+    def test_resizes_and_converts(self, image_client):
+        """Test the width snaps, the aspect ratio is kept and the format changes."""
+        response = image_client.get("/images/projects/demo/photo.png?w=600&fmt=webp")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert "max-age" in response.headers["cache-control"]
+        image = decode(response)
+        assert image.format == "WEBP"
+        assert image.size == (640, 320)
+
+    def test_keeps_source_format_without_fmt(self, image_client):
+        """Test ``w`` alone resizes in the original format."""
+        response = image_client.get("/images/projects/demo/photo.png?w=320")
+
+        assert response.headers["content-type"] == "image/png"
+        assert decode(response).size == (320, 160)
+
+    def test_never_upscales(self, image_client):
+        """Test images narrower than the snapped width keep their size."""
+        response = image_client.get("/images/projects/demo/small.jpg?w=1920&fmt=png")
+
+        assert decode(response).size == (100, 50)
+
+    def test_plain_request_serves_original(self, image_client, static_dir):
+        """Test requests without parameters are served as plain static files."""
+        response = image_client.get("/images/projects/demo/photo.png")
+
+        assert response.content == (static_dir / "projects/demo/photo.png").read_bytes()
+
+    @pytest.mark.parametrize(
+        "url, status",
+        [
+            ("/images/projects/demo/photo.png?w=abc", 400),
+            ("/images/projects/demo/photo.png?w=0", 400),
+            ("/images/projects/demo/photo.png?w=%C2%B2", 400),
+            ("/images/projects/demo/photo.png?fmt=tiff", 400),
+            ("/images/projects/demo/notes.txt?w=320", 400),
+            ("/images/projects/demo/missing.png?w=320", 404),
+        ],
+    )
+    def test_rejects_invalid_requests(self, image_client, executor, url, status):
+        """Test bad parameters and non-images fail before any encode."""
+        assert image_client.get(url).status_code == status
+        assert executor.submitted == 0
+
+    def test_repeat_requests_hit_disk_cache(self, image_client, executor, cache):
+        """Test a variant is encoded once and then served from the cache directory."""
+        first = image_client.get("/images/projects/demo/photo.png?w=640&fmt=webp")
+        second = image_client.get("/images/projects/demo/photo.png?w=600&fmt=webp")
+
+        assert first.content == second.content
+        assert executor.submitted == 1
+        assert cache.size == len(first.content)
+
+    def test_source_change_creates_new_variant(self, image_client, executor, static_dir):
+        """Test replacing the source image invalidates its variants."""
+        image_client.get("/images/projects/demo/photo.png?w=320")
+        source = static_dir / "projects/demo/photo.png"
+        Image.new("RGB", (1000, 1000), (0, 0, 255)).save(source)
+        stat_result = source.stat()
+        os.utime(source, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+        response = image_client.get("/images/projects/demo/photo.png?w=320")
+
+        assert decode(response).size == (320, 320)
+        assert executor.submitted == 2
+
+
+async def test_concurrent_identical_requests_share_one_encode(static_dir, cache, executor):
+    """Test a burst of identical requests encodes the variant once."""
+    transformer = ImageTransformer(cache, executor=executor)
+    source = str(static_dir / "projects/demo/photo.png")
+    executor.release.clear()
+
+    pending = [
+        asyncio.ensure_future(transformer.variant(source, os.stat(source), 640, "webp"))
+        for _ in range(CONCURRENT_REQUESTS)
+    ]
+    await asyncio.sleep(0.1)
+    executor.release.set()
+    results = await asyncio.wait_for(asyncio.gather(*pending), timeout=10)
+
+    assert executor.submitted == 1
+    assert len({path for path, _ in results}) == 1
+
+
+async def test_encodes_do_not_hold_threadpool_threads(static_dir, cache, executor):
+    """Test in-flight encodes leave the threadpool free for sync database renders."""
+    transformer = ImageTransformer(cache, executor=executor)
+    source = str(static_dir / "projects/demo/photo.png")
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    total_tokens = limiter.total_tokens
+    limiter.total_tokens = 1
+    executor.release.clear()
+    try:
+        pending = [
+            asyncio.ensure_future(transformer.variant(source, os.stat(source), width, "webp"))
+            for width in (320, 640)
+        ]
+        await asyncio.sleep(0.05)
+
+        assert await asyncio.wait_for(run_in_threadpool(lambda: "rendered"), 1) == "rendered"
+    finally:
+        executor.release.set()
+        limiter.total_tokens = total_tokens
+    await asyncio.gather(*pending)
+    assert executor.submitted == 2
+
+
+async def test_cache_bookkeeping_runs_off_the_event_loop(static_dir, cache, executor):
+    """Test disk cache lookups and additions never run on the event loop thread."""
+    transformer = ImageTransformer(cache, executor=executor)
+    source = str(static_dir / "projects/demo/photo.png")
+    threads = []
+    get, add = cache.get, cache.add
+
+    def record(func):
+        def wrapper(path):
+            threads.append(threading.get_ident())
+            return func(path)
+
+        return wrapper
+
+    cache.get, cache.add = record(get), record(add)
+
+    await transformer.variant(source, os.stat(source), 640, "webp")
+    await transformer.variant(source, os.stat(source), 640, "webp")
+
+    assert len(threads) == 4
+    assert threading.get_ident() not in threads
+
+
+def test_encodes_in_process_pool(static_dir, cache):
+    """Test the default encoder runs in a separate process."""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        transformer = ImageTransformer(cache, executor=pool)
+        source = str(static_dir / "projects/demo/photo.png")
+        path, stat_result = asyncio.run(transformer.variant(source, os.stat(source), 960, "jpeg"))
+
+    with Image.open(path) as image:
+        assert image.format == "JPEG"
+        assert image.size == (960, 480)
+    assert stat_result.st_size == path.stat().st_size
+
+
+class TestDiskLRUCache:
+    """Tests for the size-capped variant cache."""
+
+    def write(self, cache, key, size):
+        path = cache.path_for(key, ".bin")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(bytes(size))
+        cache.add(path)
+        return path
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the cache stays under its cap by deleting the oldest-used files."""
+        cache = DiskLRUCache(str(tmp_path), max_bytes=300)
+        a = self.write(cache, "a", 100)
+        b = self.write(cache, "b", 100)
+        self.write(cache, "c", 100)
+        assert cache.get(a) is not None
+
+        d = self.write(cache, "d", 100)
+
+        assert cache.size == 300
+        assert not b.exists()
+        assert cache.get(b) is None
+        assert a.exists() and d.exists()
+
+    def test_rebuilds_index_from_disk(self, tmp_path):
+        """Test a new cache instance picks up existing files in mtime order."""
+        cache = DiskLRUCache(str(tmp_path), max_bytes=300)
+        old = self.write(cache, "old", 100)
+        os.utime(old, ns=(0, 0))
+        new = self.write(cache, "new", 100)
+
+        restarted = DiskLRUCache(str(tmp_path), max_bytes=250)
+        assert restarted.size == 200
+        self.write(restarted, "newest", 100)
+
+        assert not old.exists()
+        assert new.exists()
+
+    def test_missing_file_is_a_miss(self, tmp_path):
+        """Test a file removed behind the cache's back is reported as a miss."""
+        cache = DiskLRUCache(str(tmp_path), max_bytes=300)
+        path = self.write(cache, "a", 100)
+        path.unlink()
+
+        assert cache.get(path) is None
+        assert cache.size == 0
@@ -0,0 +1,95 @@
+"""Parity tests for the SQLite JSON repository against the ORM path."""
+
+import json
+import uuid
+
+import pytest
+
+from app.models import Project
+from app.repositories import JsonProjectRepository, ProjectRepository
+from app.schemas import dump_project_json, dump_projects_json
+from benchmarks.catalog import populate_catalog
+from tests.documents import normalized
+
+
+@pytest.mark.parametrize("catalog_size", [0, 1, 25])
+def test_list_parity_with_orm(test_session, catalog_size):
+    """Test the JSON list document matches the ORM + Pydantic serialization."""
+    populate_catalog(test_session, catalog_size)
+
+    expected = dump_projects_json(ProjectRepository(test_session).get_all_projects())
+    actual = JsonProjectRepository(test_session).get_all_projects_json()
+
+    assert normalized(json.loads(actual)) == normalized(json.loads(expected))
+
+
+def test_detail_parity_with_orm(test_session):
+    """Test every detail document matches, including image order."""
+    populate_catalog(test_session, 25)
+    orm_repo = ProjectRepository(test_session)
+    json_repo = JsonProjectRepository(test_session)
+
+    for (slug,) in test_session.query(Project.slug):
+        expected = json.loads(dump_project_json(orm_repo.get_project_by_slug(slug)))
+        actual = json.loads(json_repo.get_project_json_by_slug(slug))
+        assert [image["order"] for image in actual["images"]] == sorted(
+            image["order"] for image in actual["images"]
+        )
+        assert normalized(actual) == normalized(expected)
+
+
+def test_detail_nullable_fields_and_empty_collections(test_session):
+    """Test NULL urls and missing relations render as null and empty arrays."""
+    test_session.add(
+        Project(
+            id=str(uuid.uuid4()),
+            title='Bare Project — ünïcode "quotes"\nnewline',
+            slug="bare-project",
+            summary="Summary",
+            description="Description",
+        )
+    )
+    test_session.commit()
+
+    document = JsonProjectRepository(test_session).get_project_json_by_slug("bare-project")
+    expected = dump_project_json(
+        ProjectRepository(test_session).get_project_by_slug("bare-project")
+    )
+
+    assert json.loads(document) == json.loads(expected)
+    assert json.loads(document)["liveUrl"] is None
+    assert json.loads(document)["images"] == []
+
+
+def test_detail_missing_slug(test_session):
+    """Test an unknown slug returns None."""
+    assert JsonProjectRepository(test_session).get_project_json_by_slug("missing") is None
+
+
+class TestJsonBackendEndpoints:
+    """Tests for the project endpoints served by the JSON backend."""
+
+    @pytest.fixture(autouse=True)
+    def json_backend(self, monkeypatch, test_session):
+        monkeypatch.setattr("app.routers.projects.PROJECT_BACKEND", "json")
+        populate_catalog(test_session, 10)
+
+    def test_list_endpoint(self, client, assert_queries):
+        """Test the list endpoint serves the SQLite-built document in one statement."""
+        with assert_queries(statements=1):
+            response = client.get("/api/projects")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 10
+        assert response.headers["content-type"] == "application/json"
+
+    def test_detail_endpoint(self, client, assert_queries):
+        """Test the detail endpoint and its 404 path."""
+        with assert_queries(statements=1):
+            response = client.get("/api/projects/project-00003")
+        assert response.status_code == 200
+        assert response.json()["slug"] == "project-00003"
+
+        missing = client.get("/api/projects/nope")
+        assert missing.status_code == 404
+        assert missing.json()["detail"] == "Project with slug 'nope' not found"
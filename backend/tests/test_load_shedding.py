@@ -0,0 +1,246 @@
+"""Tests for concurrency limiting, load shedding and per-client rate limiting."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.middleware.load_shedding import (
+    ConcurrencyLimiter,
+    LoadSheddingMiddleware,
+    TokenBucketLimiter,
+)
+from benchmarks.harness import run_load
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestConcurrencyLimiter:
+    """Unit tests for ConcurrencyLimiter."""
+
+    async def test_slots_are_handed_over_in_order(self):
+        """Test released slots go to waiters first-come, first-served."""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=5)
+        assert await limiter.acquire(1)
+        order = []
+
+        async def waiter(name):
+            assert await limiter.acquire(1)
+            order.append(name)
+
+        tasks = [asyncio.create_task(waiter(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        assert limiter.queued == 3
+
+        for _ in range(3):
+            limiter.release()
+            await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "c"]
+        assert limiter.active == 0
+
+    async def test_full_queue_is_rejected_immediately(self):
+        """Test requests beyond the queue are refused without waiting."""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=1)
+        await limiter.acquire(1)
+        queued = asyncio.create_task(limiter.acquire(1))
+        await asyncio.sleep(0)
+
+        started = time.perf_counter()
+        assert not await limiter.acquire(1)
+        assert time.perf_counter() - started < 0.1
+
+        limiter.release()
+        assert await queued
+
+    async def test_wait_times_out(self):
+        """Test a waiter gives up after the timeout and leaves the queue."""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=1)
+        await limiter.acquire(1)
+
+        assert not await limiter.acquire(0.01)
+        assert limiter.queued == 0
+        limiter.release()
+        assert limiter.active == 0
+
+
+class TestTokenBucketLimiter:
+    """Unit tests for TokenBucketLimiter."""
+
+    def test_burst_then_refill(self):
+        """Test a client gets its burst, then tokens at the sustained rate."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=2, burst=3, clock=clock)
+
+        assert [limiter.take("a") for _ in range(3)] == [0, 0, 0]
+        assert limiter.take("a") == pytest.approx(0.5)
+        assert limiter.take("b") == 0
+
+        clock.now = 0.5
+        assert limiter.take("a") == 0
+        assert limiter.take("a") > 0
+
+    def test_forgets_least_recent_clients(self):
+        """Test the bucket table is bounded."""
+        limiter = TokenBucketLimiter(rate=1, burst=1, max_clients=2, clock=FakeClock())
+        for client in "abc":
+            limiter.take(client)
+
+        assert list(limiter._buckets) == ["b", "c"]
+        # "a" was forgotten, so it starts with a full bucket again
+        assert limiter.take("a") == 0
+
+
+def slow_app(delay: float, **middleware_options) -> FastAPI:
+    limiter = middleware_options.get("limiter")
+    app = FastAPI()
+    app.add_middleware(LoadSheddingMiddleware, **middleware_options)
+
+    @app.get("/api/slow")
+    async def slow():
+        await asyncio.sleep(delay)
+        return {"ok": True}
+
+    @app.get("/api/health")
+    async def health():
+        await asyncio.sleep(delay)
+        return {"status": "healthy"}
+
+    @app.get("/api/projects/export.ndjson")
+    async def export():
+        async def pages():
+            for _ in range(3):
+                # Each page is another database query after the response started
+                async with limiter.slot(5):
+                    await asyncio.sleep(delay / 3)
+                yield b"{}\n"
+
+        return StreamingResponse(pages(), media_type="application/x-ndjson")
+
+    @app.get("/static/file")
+    async def static_file():
+        await asyncio.sleep(delay)
+        return {"ok": True}
+
+    return app
+
+
+def client_for(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestLoadSheddingMiddleware:
+    """Tests for LoadSheddingMiddleware in front of a slow app."""
+
+    async def test_excess_requests_are_shed(self):
+        """Test requests beyond limit + queue get 503 with Retry-After."""
+        limiter = ConcurrencyLimiter(limit=2, max_queue=2)
+        app = slow_app(0.2, limiter=limiter, queue_timeout=5)
+
+        async with client_for(app) as client:
+            responses = await asyncio.gather(*(client.get("/api/slow") for _ in range(6)))
+
+        statuses = sorted(response.status_code for response in responses)
+        assert statuses == [200, 200, 200, 200, 503, 503]
+        shed = [response for response in responses if response.status_code == 503]
+        assert shed[0].headers["retry-after"] == "1"
+        assert shed[0].json() == {"detail": "Server is busy, retry shortly"}
+        assert limiter.shed == 2
+        assert limiter.active == 0
+
+    async def test_queued_requests_time_out(self):
+        """Test queued requests are shed once they wait longer than the timeout."""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=5)
+        app = slow_app(0.3, limiter=limiter, queue_timeout=0.05)
+
+        async with client_for(app) as client:
+            responses = await asyncio.gather(*(client.get("/api/slow") for _ in range(3)))
+
+        assert sorted(response.status_code for response in responses) == [200, 503, 503]
+
+    async def test_exempt_paths_are_not_limited(self):
+        """Test health checks and non-API paths bypass the limit."""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=0)
+        app = slow_app(0.1, limiter=limiter)
+
+        async with client_for(app) as client:
+            responses = await asyncio.gather(
+                *(client.get(path) for path in ["/api/health", "/static/file"] * 3)
+            )
+
+        assert {response.status_code for response in responses} == {200}
+        assert limiter.shed == 0
+
+    async def test_streaming_export_takes_a_slot_per_page(self):
+        """Test NDJSON exports hold a slot only while a page is queried, not while streaming."""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=5)
+        app = slow_app(0.3, limiter=limiter, queue_timeout=5)
+
+        async with client_for(app) as client:
+            export = asyncio.ensure_future(client.get("/api/projects/export.ndjson"))
+            await asyncio.sleep(0.05)
+            assert limiter.active == 1
+            slow = await client.get("/api/slow")
+            finished = await export
+
+        assert slow.status_code == finished.status_code == 200
+        assert finished.text == "{}\n" * 3
+        assert limiter.shed == 0
+        assert limiter.active == 0
+
+    async def test_slot_waits_instead_of_shedding(self):
+        """Test a slot for work that cannot be shed waits out a full queue."""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=0)
+        await limiter.acquire(1)
+        entered = []
+
+        async def page():
+            async with limiter.slot(0.01):
+                entered.append(limiter.active)
+
+        task = asyncio.ensure_future(page())
+        await asyncio.sleep(0.05)
+        assert entered == []
+        limiter.release()
+        await asyncio.wait_for(task, 1)
+
+        assert entered == [1]
+        assert limiter.active == 0
+
+    async def test_rate_limited_clients_get_429(self):
+        """Test a client over its token bucket gets 429 with Retry-After."""
+        rate_limiter = TokenBucketLimiter(rate=0.5, burst=2, clock=FakeClock())
+        app = slow_app(0, rate_limiter=rate_limiter)
+
+        async with client_for(app) as client:
+            responses = [await client.get("/api/slow") for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 200, 429]
+        assert responses[2].headers["retry-after"] == "2"
+        assert rate_limiter.rejected == 1
+
+    async def test_load_keeps_admitted_latency_bounded(self):
+        """Test an overload is answered quickly instead of queueing without bound."""
+        limiter = ConcurrencyLimiter(limit=2, max_queue=2)
+        app = slow_app(0.05, limiter=limiter, queue_timeout=0.5)
+
+        async with client_for(app) as client:
+            summary = await run_load(client, ["/api/slow"], total_requests=60, concurrency=20)
+
+        # Served requests waited for at most the two ahead of them in the queue
+        assert summary["operations"] > 0
+        assert summary["errors"] > 0
+        assert summary["operations"] + summary["errors"] == 60
+        assert summary["latency_ms"]["max"] < 500
+        assert limiter.shed == summary["errors"]
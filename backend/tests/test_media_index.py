@@ -0,0 +1,202 @@
+"""Tests for the in-memory static media index."""
+
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.media_index as media_index_module
+from app.media_index import MEDIA_STAMP_NAME, MediaIndex, hash_file, touch_media_stamp
+from app.static import PrecompressedStaticFiles, precompress_directory
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    + '<rect width="10" height="10" fill="#654321"/>' * 200
+    + "</svg>"
+).encode()
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Create a static tree with one compressible and one binary file."""
+    root = tmp_path / "static"
+    project_dir = root / "projects" / "demo"
+    project_dir.mkdir(parents=True)
+    (project_dir / "logo.svg").write_bytes(SVG)
+    (project_dir / "photo.png").write_bytes(b"\x89PNG" + bytes(2048))
+    return root
+
+
+@pytest.fixture
+def index(static_dir):
+    return MediaIndex(static_dir)
+
+
+@pytest.fixture
+def index_client(static_dir, index, monkeypatch):
+    """Serve ``static_dir`` from the index; any per-request filesystem lookup fails."""
+
+    def no_lookup(self, path):
+        raise AssertionError(f"filesystem lookup for {path}")
+
+    monkeypatch.setattr(PrecompressedStaticFiles, "lookup_path", no_lookup)
+    app = FastAPI()
+    app.mount("/images", PrecompressedStaticFiles(directory=static_dir, index=index), name="images")
+    return TestClient(app)
+
+
+def test_index_entries(static_dir, index):
+    """Test entries carry size, MIME type and a content-derived ETag."""
+    entry = index.lookup("projects/demo/logo.svg")
+
+    assert len(index) == 2
+    assert entry.size == len(SVG)
+    assert entry.media_type == "image/svg+xml"
+    assert entry.content_hash == hash_file(str(static_dir / "projects/demo/logo.svg"))
+    assert entry.etag == f'"{entry.content_hash[:32]}"'
+    assert index.lookup("projects/demo/missing.svg") is None
+
+
+def test_precompressed_siblings_are_not_files(static_dir, index, index_client):
+    """Test .br/.gz siblings are only served as an encoding of their source."""
+    precompress_directory(static_dir)
+    (static_dir / "archive.gz").write_bytes(b"standalone")
+
+    assert len(index) == 3
+    assert index.lookup("projects/demo/logo.svg.br") is None
+    assert index.lookup_variant("projects/demo/logo.svg", "br") is not None
+    assert index_client.get("/images/projects/demo/logo.svg.br").status_code == 404
+    response = index_client.get("/images/projects/demo/logo.svg", headers={"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.content == SVG
+    assert index_client.get("/images/archive.gz").content == b"standalone"
+
+
+def test_skips_stamp_and_escaping_symlinks(static_dir, tmp_path, index):
+    """Test the stamp file and symlinks leaving the directory are never indexed."""
+    (tmp_path / "secret.txt").write_text("secret")
+    (static_dir / "link.txt").symlink_to(tmp_path / "secret.txt")
+    touch_media_stamp(static_dir)
+
+    assert index.lookup(MEDIA_STAMP_NAME) is None
+    assert index.lookup("link.txt") is None
+
+
+class TestIndexedStaticFiles:
+    """Tests for PrecompressedStaticFiles backed by a MediaIndex."""
+
+    def test_serves_from_index(self, index_client, index, static_dir):
+        """Test a file is served with headers from its index entry."""
+        response = index_client.get("/images/projects/demo/photo.png")
+        entry = index.lookup("projects/demo/photo.png")
+
+        assert response.status_code == 200
+        assert response.content == (static_dir / "projects/demo/photo.png").read_bytes()
+        assert response.headers["etag"] == entry.etag
+        assert response.headers["last-modified"] == entry.last_modified
+        assert response.headers["content-length"] == str(entry.size)
+
+    def test_missing_file_is_404(self, index_client):
+        """Test unknown paths are rejected without touching the filesystem."""
+        assert index_client.get("/images/projects/demo/missing.png").status_code == 404
+        assert index_client.get("/images/../secret.txt").status_code == 404
+
+    def test_if_none_match_is_304(self, index_client, index):
+        """Test conditional requests are answered from the index."""
+        etag = index.lookup("projects/demo/photo.png").etag
+
+        response = index_client.get(
+            "/images/projects/demo/photo.png", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_serves_precompressed_sibling(self, static_dir, index_client):
+        """Test an indexed .br sibling is served with its own ETag."""
+        precompress_directory(static_dir)
+
+        plain = index_client.get("/images/projects/demo/logo.svg", headers={"Accept-Encoding": ""})
+        compressed = index_client.get(
+            "/images/projects/demo/logo.svg", headers={"Accept-Encoding": "br"}
+        )
+
+        assert plain.headers["vary"] == "Accept-Encoding"
+        assert compressed.headers["content-encoding"] == "br"
+        assert compressed.headers["content-type"] == "image/svg+xml"
+        assert compressed.content == SVG
+        assert compressed.headers["etag"] != plain.headers["etag"]
+
+
+class TestRefresh:
+    """Tests for refreshing the index when the stamp file changes."""
+
+    @pytest.fixture(autouse=True)
+    def no_throttle(self, monkeypatch):
+        monkeypatch.setattr(media_index_module, "MEDIA_INDEX_REFRESH_INTERVAL", 0.0)
+
+    def test_new_file_visible_after_stamp(self, static_dir, index):
+        """Test files added later appear once the stamp is touched."""
+        index.load()
+        (static_dir / "new.txt").write_text("new")
+
+        assert index.refresh_if_stale() is False
+        assert index.lookup("new.txt") is None
+
+        touch_media_stamp(static_dir)
+        assert index.refresh_if_stale() is True
+        assert index.lookup("new.txt").size == 3
+
+    def test_unchanged_files_are_not_rehashed(self, static_dir, index, monkeypatch):
+        """Test a rebuild only hashes files whose size or mtime changed."""
+        index.load()
+        hashed = []
+        monkeypatch.setattr(
+            media_index_module, "hash_file", lambda path: hashed.append(path) or "0" * 64
+        )
+        (static_dir / "projects/demo/photo.png").write_bytes(b"changed")
+
+        touch_media_stamp(static_dir)
+        index.refresh_if_stale()
+
+        assert hashed == [str(static_dir / "projects/demo/photo.png")]
+
+    def test_unannounced_change_is_served_whole(self, static_dir, index, index_client):
+        """Test a file rewritten without the stamp gets a correct length and a rebuild."""
+        index.load()
+        photo = static_dir / "projects/demo/photo.png"
+        photo.write_bytes(b"\x89PNG" + bytes(4096))
+
+        response = index_client.get("/images/projects/demo/photo.png")
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(photo.stat().st_size)
+        assert response.content == photo.read_bytes()
+        assert index.refresh_if_stale() is True
+        assert index.lookup("projects/demo/photo.png").size == photo.stat().st_size
+
+    def test_stale_indexed_sibling_is_not_served(self, static_dir, index, index_client):
+        """Test an indexed .br older than its edited source falls back to identity."""
+        precompress_directory(static_dir)
+        logo = static_dir / "projects/demo/logo.svg"
+        edited = SVG.replace(b"#654321", b"#123456")
+        logo.write_bytes(edited)
+        sibling_mtime = logo.with_name("logo.svg.br").stat().st_mtime_ns
+        os.utime(logo, ns=(sibling_mtime + 10**9, sibling_mtime + 10**9))
+        touch_media_stamp(static_dir)
+
+        response = index_client.get(
+            "/images/projects/demo/logo.svg", headers={"Accept-Encoding": "br"}
+        )
+
+        assert "content-encoding" not in response.headers
+        assert response.content == edited
+
+    def test_request_picks_up_refresh(self, static_dir, index_client):
+        """Test a request after a stamp change sees the new file."""
+        assert index_client.get("/images/late.txt").status_code == 404
+        (static_dir / "late.txt").write_text("late")
+        touch_media_stamp(static_dir)
+
+        assert index_client.get("/images/late.txt").text == "late"
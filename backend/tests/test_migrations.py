@@ -0,0 +1,198 @@
+"""Tests for the batched, resumable migration runner."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+
+import app.migrations as migrations
+from app.database import Base
+from app.migrations import (
+    CHECKPOINT_TABLE,
+    SCHEMA_VERSION,
+    MigrationError,
+    MigrationRunner,
+    get_schema_version,
+    verify_schema,
+)
+
+# projects as created before order_num existed and while it still had timestamps
+LEGACY_PROJECTS = """
+CREATE TABLE projects (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    slug TEXT UNIQUE NOT NULL,
+    summary TEXT NOT NULL,
+    description TEXT NOT NULL,
+    live_url TEXT,
+    github_url TEXT,
+    created_at DATETIME,
+    updated_at DATETIME
+)
+"""
+
+
+class SimulatedCrashError(Exception):
+    pass
+
+
+def project_rows(conn: sqlite3.Connection) -> dict[str, tuple]:
+    return {
+        row[0]: row[1:] for row in conn.execute("SELECT id, title, slug, order_num FROM projects")
+    }
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """A database from before the current models (no later tables), with 10 projects."""
+    path = str(tmp_path / "legacy.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    # Tables and indexes added by later models
+    conn.execute("DROP TABLE project_versions")
+    conn.execute("DROP TABLE project_related")
+    conn.execute("DROP INDEX ix_project_images_project_id")
+    conn.execute("DROP TABLE projects")
+    conn.execute(LEGACY_PROJECTS)
+    conn.execute("CREATE UNIQUE INDEX ix_projects_slug ON projects (slug)")
+    for i in range(10):
+        conn.execute(
+            "INSERT INTO projects VALUES (?, ?, ?, 's', 'd', NULL, NULL, "
+            "'2024-01-01', '2024-01-01')",
+            (f"id-{i}", f"Project {i}", f"project-{i}"),
+        )
+    conn.execute("INSERT INTO technologies VALUES ('tech-1', 'Python')")
+    conn.execute("INSERT INTO project_technologies VALUES ('id-3', 'tech-1')")
+    conn.close()
+    return path
+
+
+def test_rebuilds_legacy_table(legacy_db):
+    """Test the rebuild drops old columns, adds defaults and keeps rows and references."""
+    messages = []
+    with MigrationRunner(
+        legacy_db, batch_size=3, batch_pause=0, progress=messages.append
+    ) as runner:
+        assert [migration.version for migration in runner.pending()] == [1, 2, 3]
+        assert runner.run() == SCHEMA_VERSION
+
+    conn = sqlite3.connect(legacy_db)
+    assert verify_schema(conn) == []
+    assert get_schema_version(conn) == SCHEMA_VERSION
+    assert project_rows(conn) == {f"id-{i}": (f"Project {i}", f"project-{i}", 0) for i in range(10)}
+    # Dropping the old table must not cascade into the junction tables
+    assert conn.execute("SELECT * FROM project_technologies").fetchall() == [("id-3", "tech-1")]
+    assert conn.execute(f"SELECT count(*) FROM {CHECKPOINT_TABLE}").fetchone() == (0,)
+    assert "v1: copied 10 rows of projects" in messages
+    assert "v2: add project_versions and project_related" in messages
+    assert messages[-1] == "v3: index projects by (order_num, id) and images by project"
+    assert sum("copied" in message for message in messages) == 4
+
+
+def test_resumes_after_crash_with_concurrent_writes(legacy_db):
+    """Test an interrupted rebuild resumes from its checkpoint and keeps writes made meanwhile."""
+
+    def crash_after_first_batch(message):
+        if "copied" in message:
+            raise SimulatedCrashError
+
+    with MigrationRunner(legacy_db, batch_size=4, progress=crash_after_first_batch) as runner:
+        with pytest.raises(SimulatedCrashError):
+            runner.run()
+
+    conn = sqlite3.connect(legacy_db, isolation_level=None)
+    assert conn.execute(f"SELECT last_rowid, rows_copied FROM {CHECKPOINT_TABLE}").fetchone() == (
+        4,
+        4,
+    )
+    # The app keeps writing to the old table while the migration is stopped
+    conn.execute("UPDATE projects SET title = 'Renamed' WHERE id IN ('id-1', 'id-8')")
+    conn.execute("DELETE FROM projects WHERE id IN ('id-2', 'id-9')")
+    conn.execute(
+        "INSERT INTO projects VALUES ('id-new', 'New', 'project-new', 's', 'd', NULL, NULL, "
+        "NULL, NULL)"
+    )
+
+    messages = []
+    with MigrationRunner(
+        legacy_db, batch_size=4, batch_pause=0, progress=messages.append
+    ) as runner:
+        runner.run()
+
+    assert messages[0] == "v1: resuming projects after 4 rows"
+    rows = project_rows(conn)
+    assert set(rows) == {f"id-{i}" for i in (0, 1, 3, 4, 5, 6, 7, 8)} | {"id-new"}
+    assert rows["id-1"][0] == rows["id-8"][0] == "Renamed"
+    assert rows["id-new"] == ("New", "project-new", 0)
+    assert verify_schema(conn) == []
+
+
+def test_failed_verification_rolls_back_swap(legacy_db, monkeypatch):
+    """Test a rebuilt table that does not match its model is neither swapped in nor stamped."""
+    monkeypatch.setattr(migrations, "verify_table", lambda conn, model: ["projects: mismatch"])
+
+    with MigrationRunner(legacy_db, batch_size=4, batch_pause=0) as runner:
+        with pytest.raises(MigrationError, match="projects: mismatch"):
+            runner.run()
+        assert [migration.version for migration in runner.pending()] == [1, 2, 3]
+
+    conn = sqlite3.connect(legacy_db)
+    assert get_schema_version(conn) == 0
+    assert "created_at" in migrations.table_columns(conn, "projects")
+    assert conn.execute(f"SELECT count(*) FROM {CHECKPOINT_TABLE}").fetchone() == (1,)
+
+
+def test_current_schema_is_only_stamped(tmp_path):
+    """Test a database created from the models gets its version without a rebuild."""
+    path = str(tmp_path / "current.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    messages = []
+    with MigrationRunner(path, progress=messages.append) as runner:
+        assert runner.run() == SCHEMA_VERSION
+        assert runner.pending() == []
+
+    assert messages == [
+        "v1: projects already up to date",
+        "v2: already up to date",
+        "v3: already up to date",
+    ]
+
+
+def test_remaining_drift_fails_the_run(tmp_path):
+    """Test a database still differing from the models after every migration is an error."""
+    path = str(tmp_path / "drifted.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    conn = sqlite3.connect(path)
+    conn.execute("DROP INDEX ix_technologies_name")
+    conn.close()
+
+    with MigrationRunner(path) as runner:
+        with pytest.raises(MigrationError, match="ix_technologies_name is missing"):
+            runner.run()
+
+
+def test_missing_table_is_an_error(tmp_path):
+    """Test a database without the table is not silently created."""
+    with MigrationRunner(str(tmp_path / "empty.db")) as runner:
+        with pytest.raises(MigrationError, match="init_db"):
+            runner.run()
+
+
+def test_verify_schema_reports_differences(legacy_db):
+    """Test schema drift is described column by column."""
+    conn = sqlite3.connect(legacy_db)
+
+    problems = verify_schema(conn)
+
+    assert "projects.order_num: column is missing" in problems
+    assert "projects.created_at: unexpected column" in problems
+    assert "projects: index ix_projects_order_num_id is missing" in problems
+    assert not any(problem.startswith("technologies") for problem in problems)
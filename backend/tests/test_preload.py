@@ -0,0 +1,102 @@
+"""Tests for preload Link headers on project detail responses."""
+
+import json
+
+import msgpack
+import pytest
+
+from app.cache import response_cache
+from app.preload import preload_headers, preload_link
+from app.routers.projects import PROJECT_DETAIL_KEY
+from app.snapshot import CatalogSnapshot, build_snapshot
+from benchmarks.catalog import populate_catalog
+
+
+def detail_body(*images: tuple[str, int]) -> bytes:
+    return json.dumps({"images": [{"url": url, "order": order} for url, order in images]}).encode()
+
+
+def expected_link(document: dict, count: int = 2) -> str:
+    images = sorted(document["images"], key=lambda image: image["order"])
+    urls = [image["url"] for image in images if not image["url"].endswith(".mp4")]
+    return ", ".join(f"<{url}>; rel=preload; as=image; type=image/png" for url in urls[:count])
+
+
+def test_preload_link_only_for_images():
+    """Test images get an as=image preload and other media none."""
+    assert (
+        preload_link("/images/a/1.webp")
+        == "</images/a/1.webp>; rel=preload; as=image; type=image/webp"
+    )
+    assert preload_link("/videos/a/demo.mp4") is None
+
+
+def test_preload_headers_take_first_images_by_order():
+    """Test the lowest-ordered images are preloaded, skipping videos."""
+    body = detail_body(
+        ("/images/c.png", 3), ("/videos/v.mp4", 0), ("/images/a.png", 1), ("/images/b.png", 2)
+    )
+
+    assert preload_headers(body, count=2) == {
+        "Link": "</images/a.png>; rel=preload; as=image; type=image/png, "
+        "</images/b.png>; rel=preload; as=image; type=image/png"
+    }
+
+
+@pytest.mark.parametrize(
+    "body, count", [(detail_body(("/images/a.png", 0)), 0), (detail_body(), 2)]
+)
+def test_preload_headers_empty(body, count):
+    """Test nothing is sent when preloading is off or there are no images."""
+    assert preload_headers(body, count=count) == {}
+
+
+class TestDetailEndpoint:
+    """Tests for the Link header on /api/projects/{slug}."""
+
+    @pytest.fixture(autouse=True)
+    def catalog(self, test_session):
+        populate_catalog(test_session, 5)
+
+    def test_link_header_is_cached_with_payload(self, client, assert_queries):
+        """Test the header is computed on the miss and served again from the cache."""
+        first = client.get("/api/projects/project-00002")
+        with assert_queries(statements=0):
+            second = client.get("/api/projects/project-00002")
+
+        assert first.headers["link"] == expected_link(first.json())
+        assert second.headers["link"] == first.headers["link"]
+        assert response_cache.get(PROJECT_DETAIL_KEY.format(slug="project-00002")).headers == {
+            "Link": first.headers["link"]
+        }
+
+    def test_link_header_in_every_format(self, client):
+        """Test binary formats carry the same preload links."""
+        response = client.get(
+            "/api/projects/project-00001", headers={"Accept": "application/msgpack"}
+        )
+
+        assert response.headers["link"] == expected_link(msgpack.unpackb(response.content))
+
+    def test_batch_fills_cache_with_links(self, client):
+        """Test detail payloads cached by a batch lookup keep their links."""
+        client.get("/api/projects/batch", params={"slugs": "project-00003"})
+
+        payload = response_cache.get(PROJECT_DETAIL_KEY.format(slug="project-00003"))
+        assert payload.headers["Link"] == expected_link(json.loads(payload.body))
+
+    def test_list_has_no_link_header(self, client):
+        """Test only detail responses advertise preloads."""
+        assert "link" not in client.get("/api/projects").headers
+
+
+def test_snapshot_stores_links(test_session, tmp_path):
+    """Test snapshot detail payloads carry the same precomputed links."""
+    populate_catalog(test_session, 3)
+    build_snapshot(test_session, str(tmp_path / "catalog.snapshot"))
+
+    payload = CatalogSnapshot(str(tmp_path / "catalog.snapshot")).payload(
+        PROJECT_DETAIL_KEY.format(slug="project-00001")
+    )
+
+    assert payload.headers == {"Link": expected_link(json.loads(bytes(payload.body)))}
@@ -2,37 +2,9 @@
 
 import uuid
 
-import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy.orm import sessionmaker
-
-from app.database import get_db
-from app.main import app
 from app.models import Project, ProjectImage, Role, Technology
 
 
-@pytest.fixture
-def client(test_db, test_session):
-    """Create a test client with database session override."""
-
-    # Override the get_db dependency to use the test database
-    def override_get_db():
-        # Create a new session from the test database for each request
-        session_local = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
-        db = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    with TestClient(app) as test_client:
-        yield test_client
-
-    app.dependency_overrides.clear()
-
-
 class TestGetAllProjects:
     """Tests for GET /api/projects endpoint."""
 
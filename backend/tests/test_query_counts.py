@@ -0,0 +1,52 @@
+"""Query-plan regression tests for the project endpoints."""
+
+import pytest
+
+from app.models import Project
+from benchmarks.catalog import populate_catalog
+
+CATALOG_SIZES = [1, 10, 50]
+
+
+def joined_row_count(project: Project) -> int:
+    """Rows one project contributes when its three collections are joined eagerly."""
+    return (
+        max(1, len(project.technologies)) * max(1, len(project.roles)) * max(1, len(project.images))
+    )
+
+
+@pytest.mark.parametrize("catalog_size", CATALOG_SIZES)
+def test_list_projects_query_plan(client, test_session, assert_queries, catalog_size):
+    """Test GET /api/projects loads every project and relation in one statement."""
+    populate_catalog(test_session, catalog_size)
+    projects = test_session.query(Project).all()
+    max_rows = sum(joined_row_count(project) for project in projects)
+
+    with assert_queries(statements=1, max_rows=max_rows):
+        response = client.get("/api/projects")
+
+    assert response.status_code == 200
+    assert len(response.json()) == catalog_size
+
+
+@pytest.mark.parametrize("catalog_size", CATALOG_SIZES)
+def test_get_project_by_slug_query_plan(client, test_session, assert_queries, catalog_size):
+    """Test GET /api/projects/{slug} cost does not grow with catalog size."""
+    populate_catalog(test_session, catalog_size)
+    project = test_session.query(Project).order_by(Project.order_num.desc()).first()
+
+    with assert_queries(statements=1, max_rows=joined_row_count(project)):
+        response = client.get(f"/api/projects/{project.slug}")
+
+    assert response.status_code == 200
+    assert response.json()["slug"] == project.slug
+
+
+def test_get_project_by_slug_not_found_query_plan(client, test_session, assert_queries):
+    """Test a missing slug costs a single statement returning no rows."""
+    populate_catalog(test_session, 10)
+
+    with assert_queries(statements=1, max_rows=0):
+        response = client.get("/api/projects/does-not-exist")
+
+    assert response.status_code == 404
@@ -0,0 +1,77 @@
+"""Tests for the slotted read models and their repository."""
+
+import dataclasses
+import json
+
+import pytest
+
+from app.models import Project
+from app.read_models import ProjectRead, dump_read_project_json, dump_read_projects_json
+from app.repositories import ProjectRepository, ReadModelRepository
+from app.schemas import dump_project_json, dump_projects_json
+from benchmarks.catalog import populate_catalog
+from tests.documents import normalized
+
+
+def test_read_models_are_slotted_and_frozen(test_session):
+    """Test read models carry no per-instance dict and cannot be mutated."""
+    populate_catalog(test_session, 1)
+    project = ReadModelRepository(test_session).get_all_projects()[0]
+
+    assert isinstance(project, ProjectRead)
+    assert not hasattr(project, "__dict__")
+    assert not hasattr(project.images[0], "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        project.title = "changed"
+
+
+@pytest.mark.parametrize("catalog_size", [0, 1, 25])
+def test_list_parity_with_orm(test_session, catalog_size):
+    """Test read-model serialization matches the ORM + Pydantic output."""
+    populate_catalog(test_session, catalog_size)
+
+    expected = dump_projects_json(ProjectRepository(test_session).get_all_projects())
+    actual = dump_read_projects_json(ReadModelRepository(test_session).get_all_projects())
+
+    assert normalized(json.loads(actual)) == normalized(json.loads(expected))
+
+
+def test_detail_parity_with_orm(test_session):
+    """Test every detail document matches, including image order."""
+    populate_catalog(test_session, 25)
+    orm_repo = ProjectRepository(test_session)
+    read_repo = ReadModelRepository(test_session)
+
+    for (slug,) in test_session.query(Project.slug):
+        expected = json.loads(dump_project_json(orm_repo.get_project_by_slug(slug)))
+        actual = json.loads(dump_read_project_json(read_repo.get_project_by_slug(slug)))
+        assert normalized(actual) == normalized(expected)
+
+    assert read_repo.get_project_by_slug("missing") is None
+
+
+class TestReadModelBackendEndpoints:
+    """Tests for the project endpoints served by the read-model backend."""
+
+    @pytest.fixture(autouse=True)
+    def readmodel_backend(self, monkeypatch, test_session):
+        monkeypatch.setattr("app.routers.projects.PROJECT_BACKEND", "readmodel")
+        populate_catalog(test_session, 10)
+
+    def test_list_endpoint(self, client, assert_queries):
+        """Test the list loads projects and each relation with one query apiece."""
+        with assert_queries(statements=4):
+            response = client.get("/api/projects")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 10
+
+    def test_detail_endpoint(self, client, assert_queries):
+        """Test detail lookups and the single-query 404 path."""
+        with assert_queries(statements=4):
+            response = client.get("/api/projects/project-00003")
+        assert response.status_code == 200
+        assert response.json()["slug"] == "project-00003"
+
+        with assert_queries(statements=1):
+            assert client.get("/api/projects/nope").status_code == 404
@@ -0,0 +1,137 @@
+"""Tests for per-worker warm-up and the /api/ready endpoint."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+import app.warmup as warmup
+from app.cache import response_cache
+from app.database import get_db
+from app.main import app
+from app.routers.projects import PROJECT_DETAIL_KEY, PROJECT_LIST_KEY
+from app.warmup import (
+    Readiness,
+    readiness,
+    wait_for_warmup,
+    warm_up_until_ready,
+    warm_up_worker,
+)
+from benchmarks.catalog import populate_catalog
+
+
+class TestWarmUp:
+    """Tests for warm_up_worker."""
+
+    def test_primes_caches_and_reports_timings(self, client, test_session, assert_queries):
+        """Test warm-up caches the hot payloads so the first requests run no SQL."""
+        populate_catalog(test_session, 5)
+
+        report = warm_up_worker(app, Readiness()).report()
+
+        assert report["status"] == "ready"
+        assert set(report["components"]) == {"database", "project_list", "project_details"}
+        list_payload = response_cache.get(PROJECT_LIST_KEY)
+        assert list_payload.has_encoding("br") and list_payload.has_encoding("gzip")
+        assert response_cache.get(PROJECT_DETAIL_KEY.format(slug="project-00004")).headers
+        with assert_queries(statements=0):
+            assert len(client.get("/api/projects").json()) == 5
+            assert client.get("/api/projects/project-00002").status_code == 200
+
+    def test_failure_is_reported(self, client, test_session):
+        """Test a failing step leaves the worker unready with the error."""
+        test_session.execute(text("DROP TABLE project_images"))
+        test_session.commit()
+
+        report = warm_up_worker(app, Readiness()).report()
+
+        assert report["status"] == "failed"
+        assert "project_list" in report["errors"]
+        assert "project_details" not in report["components"]
+
+    async def test_failed_warmup_is_retried(self, client, test_session, monkeypatch):
+        """Test warm-up retries after a failure and clears the error once it succeeds."""
+        populate_catalog(test_session, 3)
+        attempts = []
+        warm_project_list = warmup.warm_project_list
+
+        def fail_first(db):
+            attempts.append(db)
+            if len(attempts) == 1:
+                raise RuntimeError("database not seeded yet")
+            warm_project_list(db)
+
+        readiness_copy = Readiness()
+        monkeypatch.setattr(warmup, "warm_project_list", fail_first)
+
+        report = (await warm_up_until_ready(app, readiness_copy, delay=0)).report()
+
+        assert len(attempts) == 2
+        assert report["status"] == "ready"
+        assert "errors" not in report
+
+
+class TestReadyEndpoint:
+    """Tests for /api/ready."""
+
+    def test_ready_without_warmup(self, client):
+        """Test a worker with warm-up disabled is ready once started."""
+        response = client.get("/api/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        assert "media_index" in response.json()["components"]
+
+    def test_warming_is_unavailable(self, client):
+        """Test the endpoint answers 503 until warm-up completes, health stays 200."""
+        readiness.reset()
+
+        response = client.get("/api/ready")
+
+        assert response.status_code == 503
+        assert response.json() == {"status": "warming", "components": {}}
+        assert client.get("/api/health").status_code == 200
+
+
+@pytest.fixture
+def warming_client(test_db, test_session, monkeypatch):
+    populate_catalog(test_session, 3)
+    monkeypatch.setattr("app.warmup.STARTUP_WARMUP", True)
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    response_cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+    response_cache.clear()
+
+
+def test_startup_waits_for_warmup(warming_client):
+    """Test startup finishes warming before the app serves its first request."""
+    response = warming_client.get("/api/ready")
+
+    assert response.status_code == 200
+    assert set(response.json()["components"]) >= {"media_index", "database", "project_list"}
+    assert response_cache.get(PROJECT_LIST_KEY) is not None
+
+
+async def test_wait_for_warmup_is_bounded():
+    """Test startup stops waiting after the timeout and leaves warm-up running."""
+    release = asyncio.Event()
+    task = asyncio.ensure_future(release.wait())
+
+    assert await wait_for_warmup(task, timeout=0.01) is False
+    assert not task.done()
+
+    release.set()
+    assert await wait_for_warmup(task, timeout=1) is True
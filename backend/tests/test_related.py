@@ -0,0 +1,106 @@
+"""Tests for precomputed related-project recommendations."""
+
+import pytest
+
+from app.models import Project
+from app.recommendations import compute_related, rebuild_related_projects
+from benchmarks.catalog import populate_catalog
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a | b else 0.0
+
+
+class TestComputeRelated:
+    """Unit tests for the vectorized similarity ranking."""
+
+    def test_ranks_by_jaccard_and_breaks_ties_by_position(self):
+        """Test neighbours are ordered by score, then by earlier position."""
+        memberships = [{"a", "b"}, {"a", "b"}, {"a"}, {"b"}, {"c"}, set()]
+        related = compute_related(memberships, top_k=3)
+
+        assert [index for index, _ in related[0]] == [1, 2, 3]
+        assert related[0][0][1] == pytest.approx(1.0)
+        assert related[0][1][1] == pytest.approx(0.5)
+        # No shared features means no recommendation
+        assert related[4] == []
+        assert related[5] == []
+
+    def test_never_includes_self(self):
+        """Test an item is not its own neighbour even when it is the best match."""
+        related = compute_related([{"x"}, {"x"}, {"x"}], top_k=5)
+        assert [index for index, _ in related[1]] == [0, 2]
+
+    def test_matches_brute_force_across_blocks(self, monkeypatch):
+        """Test blockwise computation agrees with pairwise Python sets."""
+        monkeypatch.setattr("app.recommendations.SIMILARITY_BLOCK_ROWS", 7)
+        memberships = [{f"f{(i * j) % 11}" for j in range(1, 1 + i % 5)} for i in range(40)]
+        related = compute_related(memberships, top_k=4)
+
+        for i, features in enumerate(memberships):
+            expected = sorted(
+                (
+                    (-jaccard(features, other), j)
+                    for j, other in enumerate(memberships)
+                    if j != i and jaccard(features, other) > 0
+                ),
+            )[:4]
+            assert [index for index, _ in related[i]] == [j for _, j in expected]
+
+    def test_empty_input(self):
+        """Test an empty catalog produces no recommendations."""
+        assert compute_related([]) == []
+
+
+class TestRelatedEndpoint:
+    """Tests for GET /api/projects/{slug}/related."""
+
+    @pytest.fixture(autouse=True)
+    def catalog(self, test_session):
+        populate_catalog(test_session, 30)
+        rebuild_related_projects(test_session, top_k=5)
+
+    def test_returns_top_related_by_score(self, client, test_session):
+        """Test results match Jaccard over technology and role memberships."""
+        projects = test_session.query(Project).order_by(Project.order_num).all()
+        features = {
+            project.slug: {f"t:{tech.id}" for tech in project.technologies}
+            | {f"r:{role.id}" for role in project.roles}
+            for project in projects
+        }
+
+        response = client.get("/api/projects/project-00004/related")
+
+        assert response.status_code == 200
+        related = response.json()
+        assert 0 < len(related) <= 5
+        assert "project-00004" not in [item["slug"] for item in related]
+        scores = [item["score"] for item in related]
+        assert scores == sorted(scores, reverse=True)
+        for item in related:
+            expected = jaccard(features["project-00004"], features[item["slug"]])
+            assert item["score"] == pytest.approx(expected, abs=1e-6)
+        best = max(
+            jaccard(features["project-00004"], other)
+            for slug, other in features.items()
+            if slug != "project-00004"
+        )
+        assert scores[0] == pytest.approx(best, abs=1e-6)
+
+    def test_single_indexed_lookup(self, client, assert_queries):
+        """Test a related request runs one statement and is cached afterwards."""
+        with assert_queries(statements=1):
+            client.get("/api/projects/project-00010/related")
+        with assert_queries(statements=0):
+            client.get("/api/projects/project-00010/related")
+
+    def test_unknown_slug(self, client):
+        """Test an unknown slug returns 404."""
+        response = client.get("/api/projects/nope/related")
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Project with slug 'nope' not found"
+
+    def test_rebuild_replaces_previous_rows(self, client, test_session):
+        """Test rebuilding with a smaller k rewrites the table."""
+        rebuild_related_projects(test_session, top_k=1)
+        assert len(client.get("/api/projects/project-00001/related").json()) <= 1
@@ -0,0 +1,55 @@
+"""Tests for the atomic reseed in scripts/seed_db.py."""
+
+import os
+import sqlite3
+import subprocess
+import sys
+
+from app.media_index import MEDIA_STAMP_NAME
+from benchmarks.harness import BACKEND_DIR
+
+SEED_SCRIPT = str(BACKEND_DIR / "scripts" / "seed_db.py")
+
+
+def run_seed(db_path, media_dir) -> subprocess.CompletedProcess:
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}", "MEDIA_DIR": str(media_dir)}
+    env.pop("CATALOG_SNAPSHOT_PATH", None)
+    return subprocess.run(
+        [sys.executable, SEED_SCRIPT], env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+def count_projects(connection: sqlite3.Connection) -> int:
+    return connection.execute("SELECT count(*) FROM projects").fetchone()[0]
+
+
+def test_reseed_swaps_in_a_new_file(tmp_path):
+    """Test each seed renames a complete new file over the live database."""
+    db_path = tmp_path / "portfolio.db"
+    media_dir = tmp_path / "media"
+    media_dir.mkdir()
+    first = run_seed(db_path, media_dir)
+    assert first.returncode == 0, first.stdout + first.stderr
+
+    reader = sqlite3.connect(db_path)
+    seeded = count_projects(reader)
+    assert seeded > 0
+    inode = os.stat(db_path).st_ino
+    ids = reader.execute("SELECT id, slug FROM projects ORDER BY slug").fetchall()
+
+    second = run_seed(db_path, media_dir)
+    assert second.returncode == 0, second.stdout + second.stderr
+
+    # An open reader keeps the old, fully populated catalog; new readers see the new file
+    assert count_projects(reader) == seeded
+    assert os.stat(db_path).st_ino != inode
+    fresh = sqlite3.connect(db_path)
+    assert count_projects(fresh) == seeded
+    # Same CSV: ids are stable and the catalog version does not move
+    assert fresh.execute("SELECT id, slug FROM projects ORDER BY slug").fetchall() == ids
+    assert fresh.execute("SELECT max(version) FROM project_versions").fetchone()[0] == 1
+    fresh.close()
+    # No build files are left behind, and servers are told to reindex the media directory
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["media", "portfolio.db"]
+    assert (media_dir / MEDIA_STAMP_NAME).exists()
+    reader.close()
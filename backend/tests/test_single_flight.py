@@ -0,0 +1,177 @@
+"""Tests for single-flight coalescing of cache misses."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+import app.routers.projects as projects_router
+from app.cache import SingleFlight, response_cache, single_flight
+from app.database import get_db
+from app.main import app
+from app.middleware.load_shedding import request_limiter
+from benchmarks.catalog import populate_catalog
+
+CONCURRENT_REQUESTS = 100
+
+
+class TestSingleFlight:
+    """Unit tests for SingleFlight."""
+
+    async def test_concurrent_callers_share_one_call(self):
+        """Test overlapping calls with one key run the function once."""
+        flight = SingleFlight()
+        calls = []
+
+        def compute():
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", compute) for _ in range(50)))
+
+        assert results == ["result"] * 50
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+    async def test_distinct_keys_run_separately(self):
+        """Test different keys are not coalesced."""
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.do("a", lambda: 1), flight.do("b", lambda: 2))
+        assert results == [1, 2]
+
+    async def test_exception_is_shared_and_not_cached(self):
+        """Test every waiter sees the failure and the next call retries."""
+        flight = SingleFlight()
+        calls = []
+
+        def fail():
+            calls.append(1)
+            time.sleep(0.02)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("key", fail) for _ in range(5)), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(calls) == 1
+
+        assert await flight.do("key", lambda: "recovered") == "recovered"
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test a disconnecting caller leaves the shared computation running."""
+        flight = SingleFlight()
+
+        def compute():
+            time.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("key", compute))
+        second = asyncio.ensure_future(flight.do("key", compute))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestCoalescedEndpoints:
+    """Tests driving concurrent cold-cache requests through the ASGI app."""
+
+    @pytest.fixture
+    async def async_client(self, test_db, test_session, monkeypatch):
+        populate_catalog(test_session, 20)
+        session_local = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
+        closed_sessions = []
+
+        def override_get_db():
+            db = session_local()
+            try:
+                yield db
+            finally:
+                db.close()
+                closed_sessions.append(db)
+
+        renders = []
+        render_project_list = projects_router.render_project_list
+        render_project = projects_router.render_project
+
+        def slow_render_list(db, backend=None):
+            renders.append("list")
+            # Keep the miss in flight long enough for every request to arrive
+            time.sleep(0.1)
+            body = render_project_list(db, backend)
+            if db in closed_sessions:
+                renders.append("closed session")
+            return body
+
+        def slow_render(db, slug, backend=None):
+            renders.append(slug)
+            time.sleep(0.1)
+            return render_project(db, slug, backend)
+
+        monkeypatch.setattr(projects_router, "render_project_list", slow_render_list)
+        monkeypatch.setattr(projects_router, "render_project", slow_render)
+        # Every request must be in flight at once, not admitted in waves
+        monkeypatch.setattr(request_limiter, "limit", 0)
+        app.dependency_overrides[get_db] = override_get_db
+        response_cache.clear()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            client.renders = renders
+            yield client
+
+        app.dependency_overrides.clear()
+        response_cache.clear()
+
+    async def test_concurrent_list_requests_run_one_query(self, async_client, assert_queries):
+        """Test 100 simultaneous cold requests for the list share one DB query."""
+        with assert_queries(statements=1):
+            responses = await asyncio.gather(
+                *(async_client.get("/api/projects") for _ in range(CONCURRENT_REQUESTS))
+            )
+
+        assert {response.status_code for response in responses} == {200}
+        assert len({response.content for response in responses}) == 1
+        assert async_client.renders == ["list"]
+        assert len(single_flight) == 0
+
+    async def test_concurrent_detail_requests_run_one_query(self, async_client, assert_queries):
+        """Test simultaneous requests for one slug, and for a missing slug, coalesce."""
+        with assert_queries(statements=2):
+            responses = await asyncio.gather(
+                *(async_client.get("/api/projects/project-00007") for _ in range(50)),
+                *(async_client.get("/api/projects/missing") for _ in range(50)),
+            )
+
+        assert [response.status_code for response in responses] == [200] * 50 + [404] * 50
+        assert sorted(async_client.renders) == ["missing", "project-00007"]
+
+    async def test_cancelled_first_caller_keeps_render_session(self, async_client):
+        """Test the shared render does not use the session of a request that went away."""
+        first = asyncio.ensure_future(async_client.get("/api/projects"))
+        await asyncio.sleep(0.02)
+        followers = [asyncio.ensure_future(async_client.get("/api/projects")) for _ in range(5)]
+        await asyncio.sleep(0.02)
+        first.cancel()
+
+        responses = await asyncio.gather(*followers)
+
+        assert {response.status_code for response in responses} == {200}
+        assert len(responses[0].json()) == 20
+        assert async_client.renders == ["list"]
+
+    async def test_render_finishing_after_reseed_is_not_cached(self, async_client, monkeypatch):
+        """Test a render that straddles a database swap is served but not cached."""
+        generations = iter([1, 2])
+        monkeypatch.setattr(projects_router, "database_generation", lambda: next(generations))
+
+        response = await async_client.get("/api/projects")
+
+        assert response.status_code == 200
+        assert response_cache.get(projects_router.PROJECT_LIST_KEY) is None
@@ -0,0 +1,185 @@
+"""Tests for the memory-mapped catalog snapshot."""
+
+import gzip
+import json
+import mmap
+
+import brotli
+import msgpack
+import pytest
+
+from app.formats import MSGPACK
+from app.routers.projects import PROJECT_DETAIL_KEY, PROJECT_LIST_KEY, render_project_list
+from app.snapshot import (
+    CatalogSnapshot,
+    SnapshotReader,
+    build_snapshot,
+    read_generation,
+    write_snapshot,
+)
+from benchmarks.catalog import populate_catalog
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "catalog.snapshot")
+
+
+def test_build_snapshot_round_trip(test_session, snapshot_path):
+    """Test every payload and compressed variant reads back from the mapping."""
+    populate_catalog(test_session, 12)
+    assert build_snapshot(test_session, snapshot_path) == 1
+
+    snapshot = CatalogSnapshot(snapshot_path)
+    assert len(snapshot) == 13
+    assert snapshot.generation == 1
+
+    payload = snapshot.payload(PROJECT_LIST_KEY)
+    assert bytes(payload.body) == render_project_list(test_session)
+    assert brotli.decompress(payload.encoded("br")) == bytes(payload.body)
+    assert gzip.decompress(payload.encoded("gzip")) == bytes(payload.body)
+
+    detail = snapshot.payload(PROJECT_DETAIL_KEY.format(slug="project-00004"))
+    assert json.loads(bytes(detail.body))["slug"] == "project-00004"
+    assert snapshot.payload(PROJECT_DETAIL_KEY.format(slug="missing")) is None
+
+
+def test_payloads_are_zero_copy_slices(snapshot_path):
+    """Test payload bodies are memoryviews over the shared mapping, not copies."""
+    write_snapshot(snapshot_path, {"small": b"{}", "large": b"[" + b"1," * 600 + b"1]"})
+    snapshot = CatalogSnapshot(snapshot_path)
+
+    for key in ("small", "large"):
+        body = snapshot.payload(key).body
+        assert isinstance(body, memoryview)
+        assert isinstance(body.obj, mmap.mmap)
+
+    # Bodies below the compression threshold store no variants
+    assert not snapshot.payload("small").has_encoding("br")
+    assert snapshot.payload("large").has_encoding("br")
+
+
+def test_swap_increments_generation_and_keeps_old_views(snapshot_path):
+    """Test an atomic swap is picked up while in-flight payloads stay readable."""
+    write_snapshot(snapshot_path, {"key": b"first"})
+    reader = SnapshotReader(snapshot_path, refresh_interval=0)
+    old = reader.current()
+    old_body = old.payload("key").body
+
+    assert write_snapshot(snapshot_path, {"key": b"second"}) == 2
+    assert read_generation(snapshot_path) == 2
+
+    new = reader.current()
+    assert new is not old
+    assert new.generation == 2
+    assert bytes(new.payload("key").body) == b"second"
+    assert bytes(old_body) == b"first"
+
+
+def test_reader_without_file(snapshot_path):
+    """Test a missing snapshot disables snapshot serving."""
+    assert SnapshotReader(snapshot_path, refresh_interval=0).current() is None
+    assert read_generation(snapshot_path) == 0
+
+
+def test_rejects_foreign_file(snapshot_path):
+    """Test a file without the snapshot header is refused."""
+    with open(snapshot_path, "wb") as f:
+        f.write(b"\0" * 64)
+    with pytest.raises(ValueError):
+        CatalogSnapshot(snapshot_path)
+
+
+def test_rewrite_in_place_is_detected_by_generation(snapshot_path):
+    """Test a new generation is remapped even when the file keeps its inode."""
+    write_snapshot(snapshot_path, {"key": b"first"})
+    reader = SnapshotReader(snapshot_path, refresh_interval=0)
+    assert bytes(reader.current().payload("key").body) == b"first"
+
+    replacement = snapshot_path + ".new"
+    write_snapshot(replacement, {"key": b"second"})
+    write_snapshot(replacement, {"key": b"second"})
+    with open(replacement, "rb") as source, open(snapshot_path, "r+b") as target:
+        target.write(source.read())
+
+    assert reader.current().generation == 2
+    assert bytes(reader.current().payload("key").body) == b"second"
+
+
+def test_corrupt_swap_keeps_previous_mapping(snapshot_path, caplog):
+    """Test a truncated new snapshot is logged and the old one keeps serving."""
+    write_snapshot(snapshot_path, {"key": b"first"})
+    reader = SnapshotReader(snapshot_path, refresh_interval=0)
+    previous = reader.current()
+
+    write_snapshot(snapshot_path, {"key": b"second" * 100})
+    with open(snapshot_path, "r+b") as f:
+        f.truncate(64)
+
+    assert reader.current() is previous
+    assert reader.current() is previous
+    assert [record.levelname for record in caplog.records] == ["ERROR"]
+    assert "keeping generation 1" in caplog.text
+
+
+def test_corrupt_first_snapshot_falls_back_to_database(
+    client, test_session, snapshot_path, monkeypatch
+):
+    """Test endpoints render from the database when no snapshot can be mapped."""
+    populate_catalog(test_session, 3)
+    with open(snapshot_path, "wb") as f:
+        f.write(b"PFCAT")
+    monkeypatch.setattr(
+        "app.routers.projects.catalog_snapshot", SnapshotReader(snapshot_path, refresh_interval=0)
+    )
+
+    response = client.get("/api/projects")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+
+class TestSnapshotEndpoints:
+    """Tests for the project endpoints served from a snapshot."""
+
+    @pytest.fixture(autouse=True)
+    def snapshot(self, monkeypatch, test_session, snapshot_path):
+        populate_catalog(test_session, 10)
+        build_snapshot(test_session, snapshot_path)
+        monkeypatch.setattr(
+            "app.routers.projects.catalog_snapshot",
+            SnapshotReader(snapshot_path, refresh_interval=0),
+        )
+
+    def test_endpoints_skip_database(self, client, assert_queries):
+        """Test list and detail responses come from the mapping without SQL."""
+        with assert_queries(statements=0):
+            listing = client.get("/api/projects", headers={"Accept-Encoding": "br"})
+            detail = client.get("/api/projects/project-00003")
+
+        assert listing.status_code == 200
+        assert listing.headers["content-encoding"] == "br"
+        assert len(listing.json()) == 10
+        assert detail.json()["slug"] == "project-00003"
+
+    def test_unknown_slug_falls_back_to_database(self, client):
+        """Test slugs missing from the snapshot still get the regular 404."""
+        response = client.get("/api/projects/nope")
+        assert response.status_code == 404
+
+
+def test_swap_replaces_converted_formats(client, snapshot_path, monkeypatch):
+    """Test MessagePack converted from one snapshot is not served after a swap."""
+    monkeypatch.setattr(
+        "app.routers.projects.catalog_snapshot", SnapshotReader(snapshot_path, refresh_interval=0)
+    )
+    write_snapshot(snapshot_path, {PROJECT_LIST_KEY: b'[{"v": 1}]'})
+    assert msgpack.unpackb(client.get("/api/projects", headers={"Accept": MSGPACK}).content) == [
+        {"v": 1}
+    ]
+
+    write_snapshot(snapshot_path, {PROJECT_LIST_KEY: b'[{"v": 2}]'})
+
+    assert client.get("/api/projects").json() == [{"v": 2}]
+    response = client.get("/api/projects", headers={"Accept": MSGPACK})
+    assert msgpack.unpackb(response.content) == [{"v": 2}]
@@ -0,0 +1,53 @@
+"""Startup regression tests: import-time budget and time to first healthy response."""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.harness import BACKEND_DIR
+from benchmarks.startup import measure_import_time, measure_time_to_healthy, startup_environment
+
+# Budgets are generous for shared CI runners; tighten locally via the environment
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+FIRST_HEALTHY_BUDGET_MS = float(os.getenv("FIRST_HEALTHY_BUDGET_MS", "8000"))
+
+# Heavy modules only needed by optional code paths; importing app.main must not load them.
+# A feature that adds a dependency imported on first use lists it here.
+LAZY_MODULES = [
+    "benchmarks",  # benchmark harness
+    "httpx",  # benchmark and test clients
+    "uvicorn",  # server entry points
+    "numpy",  # related-project similarity, seeder only
+    "PIL",  # on-demand image variants
+    "msgpack",  # MessagePack responses
+    "cbor2",  # CBOR responses
+]
+
+
+def test_import_time_budget():
+    """Test importing app.main stays within the import-time budget."""
+    result = measure_import_time("app.main")
+
+    assert result["total_ms"] < IMPORT_TIME_BUDGET_MS, json.dumps(result, indent=2)
+
+
+def test_optional_modules_are_imported_lazily():
+    """Test app.main does not eagerly import modules only optional paths need."""
+    probe = (
+        "import json, sys, app.main; "
+        f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert json.loads(output) == []
+
+
+def test_prefork_server_time_to_first_healthy_response(tmp_path):
+    """Test the pre-fork server answers /api/health within the startup budget."""
+    env = startup_environment(tmp_path)
+    elapsed_ms = measure_time_to_healthy("prefork", workers=2, env=env)
+
+    assert elapsed_ms < FIRST_HEALTHY_BUDGET_MS
@@ -0,0 +1,133 @@
+"""Tests for precompressed static file serving."""
+
+import gzip
+import os
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.static import PrecompressedStaticFiles, precompress_directory
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    + '<rect width="10" height="10" fill="#123456"/>' * 200
+    + "</svg>"
+).encode()
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Create a static tree with one compressible and one binary file."""
+    project_dir = tmp_path / "projects" / "demo"
+    project_dir.mkdir(parents=True)
+    (project_dir / "logo.svg").write_bytes(SVG)
+    (project_dir / "photo.png").write_bytes(b"\x89PNG" + bytes(2048))
+    return tmp_path
+
+
+@pytest.fixture
+def static_client(static_dir):
+    """Serve ``static_dir`` through PrecompressedStaticFiles."""
+    app = FastAPI()
+    app.mount("/images", PrecompressedStaticFiles(directory=static_dir), name="images")
+    return TestClient(app)
+
+
+def test_precompress_directory_writes_siblings(static_dir):
+    """Test only compressible files get .br/.gz siblings, and reruns are no-ops."""
+    written = precompress_directory(static_dir)
+
+    logo = static_dir / "projects" / "demo" / "logo.svg"
+    assert sorted(written) == sorted([logo.with_name("logo.svg.br"), logo.with_name("logo.svg.gz")])
+    assert brotli.decompress(logo.with_name("logo.svg.br").read_bytes()) == SVG
+    assert gzip.decompress(logo.with_name("logo.svg.gz").read_bytes()) == SVG
+    assert not (static_dir / "projects" / "demo" / "photo.png.br").exists()
+
+    assert precompress_directory(static_dir) == []
+
+
+@pytest.mark.parametrize("encoding, suffix", [("br", ".br"), ("gzip", ".gz")])
+def test_serves_precompressed_variant(static_dir, static_client, encoding, suffix):
+    """Test the precompressed sibling is served with the original media type."""
+    precompress_directory(static_dir)
+    variant = static_dir / "projects" / "demo" / f"logo.svg{suffix}"
+
+    response = static_client.get(
+        "/images/projects/demo/logo.svg", headers={"Accept-Encoding": encoding}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["content-type"].startswith("image/svg+xml")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-length"] == str(variant.stat().st_size)
+    assert response.content == SVG
+
+
+def test_siblings_are_not_served_directly(static_dir, static_client):
+    """Test a direct request for a precompressed sibling is a 404, not mislabeled bytes."""
+    precompress_directory(static_dir)
+
+    response = static_client.get("/images/projects/demo/logo.svg.br")
+
+    assert response.status_code == 404
+
+
+def test_serves_identity_without_accept_encoding(static_dir, static_client):
+    """Test clients that accept no encoding get the original file."""
+    precompress_directory(static_dir)
+
+    response = static_client.get(
+        "/images/projects/demo/logo.svg", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == SVG
+
+
+def test_conditional_request_on_variant(static_dir, static_client):
+    """Test If-None-Match against the variant's ETag returns 304."""
+    precompress_directory(static_dir)
+    headers = {"Accept-Encoding": "br"}
+    first = static_client.get("/images/projects/demo/logo.svg", headers=headers)
+
+    second = static_client.get(
+        "/images/projects/demo/logo.svg",
+        headers={**headers, "If-None-Match": first.headers["etag"]},
+    )
+
+    assert second.status_code == 304
+
+
+def test_binary_files_are_not_varied(static_dir, static_client):
+    """Test non-compressible media is served untouched."""
+    response = static_client.get(
+        "/images/projects/demo/photo.png", headers={"Accept-Encoding": "br"}
+    )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_stale_variant_falls_back_to_identity(static_dir, static_client):
+    """Test a source edited after precompression is served as-is, not from old siblings."""
+    precompress_directory(static_dir)
+    logo = static_dir / "projects" / "demo" / "logo.svg"
+    variant_mtime = logo.with_name("logo.svg.br").stat().st_mtime_ns
+    edited = SVG.replace(b"#123456", b"#654321")
+    logo.write_bytes(edited)
+    os.utime(logo, ns=(variant_mtime + 10**9, variant_mtime + 10**9))
+
+    response = static_client.get(
+        "/images/projects/demo/logo.svg", headers={"Accept-Encoding": "br"}
+    )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == edited
@@ -0,0 +1,61 @@
+"""Tests for the static JSON export served by nginx."""
+
+import gzip
+
+import brotli
+from sqlalchemy import delete
+
+from app.models import Project
+from app.static_export import PRELOAD_MAP_NAME, export_catalog, nginx_string
+from benchmarks.catalog import populate_catalog
+
+
+def test_export_matches_api(test_session, client, tmp_path):
+    """Test exported files are byte-identical to the live API responses."""
+    populate_catalog(test_session, 6)
+    export_dir = tmp_path / "export"
+
+    assert export_catalog(test_session, str(export_dir)) == 7
+
+    listing = export_dir / "api" / "projects.json"
+    assert listing.read_bytes() == client.get("/api/projects").content
+    detail = export_dir / "api" / "projects" / "project-00003.json"
+    assert detail.read_bytes() == client.get("/api/projects/project-00003").content
+    assert brotli.decompress(listing.with_name("projects.json.br").read_bytes()) == (
+        listing.read_bytes()
+    )
+    assert gzip.decompress(listing.with_name("projects.json.gz").read_bytes()) == (
+        listing.read_bytes()
+    )
+
+
+def test_reexport_replaces_previous(test_session, tmp_path):
+    """Test a new export drops removed projects and leaves no build directories behind."""
+    populate_catalog(test_session, 3)
+    export_dir = tmp_path / "export"
+    export_catalog(test_session, str(export_dir))
+
+    test_session.execute(delete(Project).where(Project.slug == "project-00002"))
+    test_session.commit()
+    export_catalog(test_session, str(export_dir))
+
+    assert not (export_dir / "api" / "projects" / "project-00002.json").exists()
+    assert (export_dir / "api" / "projects" / "project-00001.json").exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["export"]
+
+
+def test_export_writes_preload_map(test_session, client, tmp_path):
+    """Test the nginx map gives each exported detail the backend's Link header."""
+    populate_catalog(test_session, 3)
+    export_dir = tmp_path / "export"
+    export_catalog(test_session, str(export_dir))
+
+    entries = (export_dir / PRELOAD_MAP_NAME).read_text().splitlines()[1:]
+    assert len(entries) == 3
+    link = client.get("/api/projects/project-00002").headers["link"]
+    assert f'"/api/projects/project-00002.json" "{link}";' in entries
+
+
+def test_nginx_string_has_no_variables():
+    """Test map values cannot be read by nginx as escapes or variable references."""
+    assert nginx_string('/a "b"\\$c') == '"/a \\"b\\"\\\\%24c"'
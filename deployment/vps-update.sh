@@ -24,6 +24,10 @@ cd /var/www/matt-hulme.com/backend
 source .venv/bin/activate
 python scripts/seed_db.py
 echo -e "${GREEN}✅ Database re-seeded with cleaned descriptions${NC}"
+python scripts/precompress_static.py
+echo -e "${GREEN}✅ Static assets precompressed${NC}"
+python scripts/export_static.py
+echo -e "${GREEN}✅ API exported for nginx${NC}"
 echo ""
 
 # Step 3: Rebuild frontend
@@ -37,7 +41,21 @@ echo ""
 # Step 4: Restart backend
 echo -e "${BLUE}🔄 Step 4: Restarting backend service...${NC}"
 sudo systemctl restart portfolio-backend
-echo -e "${GREEN}✅ Backend restarted${NC}"
+# Wait until the backend serves warm (GET /api/ready). Workers only accept
+# connections once warm (or after STARTUP_WARMUP_TIMEOUT), so a worker that is
+# still starting takes no traffic; a 503 means one gave up waiting while cold.
+for _ in $(seq 1 30); do
+    if curl -sf http://127.0.0.1:8000/api/ready > /dev/null; then
+        break
+    fi
+    sleep 1
+done
+if curl -sf http://127.0.0.1:8000/api/ready; then
+    echo ""
+    echo -e "${GREEN}✅ Backend restarted and warm${NC}"
+else
+    echo -e "${YELLOW}⚠ Backend not ready after 30s${NC}"
+fi
 echo ""
 
 # Step 5: Restart Nginx